@@ -9,6 +9,8 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from .config import AchievementConditionConfig, AchievementConfig, EconomyConfig
     from .database import EconomyDatabase
 
@@ -31,33 +33,41 @@ class AchievementEngine:
 
         # Pre-index achievements by condition type for efficient lookup
         self._by_condition_type: dict[str, list[AchievementConfig]] = {}
-        for ach in config.achievements:
-            ctype = ach.condition.type
-            self._by_condition_type.setdefault(ctype, []).append(ach)
+        self._index_achievements(config.achievements)
 
-    # ── Condition type → evaluator method name ───────────────
+    # ── Condition type → metric name (see EconomyDatabase.get_achievement_metrics) ──
 
     _CONDITION_MAP: dict[str, str] = {
-        "lifetime_messages": "_eval_lifetime_messages",
-        "lifetime_presence_hours": "_eval_lifetime_presence_hours",
-        "daily_streak": "_eval_daily_streak",
-        "unique_tip_recipients": "_eval_unique_tip_recipients",
-        "unique_tip_senders": "_eval_unique_tip_senders",
-        "lifetime_earned": "_eval_lifetime_earned",
-        "lifetime_spent": "_eval_lifetime_spent",
-        "lifetime_gambled": "_eval_lifetime_gambled",
-        "gambling_biggest_win": "_eval_gambling_biggest_win",
-        "rank_reached": "_eval_rank_reached",
-        "unique_emotes_used_lifetime": "_eval_unique_emotes",
+        "lifetime_messages": "lifetime_messages",
+        "lifetime_presence_hours": "lifetime_presence_hours",
+        "daily_streak": "daily_streak",
+        "unique_tip_recipients": "unique_tip_recipients",
+        "unique_tip_senders": "unique_tip_senders",
+        "lifetime_earned": "lifetime_earned",
+        "lifetime_spent": "lifetime_spent",
+        "lifetime_gambled": "lifetime_gambled",
+        "gambling_biggest_win": "gambling_biggest_win",
+        "rank_reached": "lifetime_earned",
+        "unique_emotes_used_lifetime": "unique_emotes_used_lifetime",
     }
 
     def update_config(self, new_config) -> None:
         """Hot-swap the config reference. Re-index condition map."""
         self._config = new_config
-        self._by_condition_type = {}
-        for ach in new_config.achievements:
+        self._index_achievements(new_config.achievements)
+
+    def _index_achievements(self, achievements: list[AchievementConfig]) -> None:
+        """Group achievements by condition type, dropping (and warning once about) unknown types."""
+        by_type: dict[str, list[AchievementConfig]] = {}
+        for ach in achievements:
             ctype = ach.condition.type
-            self._by_condition_type.setdefault(ctype, []).append(ach)
+            if ctype not in self._CONDITION_MAP:
+                self._logger.warning(
+                    "Unknown achievement condition type: %s (achievement %s)", ctype, ach.id
+                )
+                continue
+            by_type.setdefault(ctype, []).append(ach)
+        self._by_condition_type = by_type
 
     # ══════════════════════════════════════════════════════════
     #  Public API
@@ -73,39 +83,9 @@ class AchievementEngine:
 
         Returns list of newly awarded achievements.
         """
-        awarded: list[AchievementConfig] = []
-        types_to_check = relevant_types or list(self._by_condition_type.keys())
-
-        for ctype in types_to_check:
-            for ach in self._by_condition_type.get(ctype, []):
-                # Skip if already earned
-                if await self._db.has_achievement(username, channel, ach.id):
-                    continue
-
-                # Evaluate condition
-                if await self._evaluate_condition(username, channel, ach.condition):
-                    newly = await self._db.award_achievement(username, channel, ach.id)
-                    if newly:
-                        # Credit reward
-                        if ach.reward > 0:
-                            await self._db.credit(
-                                username,
-                                channel,
-                                ach.reward,
-                                tx_type="achievement",
-                                trigger_id=f"achievement.{ach.id}",
-                                reason=f"Achievement: {ach.description}",
-                            )
-                        awarded.append(ach)
-                        if self._metrics:
-                            self._metrics.record_achievement()
-                        self._logger.info(
-                            "Achievement awarded: %s → %s (+%d Z) in %s",
-                            username,
-                            ach.id,
-                            ach.reward,
-                            channel,
-                        )
+        awarded = [
+            ach async for ach in self.iter_new_achievements(username, channel, relevant_types)
+        ]
 
         # Notify for each awarded achievement
         for ach in awarded:
@@ -113,142 +93,87 @@ class AchievementEngine:
 
         return awarded
 
-    # ══════════════════════════════════════════════════════════
-    #  Condition Dispatch
-    # ══════════════════════════════════════════════════════════
-
-    async def _evaluate_condition(
+    async def iter_new_achievements(
         self,
         username: str,
         channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        """Evaluate a single achievement condition."""
-        evaluator_name = self._CONDITION_MAP.get(condition.type)
-        if not evaluator_name:
-            self._logger.warning("Unknown achievement condition type: %s", condition.type)
-            return False
-        evaluator = getattr(self, evaluator_name)
-        return await evaluator(username, channel, condition)
+        relevant_types: list[str] | None = None,
+    ) -> AsyncIterator[AchievementConfig]:
+        """Award and yield newly earned achievements one at a time.
+
+        Each is yielded once its award and reward are committed, so callers may
+        stop early. Notifications are left to the caller.
+        """
+        by_type = self._by_condition_type
+        types_to_check = [t for t in dict.fromkeys(relevant_types or by_type) if t in by_type]
+        if not types_to_check:
+            return
+
+        # Skip anything already earned
+        held = await self._db.get_awarded_achievement_ids(username, channel)
+        candidates = [
+            ach for ctype in types_to_check for ach in by_type[ctype] if ach.id not in held
+        ]
+        if not candidates:
+            return
+
+        # One query for every metric the candidates need
+        metrics = await self._db.get_achievement_metrics(
+            username,
+            channel,
+            {self._CONDITION_MAP[ach.condition.type] for ach in candidates},
+        )
+
+        for ach in candidates:
+            if not self._evaluate_condition(ach.condition, metrics):
+                continue
+            newly = await self._db.award_achievement(username, channel, ach.id)
+            if not newly:
+                continue
+            # Credit reward
+            if ach.reward > 0:
+                await self._db.credit(
+                    username,
+                    channel,
+                    ach.reward,
+                    tx_type="achievement",
+                    trigger_id=f"achievement.{ach.id}",
+                    reason=f"Achievement: {ach.description}",
+                )
+            if self._metrics:
+                self._metrics.record_achievement()
+            self._logger.info(
+                "Achievement awarded: %s → %s (+%d Z) in %s",
+                username,
+                ach.id,
+                ach.reward,
+                channel,
+            )
+            yield ach
 
     # ══════════════════════════════════════════════════════════
-    #  Condition Evaluators
+    #  Condition Dispatch
     # ══════════════════════════════════════════════════════════
 
-    async def _eval_lifetime_messages(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        total = await self._db.get_lifetime_messages(username, channel)
-        return total >= condition.threshold
-
-    async def _eval_lifetime_presence_hours(
+    def _evaluate_condition(
         self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        hours = await self._db.get_lifetime_presence_hours(username, channel)
-        return hours >= condition.threshold
-
-    async def _eval_daily_streak(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        streak = await self._db.get_or_create_streak(username, channel)
-        return streak.get("current_daily_streak", 0) >= condition.threshold
-
-    async def _eval_unique_tip_recipients(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        count = await self._db.get_unique_tip_recipients(username, channel)
-        return count >= condition.threshold
-
-    async def _eval_unique_tip_senders(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        count = await self._db.get_unique_tip_senders(username, channel)
-        return count >= condition.threshold
-
-    async def _eval_lifetime_earned(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        earned = await self._db.get_lifetime_earned(username, channel)
-        return earned >= condition.threshold
-
-    async def _eval_lifetime_spent(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        account = await self._db.get_account(username, channel)
-        if not account:
-            return False
-        return account.get("lifetime_spent", 0) >= condition.threshold
-
-    async def _eval_lifetime_gambled(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        total = await self._db.get_lifetime_gambled(username, channel)
-        return total >= condition.threshold
-
-    async def _eval_gambling_biggest_win(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        biggest = await self._db.get_biggest_gambling_win(username, channel)
-        return biggest >= condition.threshold
-
-    async def _eval_rank_reached(
-        self,
-        username: str,
-        channel: str,
-        condition: AchievementConditionConfig,
-    ) -> bool:
-        """Check if user has reached a specific rank tier index."""
-        account = await self._db.get_account(username, channel)
-        if not account:
-            return False
-        current_tier = self._get_rank_tier_index(account)
-        return current_tier >= condition.threshold
-
-    async def _eval_unique_emotes(
-        self,
-        username: str,
-        channel: str,
         condition: AchievementConditionConfig,
+        metrics: dict[str, float],
     ) -> bool:
-        account = await self._db.get_account(username, channel)
-        if not account:
+        """Compare a condition's threshold against the pre-fetched metrics."""
+        value = metrics.get(self._CONDITION_MAP[condition.type])
+        if value is None:
             return False
-        return account.get("unique_emotes_used", 0) >= condition.threshold
+        if condition.type == "rank_reached":
+            value = self._get_rank_tier_index(value)
+        return value >= condition.threshold
 
     # ══════════════════════════════════════════════════════════
     #  Helpers
     # ══════════════════════════════════════════════════════════
 
-    def _get_rank_tier_index(self, account: dict) -> int:
+    def _get_rank_tier_index(self, lifetime: float) -> int:
         """0-based tier index for a user's lifetime earnings."""
-        lifetime = account.get("lifetime_earned", 0)
         tier_index = 0
         for i, tier in enumerate(self._config.ranks.tiers):
             if lifetime >= tier.min_lifetime_earned:
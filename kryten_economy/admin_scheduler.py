@@ -83,20 +83,20 @@ class AdminScheduler:
 
     async def _capture_snapshot(self, channel: str) -> None:
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        totals = await self._db.get_daily_totals(channel, today)
+        overview = await self._db.get_economy_overview(channel, today)
         present_count = len(self._presence.get_present_users(channel))
 
         data = {
-            "total_accounts": await self._db.get_all_accounts_count(channel),
-            "total_z_circulation": await self._db.get_total_circulation(channel),
-            "active_economy_users_today": await self._db.get_active_economy_users_today(
-                channel, today
+            "total_accounts": overview["accounts"],
+            "total_z_circulation": overview["circulation"],
+            "active_economy_users_today": overview["active_today"],
+            "z_earned_today": overview["z_earned"],
+            "z_spent_today": overview["z_spent"],
+            "z_gambled_net_today": overview["z_gambled_out"] - overview["z_gambled_in"],
+            "median_balance": overview["median_balance"],
+            "participation_rate": (
+                overview["accounts"] / present_count * 100 if present_count > 0 else 0.0
             ),
-            "z_earned_today": totals.get("z_earned", 0),
-            "z_spent_today": totals.get("z_spent", 0),
-            "z_gambled_net_today": totals.get("z_gambled_out", 0) - totals.get("z_gambled_in", 0),
-            "median_balance": await self._db.get_median_balance(channel),
-            "participation_rate": await self._db.get_participation_rate(channel, present_count),
         }
 
         # Sprint 10: include inflation multiplier in snapshot
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .config import EconomyConfig
     from .database import EconomyDatabase
 
@@ -23,6 +25,7 @@ class BountyManager:
         database: EconomyDatabase,
         client: object,
         logger: logging.Logger,
+        clock: Callable[[], datetime] | None = None,
     ) -> None:
         self._config = config.bounties
         self._full_config = config
@@ -30,6 +33,8 @@ class BountyManager:
         self._client = client
         self._logger = logger
         self._metrics = None  # Wired by EconomyApp after construction
+        # Source of "now" for expiry stamping and sweeps; injectable for tests
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
 
     def update_config(self, new_config) -> None:
         """Hot-swap the config reference."""
@@ -97,9 +102,7 @@ class BountyManager:
             return {"success": False, "bounty_id": 0, "message": "Insufficient funds."}
 
         # Calculate expiry
-        expires_at = (
-            datetime.now(timezone.utc) + timedelta(hours=cfg.default_expiry_hours)
-        ).isoformat()
+        expires_at = (self._clock() + timedelta(hours=cfg.default_expiry_hours)).isoformat()
 
         bounty_id = await self._db.create_bounty(
             creator,
@@ -192,7 +195,7 @@ class BountyManager:
 
         Called periodically by scheduler. Returns count of expired bounties.
         """
-        expired = await self._db.expire_bounties(channel)
+        expired = await self._db.expire_bounties(channel, self._clock())
         refund_pct = self._config.expiry_refund_percent
 
         for bounty in expired:
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from .config import EconomyConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaInfo:
     """Currently playing media item."""
 
@@ -0,0 +1,119 @@
+"""Chat outbox — per-channel outbound PM/chat queues paced by a token bucket.
+
+Bulk senders (rain, scheduled-event presence bonuses) hand messages to the
+outbox and return immediately; a worker per channel delivers them at the
+configured rate so server-side rate limits never stall the scheduler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import OutboxConfig
+
+
+class ChatOutbox:
+    """Fire-and-forget PM/chat delivery with one token bucket per channel."""
+
+    def __init__(
+        self,
+        config: OutboxConfig,
+        client: object,
+        logger: logging.Logger,
+    ) -> None:
+        self._client = client
+        self._logger = logger
+        self._rate = config.max_per_second
+        self._burst = config.burst
+
+        # channel → queue of (username or None for public chat, message)
+        self._queues: dict[str, asyncio.Queue[tuple[str | None, str]]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    # ── Public API ───────────────────────────────────────────
+
+    def queue_pm(self, channel: str, username: str, message: str) -> None:
+        """Queue a PM for paced delivery."""
+        self._queue_for(channel).put_nowait((username, message))
+
+    def queue_chat(self, channel: str, message: str) -> None:
+        """Queue a public chat message for paced delivery."""
+        self._queue_for(channel).put_nowait((None, message))
+
+    async def join(self) -> None:
+        """Wait until every queued message has been delivered."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def stop(self) -> None:
+        """Stop all workers; each sends the message it holds and drops the rest."""
+        for task in self._workers.values():
+            task.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._workers.clear()
+
+    # ── Internal ─────────────────────────────────────────────
+
+    def _queue_for(self, channel: str) -> asyncio.Queue[tuple[str | None, str]]:
+        """Return the channel's queue, starting its worker on first use."""
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = self._queues[channel] = asyncio.Queue()
+        task = self._workers.get(channel)
+        if task is None or task.done():
+            self._workers[channel] = asyncio.create_task(self._worker(channel, queue))
+        return queue
+
+    async def _deliver(self, channel: str, username: str | None, message: str) -> None:
+        """Send one message, logging (not raising) failures."""
+        try:
+            if username is None:
+                await self._client.send_chat(channel, message)
+            else:
+                await self._client.send_pm(channel, username, message)
+        except Exception:
+            self._logger.warning(
+                "Outbox send failed in %s (to %s)", channel, username or "chat", exc_info=True
+            )
+
+    async def _worker(self, channel: str, queue: asyncio.Queue[tuple[str | None, str]]) -> None:
+        """Deliver a channel's queue, spending one token per message."""
+        tokens = float(self._burst)
+        last = time.monotonic()
+        held: tuple[str | None, str] | None = None  # dequeued but not yet sent
+        try:
+            while True:
+                held = await queue.get()
+                now = time.monotonic()
+                tokens = min(float(self._burst), tokens + (now - last) * self._rate)
+                last = now
+                if tokens < 1.0:
+                    await asyncio.sleep((1.0 - tokens) / self._rate)
+                    tokens = 1.0
+                    last = time.monotonic()
+                tokens -= 1.0
+                username, message = held
+                held = None
+                try:
+                    await self._deliver(channel, username, message)
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            # Send only the held item; bursting the backlog would trip the rate limit
+            if held is not None:
+                await self._deliver(channel, *held)
+                queue.task_done()
+            dropped = 0
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+                dropped += 1
+            if dropped:
+                self._logger.warning(
+                    "Outbox stopped in %s with %d undelivered message(s) dropped", channel, dropped
+                )
+            raise
@@ -43,14 +43,13 @@ def _is_blackout_active(windows: list, now_utc: "datetime") -> bool:
         return False  # croniter not installed — blackout disabled
 
     for win in windows:
-        cron_expr = (
-            getattr(win, "cron", None) or win.get("cron") if isinstance(win, dict) else win.cron
-        )
-        duration_h = (
-            getattr(win, "duration_hours", None) or win.get("duration_hours")
-            if isinstance(win, dict)
-            else win.duration_hours
-        )
+        if not isinstance(win, dict):
+            # BlackoutWindowConfig keeps its parsed cron between calls
+            if win.is_active(now_utc):
+                return True
+            continue
+        cron_expr = win.get("cron")
+        duration_h = win.get("duration_hours")
         if not cron_expr or not duration_h:
             continue
         it = croniter(cron_expr, now_utc)
@@ -1392,6 +1391,8 @@ class CommandHandler:
 
         await self._app.db.get_or_create_account(username, channel)
         await self._app.db.update_account_rank(username, channel, rank_name)
+        if self._app.rank_engine is not None:
+            self._app.rank_engine.invalidate(username, channel)
         return {
             "username": username,
             "channel": channel,
@@ -9,10 +9,13 @@ from __future__ import annotations
 
 import os
 import re
+from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
+from croniter import croniter
 from kryten import KrytenConfig
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -741,6 +744,26 @@ class BlackoutWindowConfig(BaseModel):
     cron: str
     duration_hours: int
 
+    @cached_property
+    def _croniter(self) -> croniter:
+        """Cron schedule parsed once per window; re-pointed at each lookup."""
+        return croniter(self.cron)
+
+    def prev_fire(self, now: datetime) -> datetime:
+        """Most recent window start at or before *now*."""
+        self._croniter.set_current(now, force=True)
+        return self._croniter.get_prev(datetime)
+
+    def next_fire(self, now: datetime) -> datetime:
+        """Next window start after *now*."""
+        self._croniter.set_current(now, force=True)
+        return self._croniter.get_next(datetime)
+
+    def is_active(self, now: datetime) -> bool:
+        """True if *now* falls inside the window that started most recently."""
+        start = self.prev_fire(now)
+        return start <= now < start + timedelta(hours=self.duration_hours)
+
 
 class SpendingConfig(BaseModel):
     queue_tiers: list[QueueTierConfig] = Field(
@@ -1095,6 +1118,13 @@ class CommandsConfig(BaseModel):
     rate_limit_per_minute: int = 10
 
 
+class OutboxConfig(BaseModel):
+    """Pacing for bulk PMs (rain, event presence bonuses), per channel."""
+
+    max_per_second: float = Field(default=2.0, gt=0)
+    burst: int = Field(default=5, ge=1)
+
+
 # NOTE: We do NOT define a local MetricsConfig — we reuse KrytenConfig's
 # kryten.config.MetricsConfig which includes port, health_path, metrics_path.
 # The EconomyConfig.metrics field is inherited from KrytenConfig.
@@ -1162,6 +1192,7 @@ class EconomyConfig(KrytenConfig):
 
     # Sprint 9 — Polish & Hardening
     commands: CommandsConfig = Field(default_factory=CommandsConfig)
+    outbox: OutboxConfig = Field(default_factory=OutboxConfig)
     # NOTE: metrics is inherited from KrytenConfig (kryten.config.MetricsConfig)
     #       which includes port, health_path, metrics_path
 
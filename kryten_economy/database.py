@@ -2,7 +2,11 @@
 
 Follows the kryten-userstats pattern: each public method is async and wraps
 a synchronous inner function via asyncio.run_in_executor(None, _sync).
-A new connection is created per call (WAL mode, 30s busy timeout, Row factory).
+Connections come from a small per-database LIFO pool: _get_connection()
+checks out an idle one or opens a new one (WAL mode, 30s busy timeout, Row
+factory), and the usual conn.close() in each finally block hands it back to
+the pool rather than closing it. EconomyDatabase.close() closes every idle
+pooled connection at shutdown.
 """
 
 from __future__ import annotations
@@ -10,27 +14,121 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import math
+import queue
 import sqlite3
+import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar, NamedTuple
+
+
+class SpendContext(NamedTuple):
+    """The account columns pre-spend validation needs."""
+
+    balance: int
+    banned: bool
+
+
+class _PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() hands it back to its owner's idle pool."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Set by EconomyDatabase._get_connection; None means close() really closes
+        self._pool: queue.LifoQueue[_PooledConnection] | None = None
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is not None:
+            try:
+                if self.in_transaction:
+                    self.rollback()
+                self.row_factory = sqlite3.Row
+                pool.put_nowait(self)
+                return
+            except (sqlite3.Error, queue.Full):
+                pass
+        super().close()
 
 
 class EconomyDatabase:
     """SQLite-backed persistence for the economy microservice."""
 
+    # Idle connections kept open for reuse across executor calls
+    _POOL_SIZE: int = 8
+    # Seconds a channel's cached ban list is trusted before it is re-read
+    _BAN_CACHE_TTL: float = 60.0
+
     def __init__(self, db_path: str, logger: logging.Logger | None = None) -> None:
         self._db_path = db_path
         self._logger = logger or logging.getLogger("economy.database")
+        self._pool: queue.LifoQueue[_PooledConnection] = queue.LifoQueue(self._POOL_SIZE)
+        # channel → (monotonic expiry, banned usernames); see is_banned
+        self._ban_cache: dict[str, tuple[float, frozenset[str]]] = {}
+        self._ban_generation = 0
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Create a new SQLite connection with standard settings."""
-        conn = sqlite3.connect(self._db_path, timeout=30)
+        """Check out a pooled SQLite connection; close() returns it to the pool."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        conn = self._open_connection()
+        conn._pool = self._pool
+        return conn
+
+    def _open_connection(self) -> _PooledConnection:
+        """Open a new SQLite connection with standard settings."""
+        conn = sqlite3.connect(
+            self._db_path, timeout=30, factory=_PooledConnection, check_same_thread=False
+        )
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA busy_timeout=30000")
         conn.row_factory = sqlite3.Row
         return conn
 
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            conn._pool = None
+            conn.close()
+
+    # Row-value pairs per SELECT; keeps host parameters well under SQLite's limit
+    _BULK_CHUNK: int = 400
+
+    def _select_rows_for_users(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        users: list[tuple[str, str]],
+        extra_where: str = "",
+        extra_params: tuple = (),
+        columns: str = "*",
+    ) -> dict[tuple[str, str], dict]:
+        """SELECT rows matching any (username, channel) pair, keyed by that pair.
+
+        *columns* must include ``username`` and ``channel``.
+        """
+        where = f" AND {extra_where}" if extra_where else ""
+        result: dict[tuple[str, str], dict] = {}
+        for i in range(0, len(users), self._BULK_CHUNK):
+            chunk = users[i : i + self._BULK_CHUNK]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            params: list[Any] = [v for pair in chunk for v in pair]
+            params.extend(extra_params)
+            rows = conn.execute(
+                f"SELECT {columns} FROM {table} "
+                f"WHERE (username, channel) IN (VALUES {values}){where}",
+                params,
+            ).fetchall()
+            for row in rows:
+                result[(row["username"], row["channel"])] = dict(row)
+        return result
+
     # ══════════════════════════════════════════════════════════
     #  Initialization
     # ══════════════════════════════════════════════════════════
@@ -133,6 +231,11 @@ class EconomyDatabase:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_daily_activity_date " "ON daily_activity(date)"
             )
+            # Covers the per-user lifetime message/presence sums
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_daily_activity_user_chan "
+                "ON daily_activity(username, channel, messages_sent, minutes_present)"
+            )
 
             # ── Sprint 2: Streaks & milestones tables ────────
             conn.execute(
@@ -196,6 +299,10 @@ class EconomyDatabase:
                 )
             """
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_trigger_analytics_chan_date "
+                "ON trigger_analytics(channel, date, trigger_id)"
+            )
 
             # ── Sprint 4: Gambling tables ────────────────────
             conn.execute(
@@ -311,11 +418,17 @@ class EconomyDatabase:
                 )
             """
             )
+            # Covering indexes for the unique tip recipient/sender counts; they
+            # supersede the original (sender, channel) / (receiver, channel) ones.
+            conn.execute("DROP INDEX IF EXISTS idx_tip_sender")
+            conn.execute("DROP INDEX IF EXISTS idx_tip_receiver")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_tip_sender ON tip_history(sender, channel)"
+                "CREATE INDEX IF NOT EXISTS idx_tip_sender_receiver "
+                "ON tip_history(sender, channel, receiver)"
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_tip_receiver ON tip_history(receiver, channel)"
+                "CREATE INDEX IF NOT EXISTS idx_tip_receiver_sender "
+                "ON tip_history(receiver, channel, sender)"
             )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_tip_date ON tip_history(created_at)")
 
@@ -554,6 +667,13 @@ class EconomyDatabase:
             except Exception:
                 pass  # column already exists
 
+            # Planner statistics: full ANALYZE on first open, then let SQLite
+            # refresh only what has drifted.
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+
             conn.commit()
             self._logger.info("Database tables created/verified")
         finally:
@@ -660,6 +780,46 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    async def get_balances(self, usernames: list[str], channel: str) -> dict[str, int]:
+        """Return {username: balance} for *usernames* in one query, 0 for missing accounts."""
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict[str, int]:
+            conn = self._get_connection()
+            try:
+                rows = self._select_rows_for_users(
+                    conn,
+                    "accounts",
+                    [(username, channel) for username in usernames],
+                    columns="username, channel, balance",
+                )
+            finally:
+                conn.close()
+            balances = dict.fromkeys(usernames, 0)
+            for (username, _), row in rows.items():
+                balances[username] = row["balance"]
+            return balances
+
+        return await loop.run_in_executor(None, _sync)
+
+    async def get_spend_context(self, username: str, channel: str) -> SpendContext | None:
+        """Return balance and ban flag for spend checks, or None if no account."""
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> SpendContext | None:
+            conn = self._get_connection()
+            try:
+                row = conn.execute(
+                    "SELECT balance, economy_banned FROM accounts "
+                    "WHERE username = ? AND channel = ?",
+                    (username, channel),
+                ).fetchone()
+                return SpendContext(row[0], bool(row[1])) if row else None
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def update_last_seen(self, username: str, channel: str) -> None:
         """Set last_seen to CURRENT_TIMESTAMP."""
         loop = asyncio.get_running_loop()
@@ -677,6 +837,29 @@ class EconomyDatabase:
 
         await loop.run_in_executor(None, _sync)
 
+    async def bulk_update_last_seen(self, users: list[tuple[str, str]]) -> None:
+        """Set last_seen to CURRENT_TIMESTAMP for many accounts in one transaction.
+
+        Args:
+            users: [(username, channel), ...]
+        """
+        if not users:
+            return
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> None:
+            conn = self._get_connection()
+            try:
+                conn.executemany(
+                    "UPDATE accounts SET last_seen = CURRENT_TIMESTAMP WHERE username = ? AND channel = ?",
+                    users,
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        await loop.run_in_executor(None, _sync)
+
     async def update_last_active(self, username: str, channel: str) -> None:
         """Set last_active to CURRENT_TIMESTAMP."""
         loop = asyncio.get_running_loop()
@@ -717,16 +900,16 @@ class EconomyDatabase:
         def _sync() -> int:
             conn = self._get_connection()
             try:
-                # Ensure account exists
-                conn.execute(
-                    "INSERT OR IGNORE INTO accounts (username, channel) VALUES (?, ?)",
-                    (username, channel),
-                )
-                conn.execute(
-                    "UPDATE accounts SET balance = balance + ?, lifetime_earned = lifetime_earned + ? "
-                    "WHERE username = ? AND channel = ?",
-                    (amount, amount, username, channel),
-                )
+                # Create-or-bump the account and read back the new balance in one statement
+                new_balance = conn.execute(
+                    "INSERT INTO accounts (username, channel, balance, lifetime_earned) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(username, channel) DO UPDATE SET "
+                    "balance = balance + excluded.balance, "
+                    "lifetime_earned = lifetime_earned + excluded.lifetime_earned "
+                    "RETURNING balance",
+                    (username, channel, amount, amount),
+                ).fetchone()[0]
                 conn.execute(
                     "INSERT INTO transactions (username, channel, amount, type, reason, trigger_id, "
                     "related_user, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
@@ -742,16 +925,58 @@ class EconomyDatabase:
                     ),
                 )
                 conn.commit()
-                row = conn.execute(
-                    "SELECT balance FROM accounts WHERE username = ? AND channel = ?",
-                    (username, channel),
-                ).fetchone()
-                return row["balance"]
+                return new_balance
             finally:
                 conn.close()
 
         return await loop.run_in_executor(None, _sync)
 
+    async def credit_batch(
+        self,
+        channel: str,
+        rows: list[tuple[str, int, str, str | None, str | None]],
+    ) -> None:
+        """Credit many accounts in *channel* in a single transaction.
+
+        Same effect as calling ``credit`` once per row (accounts created if
+        missing, balance and lifetime_earned bumped, transaction logged).
+
+        Args:
+            rows: [(username, amount, tx_type, trigger_id, reason), ...]
+        """
+        if not rows:
+            return
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> None:
+            conn = self._get_connection()
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO accounts (username, channel) VALUES (?, ?)",
+                    [(username, channel) for username, *_ in rows],
+                )
+                conn.executemany(
+                    "UPDATE accounts SET balance = balance + ?, lifetime_earned = lifetime_earned + ? "
+                    "WHERE username = ? AND channel = ?",
+                    [(amount, amount, username, channel) for username, amount, *_ in rows],
+                )
+                conn.executemany(
+                    "INSERT INTO transactions (username, channel, amount, type, reason, trigger_id) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (username, channel, amount, tx_type, reason, trigger_id)
+                        for username, amount, tx_type, trigger_id, reason in rows
+                    ],
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+        await loop.run_in_executor(None, _sync)
+
     async def debit(
         self,
         username: str,
@@ -1017,6 +1242,35 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    async def bulk_get_or_create_streaks(
+        self, users: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict]:
+        """Return streak rows for many users in one round-trip, creating missing ones.
+
+        Args:
+            users: [(username, channel), ...]
+
+        Returns:
+            {(username, channel): row_dict}
+        """
+        if not users:
+            return {}
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict[tuple[str, str], dict]:
+            conn = self._get_connection()
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO streaks (username, channel) VALUES (?, ?)",
+                    users,
+                )
+                conn.commit()
+                return self._select_rows_for_users(conn, "streaks", users)
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def update_streak(
         self,
         username: str,
@@ -1110,6 +1364,38 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    async def bulk_get_or_create_hourly_milestones(
+        self, users: list[tuple[str, str]], date: str
+    ) -> dict[tuple[str, str], dict]:
+        """Return *date*'s milestone rows for many users, creating missing ones.
+
+        Args:
+            users: [(username, channel), ...]
+            date: YYYY-MM-DD
+
+        Returns:
+            {(username, channel): row_dict}
+        """
+        if not users:
+            return {}
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict[tuple[str, str], dict]:
+            conn = self._get_connection()
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO hourly_milestones (username, channel, date) VALUES (?, ?, ?)",
+                    [(u, c, date) for u, c in users],
+                )
+                conn.commit()
+                return self._select_rows_for_users(
+                    conn, "hourly_milestones", users, "date = ?", (date,)
+                )
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def mark_hourly_milestone(
         self, username: str, channel: str, date: str, hours: int
     ) -> None:
@@ -1162,29 +1448,30 @@ class EconomyDatabase:
     ) -> int:
         """Apply interest to all qualifying accounts. Returns total interest paid."""
         loop = asyncio.get_running_loop()
+        # floor(balance * rate) capped per account; SET expressions see the
+        # pre-update balance, so the same expression drives all three statements.
+        amount = "MIN(CAST(balance * ? AS INTEGER), ?)"
+        where = f"channel = ? AND balance >= ? AND {amount} > 0"
+        where_params = (channel, min_balance, rate, cap)
 
         def _sync() -> int:
             conn = self._get_connection()
             try:
-                rows = conn.execute(
-                    "SELECT username, balance FROM accounts WHERE channel = ? AND balance >= ?",
-                    (channel, min_balance),
-                ).fetchall()
-                total = 0
-                for row in rows:
-                    interest = min(math.floor(row["balance"] * rate), cap)
-                    if interest > 0:
-                        conn.execute(
-                            "UPDATE accounts SET balance = balance + ?, lifetime_earned = lifetime_earned + ? "
-                            "WHERE username = ? AND channel = ?",
-                            (interest, interest, row["username"], channel),
-                        )
-                        conn.execute(
-                            "INSERT INTO transactions (username, channel, amount, type, trigger_id) "
-                            "VALUES (?, ?, ?, 'interest', 'maintenance.interest')",
-                            (row["username"], channel, interest),
-                        )
-                        total += interest
+                conn.execute(
+                    "INSERT INTO transactions (username, channel, amount, type, trigger_id) "
+                    f"SELECT username, channel, {amount}, 'interest', 'maintenance.interest' "
+                    f"FROM accounts WHERE {where}",
+                    (rate, cap, *where_params),
+                )
+                total = conn.execute(
+                    f"SELECT COALESCE(SUM({amount}), 0) FROM accounts WHERE {where}",
+                    (rate, cap, *where_params),
+                ).fetchone()[0]
+                conn.execute(
+                    f"UPDATE accounts SET balance = balance + {amount}, "
+                    f"lifetime_earned = lifetime_earned + {amount} WHERE {where}",
+                    (rate, cap, rate, cap, *where_params),
+                )
                 conn.commit()
                 return total
             finally:
@@ -1195,29 +1482,28 @@ class EconomyDatabase:
     async def apply_decay_batch(self, channel: str, rate: float, exempt_below: int) -> int:
         """Apply decay to all qualifying accounts. Returns total decay collected."""
         loop = asyncio.get_running_loop()
+        amount = "CAST(balance * ? AS INTEGER)"
+        where = f"channel = ? AND balance >= ? AND {amount} > 0"
+        where_params = (channel, exempt_below, rate)
 
         def _sync() -> int:
             conn = self._get_connection()
             try:
-                rows = conn.execute(
-                    "SELECT username, balance FROM accounts WHERE channel = ? AND balance >= ?",
-                    (channel, exempt_below),
-                ).fetchall()
-                total = 0
-                for row in rows:
-                    decay_amount = math.floor(row["balance"] * rate)
-                    if decay_amount > 0:
-                        conn.execute(
-                            "UPDATE accounts SET balance = balance - ?, lifetime_spent = lifetime_spent + ? "
-                            "WHERE username = ? AND channel = ?",
-                            (decay_amount, decay_amount, row["username"], channel),
-                        )
-                        conn.execute(
-                            "INSERT INTO transactions (username, channel, amount, type, trigger_id, reason) "
-                            "VALUES (?, ?, ?, 'decay', 'maintenance.decay', 'Vault maintenance fee')",
-                            (row["username"], channel, -decay_amount),
-                        )
-                        total += decay_amount
+                conn.execute(
+                    "INSERT INTO transactions (username, channel, amount, type, trigger_id, reason) "
+                    f"SELECT username, channel, -{amount}, 'decay', 'maintenance.decay', "
+                    f"'Vault maintenance fee' FROM accounts WHERE {where}",
+                    (rate, *where_params),
+                )
+                total = conn.execute(
+                    f"SELECT COALESCE(SUM({amount}), 0) FROM accounts WHERE {where}",
+                    (rate, *where_params),
+                ).fetchone()[0]
+                conn.execute(
+                    f"UPDATE accounts SET balance = balance - {amount}, "
+                    f"lifetime_spent = lifetime_spent + {amount} WHERE {where}",
+                    (rate, rate, *where_params),
+                )
                 conn.commit()
                 return total
             finally:
@@ -1582,6 +1868,35 @@ class EconomyDatabase:
 
         await loop.run_in_executor(None, _sync)
 
+    async def record_trigger_analytics_batch(self, rows: list[tuple[str, str, str, int]]) -> None:
+        """Record many trigger hits in a single transaction.
+
+        Same effect as calling ``record_trigger_analytics`` once per row.
+
+        Args:
+            rows: [(channel, trigger_id, date, z_awarded), ...]
+        """
+        if not rows:
+            return
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> None:
+            conn = self._get_connection()
+            try:
+                conn.executemany(
+                    "INSERT INTO trigger_analytics (channel, trigger_id, date, hit_count, unique_users, total_z_awarded) "
+                    "VALUES (?, ?, ?, 1, 1, ?) "
+                    "ON CONFLICT(channel, trigger_id, date) DO UPDATE SET "
+                    "hit_count = hit_count + 1, "
+                    "total_z_awarded = total_z_awarded + excluded.total_z_awarded",
+                    rows,
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        await loop.run_in_executor(None, _sync)
+
     # ══════════════════════════════════════════════════════════
     #  Sprint 4: Gambling Stats
     # ══════════════════════════════════════════════════════════
@@ -2420,7 +2735,7 @@ class EconomyDatabase:
         resolved_by: str,
         approved: bool,
     ) -> dict | None:
-        """Resolve an approval. Returns the approval record or None."""
+        """Resolve a pending approval. Returns the resolved record, or None if not pending."""
         loop = asyncio.get_running_loop()
         status = "approved" if approved else "rejected"
         now = datetime.now(timezone.utc).isoformat()
@@ -2428,19 +2743,15 @@ class EconomyDatabase:
         def _sync() -> dict | None:
             conn = self._get_connection()
             try:
+                # One statement: only a still-pending row matches, so a second
+                # resolver can't act on the same approval.
                 row = conn.execute(
-                    "SELECT * FROM pending_approvals WHERE id = ? AND status = 'pending'",
-                    (approval_id,),
-                ).fetchone()
-                if not row:
-                    return None
-                conn.execute(
                     "UPDATE pending_approvals SET status = ?, resolved_by = ?, resolved_at = ? "
-                    "WHERE id = ?",
+                    "WHERE id = ? AND status = 'pending' RETURNING *",
                     (status, resolved_by, now, approval_id),
-                )
+                ).fetchone()
                 conn.commit()
-                return dict(row)
+                return dict(row) if row else None
             finally:
                 conn.close()
 
@@ -2648,6 +2959,23 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    async def get_awarded_achievement_ids(self, username: str, channel: str) -> set[str]:
+        """IDs of every achievement a user already holds, in one query."""
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> set[str]:
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(
+                    "SELECT achievement_id FROM achievements WHERE username = ? AND channel = ?",
+                    (username, channel),
+                ).fetchall()
+                return {r[0] for r in rows}
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def award_achievement(self, username: str, channel: str, achievement_id: str) -> bool:
         """Award an achievement. Returns True if newly awarded, False if already held."""
         loop = asyncio.get_running_loop()
@@ -2833,6 +3161,80 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    # One (metric, value) SELECT per achievement metric, each binding (username, channel).
+    # Account-backed metrics yield no row when the account does not exist.
+    _ACHIEVEMENT_METRIC_SQL: ClassVar[dict[str, str]] = {
+        "lifetime_messages": (
+            "SELECT 'lifetime_messages', COALESCE(SUM(messages_sent), 0) "
+            "FROM daily_activity WHERE username = ? AND channel = ?"
+        ),
+        "lifetime_presence_hours": (
+            "SELECT 'lifetime_presence_hours', COALESCE(SUM(minutes_present), 0) / 60.0 "
+            "FROM daily_activity WHERE username = ? AND channel = ?"
+        ),
+        "daily_streak": (
+            "SELECT 'daily_streak', COALESCE(current_daily_streak, 0) "
+            "FROM streaks WHERE username = ? AND channel = ?"
+        ),
+        "unique_tip_recipients": (
+            "SELECT 'unique_tip_recipients', COUNT(DISTINCT receiver) "
+            "FROM tip_history WHERE sender = ? AND channel = ?"
+        ),
+        "unique_tip_senders": (
+            "SELECT 'unique_tip_senders', COUNT(DISTINCT sender) "
+            "FROM tip_history WHERE receiver = ? AND channel = ?"
+        ),
+        "lifetime_earned": (
+            "SELECT 'lifetime_earned', COALESCE(lifetime_earned, 0) "
+            "FROM accounts WHERE username = ? AND channel = ?"
+        ),
+        "lifetime_spent": (
+            "SELECT 'lifetime_spent', COALESCE(lifetime_spent, 0) "
+            "FROM accounts WHERE username = ? AND channel = ?"
+        ),
+        "lifetime_gambled": (
+            "SELECT 'lifetime_gambled', COALESCE(lifetime_gambled_in, 0) "
+            "FROM accounts WHERE username = ? AND channel = ?"
+        ),
+        "gambling_biggest_win": (
+            "SELECT 'gambling_biggest_win', COALESCE(biggest_win, 0) "
+            "FROM gambling_stats WHERE username = ? AND channel = ?"
+        ),
+        # accounts has no lifetime emote column; report 0 for existing accounts
+        "unique_emotes_used_lifetime": (
+            "SELECT 'unique_emotes_used_lifetime', 0 "
+            "FROM accounts WHERE username = ? AND channel = ?"
+        ),
+    }
+
+    async def get_achievement_metrics(
+        self, username: str, channel: str, metrics: Iterable[str]
+    ) -> dict[str, float]:
+        """Fetch several achievement metrics in one UNION ALL query.
+
+        Unknown metric names are ignored; metrics whose source row is missing are omitted.
+        """
+        selects = [
+            self._ACHIEVEMENT_METRIC_SQL[m]
+            for m in dict.fromkeys(metrics)
+            if m in self._ACHIEVEMENT_METRIC_SQL
+        ]
+        if not selects:
+            return {}
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict[str, float]:
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(
+                    " UNION ALL ".join(selects), (username, channel) * len(selects)
+                ).fetchall()
+                return {row[0]: row[1] for row in rows}
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def update_account_rank(self, username: str, channel: str, rank_name: str) -> None:
         """Update the rank_name field on an account."""
         loop = asyncio.get_running_loop()
@@ -2850,6 +3252,29 @@ class EconomyDatabase:
 
         await loop.run_in_executor(None, _sync)
 
+    async def atomic_promote(self, username: str, channel: str, new_rank: str) -> dict | None:
+        """Set rank_name if it differs; return ``{quiet_mode, lifetime_earned}`` or ``None``.
+
+        ``None`` means no row changed (no account, or already at *new_rank*).
+        """
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict | None:
+            conn = self._get_connection()
+            try:
+                row = conn.execute(
+                    "UPDATE accounts SET rank_name = ? "
+                    "WHERE username = ? AND channel = ? AND rank_name IS NOT ? "
+                    "RETURNING quiet_mode, lifetime_earned",
+                    (new_rank, username, channel, new_rank),
+                ).fetchone()
+                conn.commit()
+                return dict(row) if row else None
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     # ══════════════════════════════════════════════════════════
     #  Sprint 6: Leaderboard Queries
     # ══════════════════════════════════════════════════════════
@@ -3063,10 +3488,10 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
-    async def expire_bounties(self, channel: str) -> list[dict]:
+    async def expire_bounties(self, channel: str, now: datetime | None = None) -> list[dict]:
         """Find and expire all open bounties past expires_at. Returns expired bounties."""
         loop = asyncio.get_running_loop()
-        now = datetime.now(timezone.utc).isoformat()
+        now_iso = (now or datetime.now(timezone.utc)).isoformat()
 
         def _sync() -> list[dict]:
             conn = self._get_connection()
@@ -3074,7 +3499,7 @@ class EconomyDatabase:
                 rows = conn.execute(
                     "SELECT * FROM bounties WHERE channel = ? AND status = 'open' "
                     "AND expires_at IS NOT NULL AND expires_at < ?",
-                    (channel, now),
+                    (channel, now_iso),
                 ).fetchall()
                 expired = [dict(r) for r in rows]
                 if expired:
@@ -3082,7 +3507,7 @@ class EconomyDatabase:
                         "UPDATE bounties SET status = 'expired' "
                         "WHERE channel = ? AND status = 'open' "
                         "AND expires_at IS NOT NULL AND expires_at < ?",
-                        (channel, now),
+                        (channel, now_iso),
                     )
                     conn.commit()
                 return expired
@@ -3368,7 +3793,10 @@ class EconomyDatabase:
             finally:
                 conn.close()
 
-        return await loop.run_in_executor(None, _sync)
+        try:
+            return await loop.run_in_executor(None, _sync)
+        finally:
+            self._invalidate_ban_cache(channel)
 
     async def unban_user(self, username: str, channel: str) -> bool:
         """Remove economy ban. Returns True if was banned."""
@@ -3386,25 +3814,47 @@ class EconomyDatabase:
             finally:
                 conn.close()
 
-        return await loop.run_in_executor(None, _sync)
+        try:
+            return await loop.run_in_executor(None, _sync)
+        finally:
+            self._invalidate_ban_cache(channel)
 
     async def is_banned(self, username: str, channel: str) -> bool:
-        """Check if a user is banned from the economy."""
+        """Check if a user is banned from the economy.
+
+        Served from a per-channel ban list, re-read after ban/unban or once
+        ``_BAN_CACHE_TTL`` has passed (picks up writes from other processes).
+        """
+        cached = self._ban_cache.get(channel)
+        if cached is None or time.monotonic() >= cached[0]:
+            generation = self._ban_generation
+            cached = (time.monotonic() + self._BAN_CACHE_TTL, await self._load_banned(channel))
+            if generation == self._ban_generation:
+                self._ban_cache[channel] = cached
+        return username in cached[1]
+
+    async def _load_banned(self, channel: str) -> frozenset[str]:
+        """All usernames banned in a channel."""
         loop = asyncio.get_running_loop()
 
-        def _sync() -> bool:
+        def _sync() -> frozenset[str]:
             conn = self._get_connection()
             try:
-                row = conn.execute(
-                    "SELECT 1 FROM banned_users WHERE username = ? AND channel = ?",
-                    (username, channel),
-                ).fetchone()
-                return row is not None
+                rows = conn.execute(
+                    "SELECT username FROM banned_users WHERE channel = ?",
+                    (channel,),
+                ).fetchall()
+                return frozenset(row[0] for row in rows)
             finally:
                 conn.close()
 
         return await loop.run_in_executor(None, _sync)
 
+    def _invalidate_ban_cache(self, channel: str) -> None:
+        """Drop a channel's cached ban list, discarding any load already in flight."""
+        self._ban_generation += 1
+        self._ban_cache.pop(channel, None)
+
     # ══════════════════════════════════════════════════════════
     #  Sprint 8: Aggregate Queries for Reporting
     # ══════════════════════════════════════════════════════════
@@ -3481,6 +3931,47 @@ class EconomyDatabase:
 
         return await loop.run_in_executor(None, _sync)
 
+    async def get_economy_overview(self, channel: str, date: str) -> dict:
+        """Account count, circulation, median balance, active users and *date*'s totals.
+
+        One statement covering get_all_accounts_count, get_total_circulation,
+        get_median_balance, get_active_economy_users_today and get_daily_totals.
+        """
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict:
+            conn = self._get_connection()
+            try:
+                row = conn.execute(
+                    "WITH bals AS (SELECT balance FROM accounts WHERE channel = ?), "
+                    "acct AS (SELECT COUNT(*) AS n, COALESCE(SUM(balance), 0) AS circ FROM bals) "
+                    "SELECT acct.n AS accounts, acct.circ AS circulation, "
+                    # Middle one (odd count) or two (even count) balances
+                    "(SELECT COALESCE(SUM(balance), 0) FROM ("
+                    "  SELECT balance FROM bals ORDER BY balance "
+                    "  LIMIT 2 - (SELECT n FROM acct) % 2 "
+                    "  OFFSET ((SELECT n FROM acct) - 1) / 2"
+                    ")) AS median_sum, "
+                    "day.* FROM acct, ("
+                    "  SELECT COALESCE(SUM(z_earned > 0 OR z_spent > 0), 0) AS active_today, "
+                    "  COALESCE(SUM(z_earned), 0) AS z_earned, "
+                    "  COALESCE(SUM(z_spent), 0) AS z_spent, "
+                    "  COALESCE(SUM(z_gambled_in), 0) AS z_gambled_in, "
+                    "  COALESCE(SUM(z_gambled_out), 0) AS z_gambled_out "
+                    "  FROM daily_activity WHERE channel = ? AND date = ?"
+                    ") AS day",
+                    (channel, channel, date),
+                ).fetchone()
+                overview = dict(row)
+                n = overview["accounts"]
+                median_sum = overview.pop("median_sum")
+                overview["median_balance"] = median_sum // (2 - n % 2) if n else 0
+                return overview
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     async def get_weekly_totals(
         self,
         channel: str,
@@ -3739,6 +4230,75 @@ class EconomyDatabase:
 
         await loop.run_in_executor(None, _sync)
 
+    async def bulk_presence_tick(
+        self,
+        users: list[tuple[str, str]],
+        amount: int,
+        date: str,
+        metadata: str | None = None,
+    ) -> dict[tuple[str, str], int]:
+        """Apply one presence tick for many users in a single transaction.
+
+        When *amount* > 0 each user is credited (``earn`` / ``presence.base``)
+        and gets one minute plus *amount* added to *date*'s daily_activity.
+        ``last_seen`` is stamped for every user regardless.
+
+        Args:
+            users: [(username, channel), ...]
+
+        Returns:
+            ``{(username, channel): lifetime_earned}`` after the tick, for
+            users that have an account.
+        """
+        if not users:
+            return {}
+        loop = asyncio.get_running_loop()
+
+        def _sync() -> dict[tuple[str, str], int]:
+            conn = self._get_connection()
+            try:
+                if amount > 0:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO accounts (username, channel) VALUES (?, ?)",
+                        users,
+                    )
+                    conn.executemany(
+                        "UPDATE accounts SET balance = balance + ?, "
+                        "lifetime_earned = lifetime_earned + ? "
+                        "WHERE username = ? AND channel = ?",
+                        [(amount, amount, u, c) for u, c in users],
+                    )
+                    conn.executemany(
+                        "INSERT INTO transactions "
+                        "(username, channel, amount, type, reason, trigger_id, metadata) "
+                        "VALUES (?, ?, ?, 'earn', 'Presence', 'presence.base', ?)",
+                        [(u, c, amount, metadata) for u, c in users],
+                    )
+                    conn.executemany(
+                        "INSERT INTO daily_activity (username, channel, date, minutes_present, z_earned) "
+                        "VALUES (?, ?, ?, 1, ?) "
+                        "ON CONFLICT(username, channel, date) DO UPDATE "
+                        "SET minutes_present = minutes_present + 1, "
+                        "z_earned = z_earned + excluded.z_earned",
+                        [(u, c, date, amount) for u, c in users],
+                    )
+                conn.executemany(
+                    "UPDATE accounts SET last_seen = CURRENT_TIMESTAMP WHERE username = ? AND channel = ?",
+                    users,
+                )
+                rows = self._select_rows_for_users(
+                    conn, "accounts", users, columns="username, channel, lifetime_earned"
+                )
+                conn.commit()
+                return {key: row["lifetime_earned"] for key, row in rows.items()}
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+        return await loop.run_in_executor(None, _sync)
+
     # ══════════════════════════════════════════════════════════
     #  Sprint 11: Account Pruner
     # ══════════════════════════════════════════════════════════
@@ -17,6 +17,7 @@ from . import __version__
 from .achievement_engine import AchievementEngine
 from .bounty_manager import BountyManager
 from .channel_state import ChannelStateTracker
+from .chat_outbox import ChatOutbox
 from .command_handler import CommandHandler
 from .competition_engine import CompetitionEngine
 from .config import EconomyConfig, load_config
@@ -76,6 +77,7 @@ class EconomyApp:
         self.scheduler: Scheduler | None = None
         self.admin_scheduler: AdminScheduler | None = None
         self.event_announcer: EventAnnouncer | None = None
+        self.chat_outbox: ChatOutbox | None = None
         self.greeting_handler: GreetingHandler | None = None
 
         # State
@@ -701,6 +703,7 @@ class EconomyApp:
         await self.presence_tracker.start()
 
         # 11. Start scheduler (Sprint 2: rain, maintenance; Sprint 4: challenges, heists)
+        self.chat_outbox = ChatOutbox(self.config.outbox, self.client, self.logger)
         self.scheduler = Scheduler(
             config=self.config,
             database=self.db,
@@ -713,6 +716,7 @@ class EconomyApp:
             trivia_engine=self.trivia_engine,
             blackjack_engine=self.blackjack_engine,
             spectacle_manager=self.spectacle_manager,
+            chat_outbox=self.chat_outbox,
         )
         self.scheduler._metrics = self.metrics
         await self.scheduler.start()
@@ -726,6 +730,7 @@ class EconomyApp:
             database=self.db,
             client=self.client,
             logger=self.logger,
+            chat_outbox=self.chat_outbox,
         )
         await self.scheduled_event_manager.start(channels)
 
@@ -782,6 +787,8 @@ class EconomyApp:
             await self.scheduled_event_manager.stop()
         if self.scheduler:
             await self.scheduler.stop()
+        if self.chat_outbox:
+            await self.chat_outbox.stop()
         if self.presence_tracker:
             await self.presence_tracker.stop()
         if self.metrics_server:
@@ -795,6 +802,8 @@ class EconomyApp:
             await self.media_client.stop()
         if self.client:
             await self.client.stop()
+        if self.db:
+            self.db.close()
 
         self.logger.info("kryten-economy stopped.")
 
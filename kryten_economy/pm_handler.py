@@ -11,11 +11,10 @@ import hashlib
 import logging
 import re
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Callable, Awaitable
 
-from croniter import croniter
-
 from . import __version__
 from .database import EconomyDatabase
 from .gambling_engine import GambleOutcome
@@ -41,6 +40,18 @@ if TYPE_CHECKING:
     from .trivia_engine import TriviaEngine
 
 
+@dataclass(slots=True)
+class PendingConfirm:
+    """A priced queue request waiting for the user's YES."""
+
+    item: dict
+    cost: int
+    discount: float
+    rank_tier: int
+    queue_type: str
+    channel: str
+
+
 # ══════════════════════════════════════════════════════════
 #  Sprint 9: PM Rate Limiter
 # ══════════════════════════════════════════════════════════
@@ -133,8 +144,8 @@ class PmHandler:
         self._daily_fortune_used: set[str] = set()
 
         # Win-announcement throttle: per-channel tracker
-        # key = channel, value = (last_announce_utc, biggest_payout_today, today_date_str)
-        self._win_announce_tracker: dict[str, tuple[datetime, int, str]] = {}
+        # key = channel, value = (last_announce_utc, biggest_payout_today, today_ordinal)
+        self._win_announce_tracker: dict[str, tuple[datetime, int, int]] = {}
 
         # Sprint 9: PM rate limiter
         self._rate_limiter = PmRateLimiter(
@@ -153,7 +164,7 @@ class PmHandler:
         # Per-user search results cache (for number-selection flow)
         self._last_search: dict[str, list[dict]] = {}  # user_lower → results
         # Per-user pending queue confirmation (for YES/NO flow)
-        self._pending_confirm: dict[str, dict] = {}  # user_lower → {item, cost, ...}
+        self._pending_confirm: dict[str, PendingConfirm] = {}  # user_lower → pending
         # Per-channel pending paid queue UIDs (FIFO after current item)
         self._paid_queue_pending: dict[str, list[int]] = {}
 
@@ -248,9 +259,10 @@ class PmHandler:
             return
 
         # Ignore messages from ignored users and self
-        if username.lower() in self._ignored_users:
+        ukey = username.lower()
+        if ukey in self._ignored_users:
             return
-        if username.lower() == self._bot_username_lower:
+        if ukey == self._bot_username_lower:
             return
 
         text = event.message.strip()
@@ -263,7 +275,6 @@ class PmHandler:
             return
 
         # ── Intercept YES/NO for pending queue confirmations ──
-        ukey = username.lower()
         if ukey in self._pending_confirm:
             answer = text.strip().upper()
             if answer == "YES":
@@ -561,7 +572,7 @@ class PmHandler:
         - Resets daily.
         """
         now = datetime.now(timezone.utc)
-        today = now.strftime("%Y-%m-%d")
+        today = now.toordinal()
         tracker = self._win_announce_tracker.get(channel)
 
         if tracker is None or tracker[2] != today:
@@ -1111,9 +1122,9 @@ class PmHandler:
 
         for win in windows:
             try:
-                prev_fire = croniter(win.cron, now_utc).get_prev(datetime)
+                prev_fire = win.prev_fire(now_utc)
                 end_time = prev_fire + timedelta(hours=win.duration_hours)
-                next_fire = croniter(win.cron, now_utc).get_next(datetime)
+                next_fire = win.next_fire(now_utc)
 
                 if state["next_start"] is None or next_fire < state["next_start"]:
                     state["next_name"] = win.name
@@ -1292,14 +1303,14 @@ class PmHandler:
 
         # Stash pending confirmation
         ukey = username.lower()
-        self._pending_confirm[ukey] = {
-            "item": item,
-            "cost": final_cost,
-            "discount": discount,
-            "rank_tier": rank_tier,
-            "queue_type": queue_type,
-            "channel": channel,
-        }
+        self._pending_confirm[ukey] = PendingConfirm(
+            item=item,
+            cost=final_cost,
+            discount=discount,
+            rank_tier=rank_tier,
+            queue_type=queue_type,
+            channel=channel,
+        )
 
         action_label = {
             "queue": "Queue",
@@ -1422,15 +1433,15 @@ class PmHandler:
         self,
         username: str,
         channel: str,
-        pending: dict,
+        pending: PendingConfirm,
     ) -> str:
         """Execute a queue after YES confirmation."""
         assert self._media is not None
         assert self._spending is not None
 
-        item = pending["item"]
-        final_cost = pending["cost"]
-        queue_type = pending["queue_type"]
+        item = pending.item
+        final_cost = pending.cost
+        queue_type = pending.queue_type
 
         if queue_type != "forcenow":
             block_msg = self._get_queue_block_message(channel)
@@ -2915,6 +2926,8 @@ class PmHandler:
 
         await self._db.get_or_create_account(target, channel)
         await self._db.update_account_rank(target, channel, rank_name)
+        if self._rank_engine:
+            self._rank_engine.invalidate(target, channel)
         await self._send_pm(
             channel,
             target,
@@ -2975,26 +2988,23 @@ class PmHandler:
     async def _cmd_econ_stats(self, username: str, channel: str, args: list[str]) -> str:
         """Admin: Economy overview."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        totals = await self._db.get_daily_totals(channel, today)
-        accounts = await self._db.get_all_accounts_count(channel)
-        circulation = await self._db.get_total_circulation(channel)
-        active = await self._db.get_active_economy_users_today(channel, today)
+        overview = await self._db.get_economy_overview(channel, today)
         present = len(self._presence_tracker.get_present_users(channel))
 
         return (
             f"📊 Economy Overview:\n"
             f"{'━' * 15}\n"
-            f"Accounts: {accounts:,}\n"
+            f"Accounts: {overview['accounts']:,}\n"
             f"Present: {present}\n"
-            f"Active today: {active}\n"
-            f"Circulation: {circulation:,} Z\n"
+            f"Active today: {overview['active_today']}\n"
+            f"Circulation: {overview['circulation']:,} Z\n"
             f"{'━' * 15}\n"
             f"Today:\n"
-            f"  +{totals.get('z_earned', 0):,} earned\n"
-            f"  −{totals.get('z_spent', 0):,} spent\n"
-            f"  Gamble in: {totals.get('z_gambled_in', 0):,}\n"
-            f"  Gamble out: {totals.get('z_gambled_out', 0):,}\n"
-            f"  Net: {totals.get('z_gambled_out', 0) - totals.get('z_gambled_in', 0):+,} Z"
+            f"  +{overview['z_earned']:,} earned\n"
+            f"  −{overview['z_spent']:,} spent\n"
+            f"  Gamble in: {overview['z_gambled_in']:,}\n"
+            f"  Gamble out: {overview['z_gambled_out']:,}\n"
+            f"  Net: {overview['z_gambled_out'] - overview['z_gambled_in']:+,} Z"
         )
 
     async def _cmd_econ_user(self, username: str, channel: str, args: list[str]) -> str:
@@ -3037,15 +3047,15 @@ class PmHandler:
     async def _cmd_econ_health(self, username: str, channel: str, args: list[str]) -> str:
         """Admin: Inflation indicators and economy health."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        circulation = await self._db.get_total_circulation(channel)
-        median = await self._db.get_median_balance(channel)
-        totals = await self._db.get_daily_totals(channel, today)
-        accounts = await self._db.get_all_accounts_count(channel)
+        overview = await self._db.get_economy_overview(channel, today)
+        circulation = overview["circulation"]
+        median = overview["median_balance"]
+        accounts = overview["accounts"]
         present = len(self._presence_tracker.get_present_users(channel))
 
-        earned = totals.get("z_earned", 0)
-        spent = totals.get("z_spent", 0)
-        gamble_net = totals.get("z_gambled_out", 0) - totals.get("z_gambled_in", 0)
+        earned = overview["z_earned"]
+        spent = overview["z_spent"]
+        gamble_net = overview["z_gambled_out"] - overview["z_gambled_in"]
         net_flow = earned - spent + gamble_net
 
         participation = (accounts / present * 100) if present > 0 else 0
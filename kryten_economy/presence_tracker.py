@@ -7,10 +7,13 @@ and (Sprint 2) streaks, hourly milestones, night watch, welcome wallet/back.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from .config import (
@@ -21,13 +24,17 @@ from .config import (
     StreaksConfig,
 )
 from .database import EconomyDatabase
-from .utils import now_utc, parse_timestamp
+from .utils import now_utc, parse_timestamp, today_str
 
 if TYPE_CHECKING:
     from .channel_state import ChannelStateTracker
 
+# A join parses the same raw last_seen twice (debounce check, then
+# welcome-back); parsed datetimes are immutable, so memoize the parse.
+_parse_last_seen = functools.lru_cache(maxsize=256)(parse_timestamp)
 
-@dataclass
+
+@dataclass(slots=True)
 class UserSession:
     """Tracks a single user's current connection state."""
 
@@ -35,12 +42,11 @@ class UserSession:
     channel: str
     connected_at: datetime
     last_tick_at: datetime
+    current_date: str  # UTC YYYY-MM-DD the daily counters belong to
     is_afk: bool = False
     cumulative_minutes_today: int = 0
     is_genuine_arrival: bool = False
-    _current_date: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    )
+    username_lower: str = ""
     _streak_checked_today: bool = False
 
 
@@ -74,13 +80,45 @@ class PresenceTracker:
         # Active sessions: {(username_lower, channel): UserSession}
         self._sessions: dict[tuple[str, str], UserSession] = {}
         # Departure timestamps for debounce: {(username_lower, channel): datetime}
-        self._last_departure: dict[tuple[str, str], datetime] = {}
+        # Kept in departure order so the tick can expire stale entries from the front.
+        self._last_departure: OrderedDict[tuple[str, str], datetime] = OrderedDict()
         # Normalized ignored-user set for O(1) lookup
         self._ignored_users: set[str] = {u.lower() for u in config.ignored_users}
+        self._bot_username_lower: str = config.bot.username.lower()
+        # Bounded {username: interned lowercase} cache for raw names from events
+        self._lower_cache: dict[str, str] = {}
 
-        # CyTube rank tracking: {(channel, username_lower): rank}
+        # CyTube rank tracking: {(username_lower, channel): rank} — same key
+        # layout as _sessions so one tuple serves both lookups
         self._user_ranks: dict[tuple[str, str], int] = {}
 
+        # Reusable per-tick snapshot of sessions (avoids a fresh list each tick)
+        self._tick_buffer: list[UserSession] = []
+
+        # Fire-and-forget trigger PMs: one drain task per user, so sends
+        # overlap across users but stay ordered (and capped) per user.
+        self._pm_queues: dict[tuple[str, str], list[str]] = {}
+        self._pm_tasks: set[asyncio.Task] = set()
+
+        # Which optional tick sections are live under the current config
+        self._has_night_watch = False
+        self._first_milestone_minutes: int | None = None
+        self._streak_min_minutes: int | None = None
+        self._has_bridge = False
+        self._refresh_tick_features()
+
+        # Calendar strings derived from "today", recomputed only on day change
+        self._today_str: str = ""
+        self._today_date: datetime = datetime.min
+        self._yesterday_str: str = ""
+        self._today_iso_week: str = ""
+        self._roll_date(today_str())
+
+        # Bridge state for the current ISO week:
+        # {(username_lower, channel): (weekend_seen, weekday_seen, claimed)}
+        self._bridge_week: str = ""
+        self._bridge_cache: dict[tuple[str, str], tuple[bool, bool, bool]] = {}
+
         # Periodic tick task handle
         self._tick_task: asyncio.Task | None = None
         self._running = False
@@ -94,10 +132,12 @@ class PresenceTracker:
 
     async def handle_user_join(self, username: str, channel: str) -> bool:
         """Process adduser event. Returns True if genuine arrival."""
-        if self._is_ignored(username):
+        ul = self._lower(username)
+        if self._is_ignored_lower(ul):
             return False
 
-        key = (username.lower(), channel)
+        channel = sys.intern(channel)
+        key = (ul, channel)
 
         # If session already exists, don't update connected_at (handles duplicate adduser)
         if key in self._sessions:
@@ -105,6 +145,7 @@ class PresenceTracker:
 
         genuine = await self._is_genuine_arrival(username, channel)
         now = now_utc()
+        today = now.strftime("%Y-%m-%d")
 
         if genuine:
             session = UserSession(
@@ -112,7 +153,9 @@ class PresenceTracker:
                 channel=channel,
                 connected_at=now,
                 last_tick_at=now,
+                current_date=today,
                 is_genuine_arrival=True,
+                username_lower=ul,
             )
             self._sessions[key] = session
 
@@ -124,7 +167,6 @@ class PresenceTracker:
             await self._db.update_last_seen(username, channel)
 
             # ── Restore cumulative minutes from DB (survives restart) ──
-            today = now.strftime("%Y-%m-%d")
             restored = await self._db.get_daily_minutes_present(username, channel, today)
             if restored > 0:
                 session.cumulative_minutes_today = restored
@@ -146,12 +188,14 @@ class PresenceTracker:
                         )
 
             # ── Welcome-back bonus (Sprint 2: returning users) ──
-            elif self._retention_config.welcome_back.enabled:
-                last_seen = parse_timestamp(account.get("last_seen"))
+            # Only this path needs last_seen as a datetime; parse it lazily.
+            elif self._retention_config.welcome_back.enabled and account.get("last_seen"):
+                welcome_back = self._retention_config.welcome_back
+                last_seen = _parse_last_seen(account["last_seen"])
                 if last_seen:
                     days_absent = (now - last_seen).days
-                    if days_absent >= self._retention_config.welcome_back.days_absent:
-                        bonus = self._retention_config.welcome_back.bonus
+                    if days_absent >= welcome_back.days_absent:
+                        bonus = welcome_back.bonus
                         await self._db.credit(
                             username,
                             channel,
@@ -160,7 +204,7 @@ class PresenceTracker:
                             trigger_id="retention.welcome_back",
                             reason=f"Welcome back ({days_absent} days absent)",
                         )
-                        msg = self._retention_config.welcome_back.message.format(
+                        msg = welcome_back.message.format(
                             amount=bonus,
                             currency=self._currency_name,
                         )
@@ -174,15 +218,16 @@ class PresenceTracker:
             # Use original connection time if available
             departure_time = self._last_departure.get(key)
             connected_at = departure_time if departure_time else now
-            today = now.strftime("%Y-%m-%d")
             restored = await self._db.get_daily_minutes_present(username, channel, today)
             session = UserSession(
                 username=username,
                 channel=channel,
                 connected_at=connected_at,
                 last_tick_at=now,
+                current_date=today,
                 is_genuine_arrival=False,
                 cumulative_minutes_today=restored,
+                username_lower=ul,
             )
             self._sessions[key] = session
             self._logger.debug(
@@ -195,15 +240,17 @@ class PresenceTracker:
 
     async def handle_user_leave(self, username: str, channel: str) -> None:
         """Process userleave event."""
-        if self._is_ignored(username):
+        ul = self._lower(username)
+        if self._is_ignored_lower(ul):
             return
 
-        key = (username.lower(), channel)
+        key = (ul, channel)
         if key not in self._sessions:
             return
 
         now = now_utc()
         self._last_departure[key] = now
+        self._last_departure.move_to_end(key)
 
         # Schedule deferred cleanup after debounce window
         debounce_seconds = self._presence_config.join_debounce_minutes * 60
@@ -223,7 +270,7 @@ class PresenceTracker:
 
     def is_connected(self, username: str, channel: str) -> bool:
         """Check if a specific user is currently connected."""
-        return (username.lower(), channel) in self._sessions
+        return (self._lower(username), channel) in self._sessions
 
     def get_present_users(self, channel: str) -> list[str]:
         """Return list of currently connected usernames for channel."""
@@ -231,12 +278,16 @@ class PresenceTracker:
 
     def update_user_rank(self, channel: str, username: str, rank: int) -> None:
         """Track the latest known CyTube rank for a user."""
-        self._user_ranks[(channel, username.lower())] = rank
+        self._user_ranks[(self._lower(username), sys.intern(channel))] = rank
 
     def get_admin_users(self, channel: str, min_rank: int) -> list[str]:
         """Get present users with CyTube rank >= min_rank."""
-        present = self.get_connected_users(channel)
-        return [u for u in present if self._user_ranks.get((channel, u.lower()), 0) >= min_rank]
+        ranks = self._user_ranks
+        return [
+            session.username
+            for key, session in self._sessions.items()
+            if key[1] == channel and ranks.get(key, 0) >= min_rank
+        ]
 
     def update_config(self, new_config: EconomyConfig) -> None:
         """Hot-swap the config reference."""
@@ -248,6 +299,8 @@ class PresenceTracker:
         self._currency_name = new_config.currency.name
         self._currency_symbol = new_config.currency.symbol
         self._ignored_users = {u.lower() for u in new_config.ignored_users}
+        self._bot_username_lower = new_config.bot.username.lower()
+        self._refresh_tick_features()
 
     def was_absent_longer_than(self, username: str, channel: str, minutes: int) -> bool:
         """Return True if the user was absent for at least *minutes* minutes.
@@ -257,7 +310,7 @@ class PresenceTracker:
 
         Returns True if no departure record exists (truly new or long gone).
         """
-        key = (username.lower(), channel)
+        key = (self._lower(username), channel)
         departure_time = self._last_departure.get(key)
         if departure_time is None:
             return True  # No record → treat as long absence
@@ -287,16 +340,20 @@ class PresenceTracker:
             Number of users seeded.
         """
         count = 0
+        channel = sys.intern(channel)
         now = now_utc()
         today = now.strftime("%Y-%m-%d")
         streak_cfg = self._streak_config.daily
 
         for user_data in users:
             username = user_data.get("name", "")
-            if not username or self._is_ignored(username):
+            if not username:
+                continue
+            ul = self._lower(username)
+            if self._is_ignored_lower(ul):
                 continue
 
-            key = (username.lower(), channel)
+            key = (ul, channel)
             if key in self._sessions:
                 continue
 
@@ -320,13 +377,15 @@ class PresenceTracker:
                 channel=channel,
                 connected_at=now,
                 last_tick_at=now,
+                current_date=today,
                 is_afk=is_afk,
                 is_genuine_arrival=False,  # suppress arrival bonuses
                 cumulative_minutes_today=restored_minutes,
+                username_lower=ul,
                 _streak_checked_today=streak_already_done,
             )
             self._sessions[key] = session
-            self.update_user_rank(channel, username, rank)
+            self._user_ranks[key] = rank
 
             # Ensure economy account exists (no welcome wallet)
             await self._db.get_or_create_account(username, channel)
@@ -352,12 +411,15 @@ class PresenceTracker:
                 pass
             self._tick_task = None
 
+        await self._drain_pm_tasks()
+
         # Final last_seen update for all active sessions
-        for (_username_lower, channel), session in list(self._sessions.items()):
-            try:
-                await self._db.update_last_seen(session.username, channel)
-            except Exception:
-                pass
+        try:
+            await self._db.bulk_update_last_seen(
+                [(session.username, session.channel) for session in self._sessions.values()]
+            )
+        except Exception:
+            self._logger.exception("Failed to update last_seen on shutdown")
         self._sessions.clear()
         self._logger.info("Presence tracker stopped")
 
@@ -365,14 +427,25 @@ class PresenceTracker:
     #  Internal: Ignored Users
     # ══════════════════════════════════════════════════════════
 
+    _LOWER_CACHE_SIZE: int = 1024
+
+    def _lower(self, username: str) -> str:
+        """Return the interned lowercase form of *username*, cached."""
+        ul = self._lower_cache.get(username)
+        if ul is None:
+            if len(self._lower_cache) >= self._LOWER_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._lower_cache[next(iter(self._lower_cache))]
+            ul = self._lower_cache[username] = sys.intern(username.lower())
+        return ul
+
     def _is_ignored(self, username: str) -> bool:
-        lower = username.lower()
-        if lower in self._ignored_users:
-            return True
+        return self._is_ignored_lower(self._lower(username))
+
+    def _is_ignored_lower(self, ul: str) -> bool:
+        """Fast path for callers that already hold the lowercase name."""
         # Never track the bot itself — avoids PM-to-self errors
-        if lower == self._config.bot.username.lower():
-            return True
-        return False
+        return ul in self._ignored_users or ul == self._bot_username_lower
 
     # ══════════════════════════════════════════════════════════
     #  Internal: Join Debounce
@@ -380,7 +453,7 @@ class PresenceTracker:
 
     async def _is_genuine_arrival(self, username: str, channel: str) -> bool:
         """Return True if this join represents a user who was genuinely absent."""
-        key = (username.lower(), channel)
+        key = (self._lower(username), channel)
         threshold = timedelta(minutes=self._presence_config.join_debounce_minutes)
 
         # Check in-memory first (fast path)
@@ -393,7 +466,7 @@ class PresenceTracker:
         # Fallback: check DB last_seen (for service restarts)
         account = await self._db.get_account(username, channel)
         if account and account.get("last_seen"):
-            last_seen = parse_timestamp(account["last_seen"])
+            last_seen = _parse_last_seen(account["last_seen"])
             if last_seen and now_utc() - last_seen < threshold:
                 return False  # likely a bounce around service restart
 
@@ -401,7 +474,7 @@ class PresenceTracker:
 
     async def _finalize_departure(self, username: str, channel: str) -> None:
         """Finalize departure after debounce window expires."""
-        key = (username.lower(), channel)
+        key = (self._lower(username), channel)
         session = self._sessions.get(key)
         departure = self._last_departure.get(key)
 
@@ -419,115 +492,220 @@ class PresenceTracker:
 
         # Clean up departure record
         self._last_departure.pop(key, None)
+        # Keep the rank pre-filter bounded to present users; the account may
+        # also be pruned or edited out-of-process while they are away.
+        if self._rank_engine and key not in self._sessions:
+            self._rank_engine.invalidate(session.username if session else username, channel)
+
+    def _expire_departures(self, now: datetime) -> None:
+        """Drop departure records too old to affect debounce or greetings.
+
+        Records normally go away in ``_finalize_departure`` or on rejoin; this
+        bounds the map if either is missed. Oldest entries sit at the front.
+        """
+        departures = self._last_departure
+        if not departures:
+            return
+        cfg = self._presence_config
+        horizon = max(2 * cfg.join_debounce_minutes, cfg.greeting_absence_minutes)
+        cutoff = now - timedelta(minutes=horizon)
+        while departures and next(iter(departures.values())) < cutoff:
+            departures.popitem(last=False)
 
     # ══════════════════════════════════════════════════════════
     #  Internal: Presence Tick
     # ══════════════════════════════════════════════════════════
 
+    def _refresh_tick_features(self) -> None:
+        """Resolve which optional tick sections the current config enables."""
+        presence = self._presence_config
+        self._has_night_watch = presence.night_watch.enabled
+        milestones = presence.hourly_milestones
+        self._first_milestone_minutes = min(milestones) * 60 if milestones else None
+        daily = self._streak_config.daily
+        self._streak_min_minutes = daily.min_presence_minutes if daily.enabled else None
+        self._has_bridge = self._streak_config.weekend_weekday_bridge.enabled
+
+    def _roll_date(self, today: str) -> None:
+        """Refresh the cached date strings when *today* changes."""
+        if today == self._today_str:
+            return
+        today_date = datetime.strptime(today, "%Y-%m-%d")
+        self._today_str = today
+        self._today_date = today_date
+        self._yesterday_str = (today_date - timedelta(days=1)).strftime("%Y-%m-%d")
+        self._today_iso_week = today_date.strftime("%G-W%V")
+
     async def _presence_tick(self) -> None:
         """Award presence Z to all connected users. Runs every 60 seconds."""
         while self._running:
             await asyncio.sleep(60)
             if not self._running:
                 break
+            await self._run_tick(now_utc())
 
-            now = now_utc()
-            today = now.strftime("%Y-%m-%d")
-            current_hour = now.hour
+    async def _run_tick(self, now: datetime) -> None:
+        """Run one presence tick over a snapshot of the connected sessions.
 
-            for key, session in list(self._sessions.items()):
-                username, channel = session.username, session.channel
+        All presence writes for the tick go to the DB as one batch; an
+        in-memory pass then decides who is due a milestone or streak check,
+        their rows are fetched in one query per table, and a final pass runs
+        the evaluators and rank checks against the prefetched rows.
+        """
+        today = now.strftime("%Y-%m-%d")
+        current_hour = now.hour
 
-                try:
-                    # ── 0. Calendar day reset (Sprint 2) ────────
-                    if session._current_date != today:
-                        session.cumulative_minutes_today = 0
-                        session._current_date = today
-                        session._streak_checked_today = False
-
-                    # ── 1. Base presence earning ─────────────────
-                    amount = self._presence_config.base_rate_per_minute
-
-                    # ── 2. Night watch multiplier (Sprint 2) ─────
-                    metadata: dict = {}
-                    nw = self._presence_config.night_watch
-                    if nw.enabled and current_hour in nw.hours:
-                        amount = int(amount * nw.multiplier)
-                        metadata["multiplier"] = "night_watch"
-                        metadata["factor"] = nw.multiplier
-
-                    # ── 3. Credit presence Z ─────────────────────
-                    if amount > 0:
-                        await self._db.credit(
-                            username,
-                            channel,
-                            amount,
-                            tx_type="earn",
-                            reason="Presence",
-                            trigger_id="presence.base",
-                            metadata=json.dumps(metadata) if metadata else None,
-                        )
-                        await self._db.increment_daily_minutes_present(username, channel, today)
-                        await self._db.increment_daily_z_earned(username, channel, today, amount)
+        self._roll_date(today)
+        self._expire_departures(now)
 
-                    # ── 4. Update session tracking ───────────────
-                    session.cumulative_minutes_today += 1
-                    session.last_tick_at = now
-                    await self._db.update_last_seen(username, channel)
+        # Snapshot into the reusable buffer: departures finalized while
+        # the tick awaits DB I/O must not mutate the dict mid-iteration.
+        buffer = self._tick_buffer
+        buffer.clear()
+        buffer.extend(self._sessions.values())
+        if not buffer:
+            return
 
-                    # ── 5. Hourly dwell milestones (Sprint 2) ────
-                    await self._check_hourly_milestones(
-                        username, channel, today, session.cumulative_minutes_today
-                    )
+        # Per-tick constants: the earn amount and night-watch metadata are
+        # the same for every user, and disabled sections drop out here.
+        amount = self._presence_config.base_rate_per_minute
+        metadata_json: str | None = None
+        nw = self._presence_config.night_watch
+        if self._has_night_watch and current_hour in nw.hours:
+            amount = int(amount * nw.multiplier)
+            metadata_json = json.dumps({"multiplier": "night_watch", "factor": nw.multiplier})
 
-                    # ── 6. Daily streak check (Sprint 2) ─────────
-                    streak_cfg = self._streak_config.daily
-                    if (
-                        streak_cfg.enabled
-                        and not session._streak_checked_today
-                        and session.cumulative_minutes_today >= streak_cfg.min_presence_minutes
-                    ):
-                        session._streak_checked_today = True
-                        # Exact threshold crossing — evaluate streak once
-                        await self._evaluate_daily_streak(username, channel, today)
-                        await self._evaluate_bridge(username, channel, today)
-
-                    # Update metrics counter
-                    self.metrics_z_earned += amount
-
-                    # ── 7. Rank promotion check ──────────────────
-                    if self._rank_engine:
-                        try:
-                            await self._rank_engine.check_rank_promotion(username, channel)
-                        except Exception:
-                            self._logger.exception(
-                                "Rank check error for %s/%s",
-                                username,
-                                channel,
-                            )
-                except Exception:
-                    self._logger.exception("Presence tick error for %s/%s", username, channel)
+        # ── 1-4. Credit presence Z, daily minutes, last_seen (one batch) ──
+        try:
+            lifetimes = await self._db.bulk_presence_tick(
+                [(session.username, session.channel) for session in buffer],
+                amount,
+                today,
+                metadata_json,
+            )
+        except Exception:
+            # Batch rolled back: leave sessions untouched so the DB and
+            # in-memory minute counts stay in step.
+            self._logger.exception("Presence tick batch error")
+            buffer.clear()
+            return
+        if amount > 0:
+            self.metrics_z_earned += amount * len(buffer)
+
+        first_milestone_minutes = self._first_milestone_minutes
+        streak_min_minutes = self._streak_min_minutes
+        milestone_due: list[tuple[str, str]] = []
+        streak_due: list[tuple[str, str]] = []
+
+        for session in buffer:
+            # ── 0. Calendar day reset (Sprint 2) ────────
+            if session.current_date != today:
+                session.cumulative_minutes_today = 0
+                session.current_date = today
+                session._streak_checked_today = False
+
+            # ── Update session tracking ──────────────────
+            session.cumulative_minutes_today += 1
+            session.last_tick_at = now
+            minutes = session.cumulative_minutes_today
+
+            # ── 5. Hourly dwell milestones due (Sprint 2) ─
+            if first_milestone_minutes is not None and minutes >= first_milestone_minutes:
+                milestone_due.append((session.username, session.channel))
+
+            # ── 6. Daily streak due (Sprint 2) ───────────
+            if (
+                streak_min_minutes is not None
+                and not session._streak_checked_today
+                and minutes >= streak_min_minutes
+            ):
+                # Exact threshold crossing — evaluate streak once
+                session._streak_checked_today = True
+                streak_due.append((session.username, session.channel))
+
+        # ── Prefetch milestone / streak rows for everyone due ──
+        milestone_rows: dict[tuple[str, str], dict] = {}
+        streak_rows: dict[tuple[str, str], dict] = {}
+        try:
+            milestone_rows = await self._db.bulk_get_or_create_hourly_milestones(
+                milestone_due, today
+            )
+            streak_rows = await self._db.bulk_get_or_create_streaks(streak_due)
+        except Exception:
+            # Evaluators fall back to per-user reads for anything missing
+            self._logger.exception("Presence tick prefetch error")
+
+        milestone_set = set(milestone_due)
+        streak_set = set(streak_due)
+        for session in buffer:
+            username, channel = session.username, session.channel
+            key = (username, channel)
 
-            # ── Flush any batched rank-up announcements ──────
-            if self._rank_engine:
+            try:
+                if key in milestone_set:
+                    await self._check_hourly_milestones(
+                        username,
+                        channel,
+                        today,
+                        session.cumulative_minutes_today,
+                        milestone_rows.get(key),
+                    )
+                if key in streak_set:
+                    streak = streak_rows.get(key)
+                    await self._evaluate_daily_streak(username, channel, today, streak)
+                    if self._has_bridge:
+                        await self._evaluate_bridge(username, channel, today, streak)
+            except Exception:
+                self._logger.exception("Presence tick error for %s/%s", username, channel)
+
+            # ── 7. Rank promotion check ──────────────────
+            # Skipped when the new lifetime is still below the next tier.
+            lifetime = lifetimes.get(key)
+            if self._rank_engine and (
+                lifetime is None or self._rank_engine.maybe_check(username, channel, lifetime)
+            ):
                 try:
-                    await self._rank_engine.flush_pending_announcements()
+                    await self._rank_engine.check_rank_promotion(username, channel)
                 except Exception:
-                    self._logger.exception("Rank announcement flush error")
+                    self._logger.exception(
+                        "Rank check error for %s/%s",
+                        username,
+                        channel,
+                    )
+
+        # ── Flush any batched rank-up announcements ──────
+        if self._rank_engine:
+            try:
+                await self._rank_engine.flush_pending_announcements()
+            except Exception:
+                self._logger.exception("Rank announcement flush error")
+
+        # Drop session references so finalized sessions can be collected
+        buffer.clear()
 
     # ══════════════════════════════════════════════════════════
     #  Sprint 2: Hourly Milestones
     # ══════════════════════════════════════════════════════════
 
     async def _check_hourly_milestones(
-        self, username: str, channel: str, date: str, cumulative_minutes: int
+        self,
+        username: str,
+        channel: str,
+        date: str,
+        cumulative_minutes: int,
+        row: dict | None = None,
     ) -> None:
-        """Award hourly milestones that haven't been claimed today."""
+        """Award hourly milestones that haven't been claimed today.
+
+        *row* is the prefetched ``hourly_milestones`` row for *date*; it is
+        read from the DB when not supplied.
+        """
         milestones = self._presence_config.hourly_milestones  # {hours: reward}
         for hours, reward in sorted(milestones.items()):
             threshold_minutes = hours * 60
             if cumulative_minutes >= threshold_minutes:
-                row = await self._db.get_or_create_hourly_milestones(username, channel, date)
+                if row is None:
+                    row = await self._db.get_or_create_hourly_milestones(username, channel, date)
                 col = f"hours_{hours}"
                 if not row.get(col):
                     await self._db.credit(
@@ -539,7 +717,8 @@ class PresenceTracker:
                         reason=f"{hours}-hour dwell milestone",
                     )
                     await self._db.mark_hourly_milestone(username, channel, date, hours)
-                    await self._send_trigger_pm(
+                    row[col] = 1
+                    self._queue_trigger_pm(
                         channel,
                         username,
                         f"⏰ {hours}-hour milestone! +{reward} {self._currency_symbol}. Keep it up!",
@@ -549,9 +728,15 @@ class PresenceTracker:
     #  Sprint 2: Daily Streaks
     # ══════════════════════════════════════════════════════════
 
-    async def _evaluate_daily_streak(self, username: str, channel: str, today: str) -> None:
-        """Called once per user per day when they hit min_presence_minutes."""
-        streak = await self._db.get_or_create_streak(username, channel)
+    async def _evaluate_daily_streak(
+        self, username: str, channel: str, today: str, streak: dict | None = None
+    ) -> None:
+        """Called once per user per day when they hit min_presence_minutes.
+
+        *streak* is the prefetched ``streaks`` row; read from the DB if omitted.
+        """
+        if streak is None:
+            streak = await self._db.get_or_create_streak(username, channel)
         last_date = streak.get("last_streak_date")
         current = streak.get("current_daily_streak", 0)
         longest = streak.get("longest_daily_streak", 0)
@@ -559,9 +744,8 @@ class PresenceTracker:
         if last_date == today:
             return  # Already counted today
 
-        yesterday = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
-
-        if last_date == yesterday:
+        self._roll_date(today)
+        if last_date == self._yesterday_str:
             current += 1  # Streak continues
         else:
             current = 1  # Streak resets
@@ -586,7 +770,7 @@ class PresenceTracker:
                     trigger_id=f"streak.day{current}",
                     reason=f"Day {current} streak bonus",
                 )
-                await self._send_trigger_pm(
+                self._queue_trigger_pm(
                     channel,
                     username,
                     f"🔥 Day {current} streak! +{reward} {self._currency_symbol}!",
@@ -602,7 +786,7 @@ class PresenceTracker:
                 trigger_id="streak.milestone.7",
                 reason="7-day streak milestone",
             )
-            await self._send_trigger_pm(
+            self._queue_trigger_pm(
                 channel,
                 username,
                 f"🔥🔥 7-DAY STREAK! +{cfg.milestone_7_bonus} {self._currency_symbol}! You're on fire!",
@@ -617,7 +801,7 @@ class PresenceTracker:
                 trigger_id="streak.milestone.30",
                 reason="30-day streak milestone",
             )
-            await self._send_trigger_pm(
+            self._queue_trigger_pm(
                 channel,
                 username,
                 f"🔥🔥🔥 30-DAY STREAK! +{cfg.milestone_30_bonus} {self._currency_symbol}! LEGENDARY!",
@@ -627,46 +811,62 @@ class PresenceTracker:
     #  Sprint 2: Weekend-Weekday Bridge
     # ══════════════════════════════════════════════════════════
 
-    async def _evaluate_bridge(self, username: str, channel: str, today: str) -> None:
-        """Check and award weekend→weekday bridge bonus."""
+    async def _evaluate_bridge(
+        self, username: str, channel: str, today: str, streak: dict | None = None
+    ) -> None:
+        """Check and award weekend→weekday bridge bonus.
+
+        *streak* is the prefetched ``streaks`` row, used on a weekly-cache miss.
+        """
         bridge_cfg = self._streak_config.weekend_weekday_bridge
         if not bridge_cfg.enabled:
             return
 
-        today_dt = datetime.strptime(today, "%Y-%m-%d")
-        iso_week = today_dt.strftime("%G-W%V")
-        is_weekend = today_dt.weekday() >= 5  # Sat=5, Sun=6
-
-        streak = await self._db.get_or_create_streak(username, channel)
+        self._roll_date(today)
+        iso_week = self._today_iso_week
+        is_weekend = self._today_date.weekday() >= 5  # Sat=5, Sun=6
+
+        # Weekly state only changes when a flag flips, so serve it from
+        # memory and hit the DB once per user per week.
+        if self._bridge_week != iso_week:
+            self._bridge_cache.clear()
+            self._bridge_week = iso_week
+        key = (self._lower(username), channel)
+        cached = self._bridge_cache.get(key)
+        if cached is not None:
+            weekend_seen, weekday_seen, claimed = cached
+            if claimed or (weekend_seen if is_weekend else weekday_seen):
+                return  # Nothing can change until next week
+        else:
+            if streak is None:
+                streak = await self._db.get_or_create_streak(username, channel)
 
-        # Reset if new week
-        if streak.get("week_number") != iso_week:
-            await self._db.update_bridge_fields(
-                username,
-                channel,
-                weekend_seen=False,
-                weekday_seen=False,
-                bridge_claimed=False,
-                week_number=iso_week,
-            )
-            streak["weekend_seen_this_week"] = 0
-            streak["weekday_seen_this_week"] = 0
-            streak["bridge_claimed_this_week"] = 0
+            # Reset if new week
+            if streak.get("week_number") != iso_week:
+                await self._db.update_bridge_fields(
+                    username,
+                    channel,
+                    weekend_seen=False,
+                    weekday_seen=False,
+                    bridge_claimed=False,
+                    week_number=iso_week,
+                )
+                weekend_seen = weekday_seen = claimed = False
+            else:
+                weekend_seen = bool(streak.get("weekend_seen_this_week"))
+                weekday_seen = bool(streak.get("weekday_seen_this_week"))
+                claimed = bool(streak.get("bridge_claimed_this_week"))
 
         # Update seen flags
-        if is_weekend and not streak.get("weekend_seen_this_week"):
+        if is_weekend and not weekend_seen:
             await self._db.update_bridge_fields(username, channel, weekend_seen=True)
-            streak["weekend_seen_this_week"] = 1
-        elif not is_weekend and not streak.get("weekday_seen_this_week"):
+            weekend_seen = True
+        elif not is_weekend and not weekday_seen:
             await self._db.update_bridge_fields(username, channel, weekday_seen=True)
-            streak["weekday_seen_this_week"] = 1
+            weekday_seen = True
 
         # Check for bridge
-        if (
-            streak.get("weekend_seen_this_week")
-            and streak.get("weekday_seen_this_week")
-            and not streak.get("bridge_claimed_this_week")
-        ):
+        if weekend_seen and weekday_seen and not claimed:
             bonus = bridge_cfg.bonus
             await self._db.credit(
                 username,
@@ -677,12 +877,15 @@ class PresenceTracker:
                 reason="Weekend-weekday bridge bonus",
             )
             await self._db.update_bridge_fields(username, channel, bridge_claimed=True)
-            await self._send_trigger_pm(
+            claimed = True
+            self._queue_trigger_pm(
                 channel,
                 username,
                 f"🌉 Weekend→weekday bridge bonus! +{bonus} {self._currency_symbol}!",
             )
 
+        self._bridge_cache[key] = (weekend_seen, weekday_seen, claimed)
+
     # ══════════════════════════════════════════════════════════
     #  PM Sending
     # ══════════════════════════════════════════════════════════
@@ -732,3 +935,46 @@ class PresenceTracker:
             await self._client.send_pm(channel, username, full_msg)
         except Exception:
             self._logger.debug("Failed to send trigger PM to %s: %s", username, message[:50])
+
+    _PM_QUEUE_MAX: int = 5
+
+    def _queue_trigger_pm(self, channel: str, username: str, message: str) -> None:
+        """Send a trigger PM without blocking the caller.
+
+        The first message for a user starts an eager task, which runs
+        synchronously up to its first real I/O wait; later messages for the
+        same user join that task's queue so per-user ordering is preserved.
+        Messages beyond ``_PM_QUEUE_MAX`` pending for one user are dropped.
+        """
+        if self._client is None:
+            return
+        key = (self._lower(username), channel)
+        pending = self._pm_queues.get(key)
+        if pending is not None:
+            if len(pending) >= self._PM_QUEUE_MAX:
+                self._logger.debug("PM queue full for %s, dropping: %s", username, message[:50])
+                return
+            pending.append(message)
+            return
+        self._pm_queues[key] = [message]
+        loop = asyncio.get_running_loop()
+        task = asyncio.eager_task_factory(loop, self._drain_user_pms(key, channel, username))
+        if not task.done():
+            self._pm_tasks.add(task)
+            task.add_done_callback(self._pm_tasks.discard)
+
+    async def _drain_user_pms(self, key: tuple[str, str], channel: str, username: str) -> None:
+        """Send queued trigger PMs for one user in order."""
+        queue = self._pm_queues[key]
+        try:
+            while queue:
+                await self._send_trigger_pm(channel, username, queue.pop(0))
+        except Exception:
+            self._logger.exception("Trigger PM delivery failed for %s", username)
+        finally:
+            self._pm_queues.pop(key, None)
+
+    async def _drain_pm_tasks(self) -> None:
+        """Wait for all in-flight trigger PMs to finish."""
+        while self._pm_tasks:
+            await asyncio.gather(*self._pm_tasks, return_exceptions=True)
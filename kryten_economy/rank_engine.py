@@ -5,7 +5,10 @@ Sprint 6: Achievements, Named Ranks & CyTube Promotion.
 
 from __future__ import annotations
 
+import bisect
 import logging
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -14,6 +17,15 @@ if TYPE_CHECKING:
     from .database import EconomyDatabase
 
 
+@dataclass(slots=True)
+class AnnounceThrottle:
+    """Per-channel rank-up announcement throttle state, updated in place."""
+
+    last_time: datetime
+    best_today: int  # highest tier index announced today
+    day: int  # UTC date ordinal
+
+
 class RankEngine:
     """Manages named rank progression based on lifetime earnings."""
 
@@ -31,24 +43,45 @@ class RankEngine:
         self._metrics = None  # Wired by EconomyApp after construction
 
         # Pre-sort tiers by min_lifetime_earned ascending
-        self._tiers: list[RankTierConfig] = sorted(
-            config.ranks.tiers,
-            key=lambda t: t.min_lifetime_earned,
-        )
-
-        # Buffered rank-up announcements: list of (username, channel, tier)
-        self._pending_announcements: list[tuple[str, str, RankTierConfig]] = []
-
-        # Throttle state per channel:
-        # {channel: (last_announce_utc, highest_tier_index_today, today_str)}
-        self._announce_tracker: dict[str, tuple[datetime, int, str]] = {}
+        self._tiers: list[RankTierConfig] = []
+        self._thresholds: list[int] = []
+        self._tier_index_by_name: dict[str, int] = {}
+        self._pm_text_by_tier: dict[str, str] = {}
+        # (username, channel) → lifetime at which the next tier starts. Only
+        # valid while rank_name is written by check_rank_promotion; other
+        # writers call invalidate(), and entries are dropped on departure.
+        self._next_threshold_cache: dict[tuple[str, str], int] = {}
+        self._set_tiers(config.ranks.tiers)
+
+        # Buffered rank-up announcements: {channel: {rank_name: {username, ...}}}
+        self._pending: dict[str, dict[str, set[str]]] = {}
+
+        # Throttle state per channel
+        self._announce_tracker: dict[str, AnnounceThrottle] = {}
 
     def update_config(self, new_config) -> None:
         """Hot-swap the config reference. Re-sort tiers."""
         self._config = new_config
-        self._tiers = sorted(
-            new_config.ranks.tiers,
-            key=lambda t: t.min_lifetime_earned,
+        self._set_tiers(new_config.ranks.tiers)
+
+    def _set_tiers(self, tiers: list[RankTierConfig]) -> None:
+        """Sort tiers and rebuild the lookup tables derived from them."""
+        self._tiers = sorted(tiers, key=lambda t: t.min_lifetime_earned)
+        # Parallel threshold list for bisect lookups
+        self._thresholds = [t.min_lifetime_earned for t in self._tiers]
+        self._tier_index_by_name = {t.name: i for i, t in enumerate(self._tiers)}
+        # Rank-up PM text is constant per tier; render it once
+        self._pm_text_by_tier = {t.name: self._render_rank_up_pm(t) for t in self._tiers}
+        self._next_threshold_cache.clear()
+
+    @staticmethod
+    def _render_rank_up_pm(tier: RankTierConfig) -> str:
+        """Build the rank-up PM body for a tier."""
+        perks_str = ", ".join(tier.perks) if tier.perks else "No additional perks"
+        return (
+            f"\u2b50 Rank Up! You are now a **{tier.name}**!\n"
+            f"Perks: {perks_str}\n"
+            f"(PM 'quiet' to mute notifications)"
         )
 
     # ══════════════════════════════════════════════════════════
@@ -60,10 +93,7 @@ class RankEngine:
 
         Returns ``(tier_index, RankTierConfig)``.
         """
-        tier_index = 0
-        for i, tier in enumerate(self._tiers):
-            if lifetime_earned >= tier.min_lifetime_earned:
-                tier_index = i
+        tier_index = max(bisect.bisect_right(self._thresholds, lifetime_earned) - 1, 0)
         return tier_index, self._tiers[tier_index]
 
     def get_next_tier(self, current_index: int) -> RankTierConfig | None:
@@ -72,6 +102,23 @@ class RankEngine:
             return self._tiers[current_index + 1]
         return None
 
+    def maybe_check(self, username: str, channel: str, new_lifetime: int) -> bool:
+        """Return ``False`` when *new_lifetime* can't have crossed a tier boundary.
+
+        Cheap pre-filter for :meth:`check_rank_promotion`; a ``True`` result
+        means the DB check is still needed.
+        """
+        threshold = self._next_threshold_cache.get((username, channel))
+        return threshold is None or new_lifetime >= threshold
+
+    def invalidate(self, username: str, channel: str) -> None:
+        """Forget the cached threshold so the next tick re-checks against the DB.
+
+        Call after any rank_name write outside :meth:`check_rank_promotion`,
+        and when the user's presence session ends.
+        """
+        self._next_threshold_cache.pop((username, channel), None)
+
     async def check_rank_promotion(
         self,
         username: str,
@@ -89,11 +136,19 @@ class RankEngine:
         current_rank = account.get("rank_name", "")
 
         new_index, new_tier = self.get_rank_for_lifetime(lifetime)
+        next_tier = self.get_next_tier(new_index)
+        self._next_threshold_cache[(username, channel)] = (
+            next_tier.min_lifetime_earned if next_tier else sys.maxsize
+        )
 
         if new_tier.name != current_rank:
-            # Promotion!
-            await self._db.update_account_rank(username, channel, new_tier.name)
-            await self._notify_rank_promotion(username, channel, new_tier)
+            # Promotion! The conditional UPDATE also hands back the quiet flag.
+            promoted = await self._db.atomic_promote(username, channel, new_tier.name)
+            if promoted is None:
+                return None
+            await self._notify_rank_promotion(
+                username, channel, new_tier, bool(promoted["quiet_mode"])
+            )
             if self._metrics:
                 self._metrics.record_rank_promotion()
 
@@ -118,32 +173,20 @@ class RankEngine:
         username: str,
         channel: str,
         tier: RankTierConfig,
+        quiet: bool = False,
     ) -> None:
         """PM user and buffer public announcement."""
         # Respect quiet mode
-        if not await self._db.get_quiet_mode(username, channel):
-            perks_str = ", ".join(tier.perks) if tier.perks else "No additional perks"
+        if not quiet:
+            text = self._pm_text_by_tier.get(tier.name) or self._render_rank_up_pm(tier)
             try:
-                await self._client.send_pm(
-                    channel,
-                    username,
-                    f"\u2b50 Rank Up! You are now a **{tier.name}**!\n"
-                    f"Perks: {perks_str}\n"
-                    f"(PM 'quiet' to mute notifications)",
-                )
+                await self._client.send_pm(channel, username, text)
             except Exception as e:
                 self._logger.warning("Rank-up PM failed for %s: %s", username, e)
 
         # Public announcement always buffered (regardless of quiet)
         if self._config.announcements.rank_promotion:
-            self._pending_announcements.append((username, channel, tier))
-
-    def _get_tier_index(self, tier: RankTierConfig) -> int:
-        """Return the index of a tier (higher = more prestigious)."""
-        for i, t in enumerate(self._tiers):
-            if t.name == tier.name:
-                return i
-        return 0
+            self._pending.setdefault(channel, {}).setdefault(tier.name, set()).add(username)
 
     async def flush_pending_announcements(self) -> None:
         """Announce buffered rank-ups, batched per channel with throttle.
@@ -154,54 +197,47 @@ class RankEngine:
         - Multiple users can be batched into one message.
         - Resets daily.
         """
-        if not self._pending_announcements:
+        if not self._pending:
             return
 
-        # Group by channel
-        by_channel: dict[str, list[tuple[str, RankTierConfig]]] = {}
-        for username, channel, tier in self._pending_announcements:
-            by_channel.setdefault(channel, []).append((username, tier))
-        self._pending_announcements.clear()
+        pending = self._pending
+        self._pending = {}
 
         now = datetime.now(timezone.utc)
-        today = now.strftime("%Y-%m-%d")
+        today = now.toordinal()
 
-        for channel, promotions in by_channel.items():
+        for channel, by_rank in pending.items():
             # Find the highest tier index in this batch
-            max_tier_idx = max(self._get_tier_index(t) for _, t in promotions)
+            max_tier_idx = max(self._tier_index_by_name.get(name, 0) for name in by_rank)
 
             tracker = self._announce_tracker.get(channel)
-            if tracker and tracker[2] == today:
-                last_time, best_today, _ = tracker
-                elapsed = (now - last_time).total_seconds()
+            if tracker is None:
+                self._announce_tracker[channel] = AnnounceThrottle(now, max_tier_idx, today)
+            elif tracker.day == today:
+                elapsed = (now - tracker.last_time).total_seconds()
 
                 # Skip if within cooldown AND not a new daily high
-                if elapsed < 3600 and max_tier_idx <= best_today:
+                if elapsed < 3600 and max_tier_idx <= tracker.best_today:
                     continue
 
-                new_best = max(best_today, max_tier_idx)
+                tracker.last_time = now
+                tracker.best_today = max(tracker.best_today, max_tier_idx)
             else:
                 # First of the day
-                new_best = max_tier_idx
-
-            self._announce_tracker[channel] = (now, new_best, today)
+                tracker.last_time = now
+                tracker.best_today = max_tier_idx
+                tracker.day = today
 
             # Build message
             template = self._config.announcements.templates.rank_up
-            if len(promotions) == 1:
-                user, tier = promotions[0]
-                msg = template.format(user=user, rank=tier.name)
+            if len(by_rank) == 1 and sum(len(users) for users in by_rank.values()) == 1:
+                ((rank_name, users),) = by_rank.items()
+                msg = template.format(user=next(iter(users)), rank=rank_name)
             else:
-                # Batch: group by rank name
-                by_rank: dict[str, list[str]] = {}
-                for user, tier in promotions:
-                    by_rank.setdefault(tier.name, []).append(user)
-                parts = []
-                for rank_name, users in by_rank.items():
-                    if len(users) == 1:
-                        parts.append(f"{users[0]} \u2192 {rank_name}")
-                    else:
-                        parts.append(f"{', '.join(users)} \u2192 {rank_name}")
+                parts = [
+                    f"{', '.join(sorted(users))} \u2192 {rank_name}"
+                    for rank_name, users in by_rank.items()
+                ]
                 msg = f"\u2b50 Rank ups! {' \u00b7 '.join(parts)}"
 
             try:
@@ -6,13 +6,16 @@ Sprint 7: Competitive Events, Multipliers & Bounties.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 from croniter import croniter
 
 if TYPE_CHECKING:
+    from .chat_outbox import ChatOutbox
     from .config import EconomyConfig, ScheduledEventConfig
     from .database import EconomyDatabase
     from .multiplier_engine import MultiplierEngine
@@ -30,6 +33,7 @@ class ScheduledEventManager:
         database: EconomyDatabase,
         client: object,
         logger: logging.Logger,
+        chat_outbox: ChatOutbox | None = None,
     ) -> None:
         self._events = config.multipliers.scheduled_events
         self._multiplier = multiplier_engine
@@ -37,13 +41,21 @@ class ScheduledEventManager:
         self._db = database
         self._client = client
         self._logger = logger
+        self._chat_outbox = chat_outbox
+        self._events_by_name = {e.name: e for e in self._events}
         self._active: dict[str, dict] = {}  # key → {event_name, end_time}
+        # Min-heaps keyed by epoch seconds: (fire_ts, channel, event_idx)
+        # and (end_ts, channel, event_name).
+        self._fire_heap: list[tuple[float, str, int]] = []
+        self._end_heap: list[tuple[float, str, str]] = []
+        self._cron_cache: dict[str, croniter] = {}  # cron expr → reusable iterator
         self._check_task: asyncio.Task | None = None
         self._channels: list[str] = []
 
     async def start(self, channels: list[str]) -> None:
         """Start the event monitoring loop."""
         self._channels = channels
+        self._seed_fire_heap(datetime.now(timezone.utc))
         self._check_task = asyncio.create_task(self._monitor_loop())
 
     async def stop(self) -> None:
@@ -55,25 +67,77 @@ class ScheduledEventManager:
             except asyncio.CancelledError:
                 pass
 
+    def _next_fire(
+        self, cron_expr: str, after: datetime, ret_type: type = float
+    ) -> float | datetime:
+        """Next fire time after *after*, reusing one parsed croniter per expression."""
+        it = self._cron_cache.get(cron_expr)
+        if it is None:
+            it = self._cron_cache[cron_expr] = croniter(cron_expr, after)
+        else:
+            it.set_current(after, force=True)
+        return it.get_next(ret_type)
+
+    def _seed_fire_heap(self, now: datetime) -> None:
+        """Compute the next fire time once per (event, channel) pair."""
+        self._fire_heap = []
+        # Look back one minute so an event due this minute still fires on startup.
+        since = now - timedelta(minutes=1)
+        for idx, event_cfg in enumerate(self._events):
+            fire_ts = self._next_fire(event_cfg.cron, since)
+            for channel in self._channels:
+                self._fire_heap.append((fire_ts, channel, idx))
+        heapq.heapify(self._fire_heap)
+
     async def _monitor_loop(self) -> None:
-        """Check every 60 seconds for events that should start or end."""
-        while True:
+        """Sleep until the earliest start or end time, then dispatch whatever is due."""
+        while self._fire_heap or self._end_heap:
             try:
-                now = datetime.now(timezone.utc)
-                for event_cfg in self._events:
-                    for channel in self._channels:
-                        await self._check_event(event_cfg, channel, now)
+                await self._dispatch_due(datetime.now(timezone.utc))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 self._logger.error("Scheduled event monitor error: %s", e)
-            await asyncio.sleep(60)
+            await asyncio.sleep(max(0.0, self._next_wakeup() - time.time()))
+
+    def _next_wakeup(self) -> float:
+        """Epoch seconds of the earliest pending start or end."""
+        candidates = []
+        if self._fire_heap:
+            candidates.append(self._fire_heap[0][0])
+        if self._end_heap:
+            candidates.append(self._end_heap[0][0])
+        return min(candidates) if candidates else time.time()
+
+    async def _dispatch_due(self, now: datetime) -> None:
+        """End expired events, then start events whose fire time has arrived."""
+        now_ts = now.timestamp()
+
+        while self._end_heap and self._end_heap[0][0] <= now_ts:
+            _, channel, name = heapq.heappop(self._end_heap)
+            key = f"{channel}:{name}"
+            active = self._active.get(key)
+            # Stale entry: the event was already ended (or restarted) elsewhere.
+            if active is None or now < active["end_time"]:
+                continue
+            await self._end_event(self._events_by_name[name], channel, key)
+
+        while self._fire_heap and self._fire_heap[0][0] <= now_ts:
+            fire_ts, channel, idx = heapq.heappop(self._fire_heap)
+            event_cfg = self._events[idx]
+            fire_time = datetime.fromtimestamp(fire_ts, timezone.utc)
+            try:
+                await self._check_event(event_cfg, channel, now, fire_time)
+            finally:
+                next_ts = self._next_fire(event_cfg.cron, now)
+                heapq.heappush(self._fire_heap, (next_ts, channel, idx))
 
     async def _check_event(
         self,
         event_cfg: ScheduledEventConfig,
         channel: str,
         now: datetime,
+        fire_time: datetime | None = None,
     ) -> None:
         """Check if a specific event should start or has ended."""
         key = f"{channel}:{event_cfg.name}"
@@ -86,10 +150,10 @@ class ScheduledEventManager:
             return
 
         # Should this event start now?
-        cron = croniter(event_cfg.cron, now - timedelta(minutes=1))
-        next_fire = cron.get_next(datetime)
-        if abs((next_fire - now).total_seconds()) < 90:
-            await self._start_event(event_cfg, channel, key, next_fire)
+        if fire_time is None:
+            fire_time = self._next_fire(event_cfg.cron, now - timedelta(minutes=1), datetime)
+        if abs((fire_time - now).total_seconds()) < 90:
+            await self._start_event(event_cfg, channel, key, fire_time)
 
     async def _start_event(
         self,
@@ -101,6 +165,7 @@ class ScheduledEventManager:
         """Activate a scheduled event."""
         end_time = fire_time + timedelta(hours=event_cfg.duration_hours)
         self._active[key] = {"event_name": event_cfg.name, "end_time": end_time}
+        heapq.heappush(self._end_heap, (end_time.timestamp(), channel, event_cfg.name))
 
         # Register multiplier
         self._multiplier.set_scheduled_event(
@@ -161,21 +226,33 @@ class ScheduledEventManager:
             return
 
         per_user = max(1, event_cfg.presence_bonus // len(present_users))
+        trigger_id = f"event.{event_cfg.name}.presence"
+        reason = f"Present at {event_cfg.name} start"
 
-        for username in present_users:
-            await self._db.credit(
-                username,
-                channel,
-                per_user,
-                tx_type="event_bonus",
-                trigger_id=f"event.{event_cfg.name}.presence",
-                reason=f"Present at {event_cfg.name} start",
-            )
-            await self._client.send_pm(
-                channel,
-                username,
-                f"🎁 You were here when **{event_cfg.name}** started! +{per_user:,} Z",
-            )
+        await self._db.credit_batch(
+            channel,
+            [(username, per_user, "event_bonus", trigger_id, reason) for username in present_users],
+        )
+
+        msg = f"🎁 You were here when **{event_cfg.name}** started! +{per_user:,} Z"
+        if self._chat_outbox is not None:
+            for username in present_users:
+                self._chat_outbox.queue_pm(channel, username, msg)
+        else:
+            # No outbox: one PM at a time so a big crowd doesn't flood the client
+            failed = 0
+            for username in present_users:
+                try:
+                    await self._client.send_pm(channel, username, msg)
+                except Exception:
+                    failed += 1
+            if failed:
+                self._logger.warning(
+                    "Presence bonus PM failed for %d/%d users in %s",
+                    failed,
+                    len(present_users),
+                    channel,
+                )
 
         self._logger.info(
             "Presence bonus for %s: %d Z each to %d users",
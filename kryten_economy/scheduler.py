@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from kryten import KrytenClient
 
     from .blackjack_engine import BlackjackEngine
+    from .chat_outbox import ChatOutbox
     from .config import EconomyConfig
     from .database import EconomyDatabase
     from .gambling_engine import GamblingEngine
@@ -42,6 +43,7 @@ class Scheduler:
         trivia_engine: TriviaEngine | None = None,
         blackjack_engine: BlackjackEngine | None = None,
         spectacle_manager: SpectacleManager | None = None,
+        chat_outbox: ChatOutbox | None = None,
     ) -> None:
         self._config = config
         self._db = database
@@ -53,9 +55,15 @@ class Scheduler:
         self._trivia_engine = trivia_engine
         self._blackjack_engine = blackjack_engine
         self._spectacle_manager = spectacle_manager
+        self._chat_outbox = chat_outbox
         self._logger = logger or logging.getLogger("economy.scheduler")
         self._metrics = None  # Wired by EconomyApp after construction
         self._tasks: list[asyncio.Task] = []
+        # Private RNG for rain amounts and jitter
+        self._rng = random.Random()
+        # Rain PM template split around {amount}: (template, currency) → (prefix, tail)
+        self._rain_msg_key: tuple[str, str] | None = None
+        self._rain_msg_parts: tuple[str, str] | None = None
         # Fire-and-forget announcement tasks (paced chat output) kept off the
         # per-channel loops so one channel's pacing can't delay others.
         self._bg_tasks: set[asyncio.Task] = set()
@@ -78,6 +86,17 @@ class Scheduler:
                 exc_info=exc,
             )
 
+    async def _for_each_channel(self, fn, what: str) -> None:
+        """Run ``fn(channel)`` for every configured channel concurrently.
+
+        Failures are logged per channel and never cancel the other channels.
+        """
+        channels = [ch_config.channel for ch_config in self._config.channels]
+        results = await asyncio.gather(*(fn(ch) for ch in channels), return_exceptions=True)
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                self._logger.error("%s failed in %s", what, channel, exc_info=result)
+
     async def start(self) -> None:
         """Start all scheduled tasks."""
         if self._config.rain.enabled:
@@ -92,13 +111,10 @@ class Scheduler:
                 "Balance maintenance task started (mode: %s)", self._config.balance_maintenance.mode
             )
 
-        # Sprint 4: challenge expiry + heist check
+        # Sprint 4: challenge expiry + heist check share one tick loop
         if self._gambling_engine and self._config.gambling.enabled:
-            self._tasks.append(asyncio.create_task(self._challenge_expiry_loop()))
-            self._logger.info("Challenge expiry task started")
-            if self._config.gambling.heist.enabled:
-                self._tasks.append(asyncio.create_task(self._heist_check_loop()))
-                self._logger.info("Heist check task started")
+            self._tasks.append(asyncio.create_task(self._gambling_tick_loop()))
+            self._logger.info("Gambling tick task started (challenge expiry + heist check)")
 
         # Race tick loop
         if self._race_engine and self._config.gambling.race.enabled:
@@ -137,7 +153,7 @@ class Scheduler:
         """Periodic rain drop distribution."""
         while True:
             interval = self._config.rain.interval_minutes
-            jitter = random.uniform(-0.3, 0.3) * interval
+            jitter = self._rng.uniform(-0.3, 0.3) * interval
             wait_seconds = (interval + jitter) * 60
             await asyncio.sleep(max(wait_seconds, 60))  # Minimum 1 minute
             try:
@@ -147,52 +163,86 @@ class Scheduler:
 
     async def _execute_rain(self) -> None:
         """Distribute rain to all connected users across all channels."""
+        await self._for_each_channel(self._rain_channel, "Rain")
+
+    async def _rain_channel(self, channel: str) -> None:
+        """Credit one rain drop to everyone connected in *channel*."""
         rain_cfg = self._config.rain
+        users = self._presence_tracker.get_connected_users(channel)
+        if not users:
+            return
 
-        for ch_config in self._config.channels:
-            channel = ch_config.channel
-            users = self._presence_tracker.get_connected_users(channel)
-            if not users:
-                continue
-
-            amount = random.randint(rain_cfg.min_amount, rain_cfg.max_amount)
-
-            event_multiplier = 1.0
-            if self._multiplier_engine is not None:
-                for mul in self._multiplier_engine.get_active_multipliers(channel):
-                    if mul.source.startswith("scheduled:"):
-                        event_multiplier *= mul.multiplier
-
-            for username in users:
-                # Scheduled event multipliers apply to rain drops.
-                rain_amount = max(1, int(round(amount * event_multiplier)))
-
-                await self._db.credit(
-                    username,
-                    channel,
-                    rain_amount,
-                    tx_type="rain",
-                    trigger_id="rain.ambient",
-                    reason=f"Rain drop: {rain_amount}",
-                )
-
-                if rain_cfg.pm_notification:
-                    msg = rain_cfg.message.format(
-                        amount=rain_amount,
-                        currency=self._config.currency.name,
-                    )
-                    await self._send_pm(channel, username, msg)
+        amount = self._rng.randint(rain_cfg.min_amount, rain_cfg.max_amount)
 
-            self._logger.info(
-                "Rain: base=%d, event_multiplier=%.2f, final=%d to %d users in %s",
-                amount,
-                event_multiplier,
-                max(1, int(round(amount * event_multiplier))),
-                len(users),
-                channel,
+        event_multiplier = 1.0
+        if self._multiplier_engine is not None:
+            for mul in self._multiplier_engine.get_active_multipliers(channel):
+                if mul.source.startswith("scheduled:"):
+                    event_multiplier *= mul.multiplier
+
+        # Scheduled event multipliers apply to rain drops.
+        rain_amount = max(1, int(round(amount * event_multiplier)))
+        reason = f"Rain drop: {rain_amount}"
+
+        await self._db.credit_batch(
+            channel,
+            [(username, rain_amount, "rain", "rain.ambient", reason) for username in users],
+        )
+
+        if rain_cfg.pm_notification:
+            msg = self._rain_message(rain_amount)
+            if self._chat_outbox is not None:
+                # Paced delivery in the background; the tick doesn't wait on it
+                for username in users:
+                    self._chat_outbox.queue_pm(channel, username, msg)
+            else:
+                await self._send_rain_pms(channel, users, msg)
+
+        self._logger.info(
+            "Rain: base=%d, event_multiplier=%.2f, final=%d to %d users in %s",
+            amount,
+            event_multiplier,
+            rain_amount,
+            len(users),
+            channel,
+        )
+        if self._metrics:
+            self._metrics.record_rain(amount, len(users))
+
+    def _rain_message(self, amount: int) -> str:
+        """Render the rain PM, pre-splitting the template around ``{amount}``."""
+        template = self._config.rain.message
+        currency = self._config.currency.name
+        key = (template, currency)
+        if self._rain_msg_key != key:
+            self._rain_msg_key = key
+            self._rain_msg_parts = None
+            if template.count("{amount}") == 1:
+                prefix, tail = template.split("{amount}", 1)
+                try:
+                    self._rain_msg_parts = (
+                        prefix.format(currency=currency),
+                        tail.format(currency=currency),
+                    )
+                except (KeyError, IndexError, ValueError):
+                    pass  # Unusual template: fall back to a full format below
+        if self._rain_msg_parts is None:
+            return template.format(amount=amount, currency=currency)
+        prefix, tail = self._rain_msg_parts
+        return f"{prefix}{amount}{tail}"
+
+    async def _send_rain_pms(self, channel: str, users: set[str], msg: str) -> None:
+        """Send rain PMs directly, one at a time (no outbox wired)."""
+        failed = 0
+        for username in users:
+            try:
+                await self._client.send_pm(channel, username, msg)
+            except Exception:
+                failed += 1
+        if failed:
+            self._logger.warning(
+                "Rain PM failed for %d/%d users in %s", failed, len(users), channel
             )
-            if self._metrics:
-                self._metrics.record_rain(amount, len(users))
 
     # ══════════════════════════════════════════════════════════
     #  Balance Maintenance (Interest / Decay)
@@ -214,92 +264,118 @@ class Scheduler:
 
     async def _execute_balance_maintenance(self) -> None:
         """Apply interest or decay to all accounts."""
-        mode = self._config.balance_maintenance.mode
-
-        for ch_config in self._config.channels:
-            channel = ch_config.channel
+        await self._for_each_channel(self._maintain_channel, "Balance maintenance")
 
-            if mode == "interest":
-                cfg = self._config.balance_maintenance.interest
-                total = await self._db.apply_interest_batch(
-                    channel, cfg.daily_rate, cfg.max_daily_interest, cfg.min_balance_to_earn
-                )
-                self._logger.info("Interest: %d Z total in %s", total, channel)
-            elif mode == "decay":
-                cfg = self._config.balance_maintenance.decay
-                total = await self._db.apply_decay_batch(channel, cfg.daily_rate, cfg.exempt_below)
-                self._logger.info("Decay: %d Z total in %s", total, channel)
+    async def _maintain_channel(self, channel: str) -> None:
+        """Apply the configured interest or decay to one channel."""
+        mode = self._config.balance_maintenance.mode
+        if mode == "interest":
+            cfg = self._config.balance_maintenance.interest
+            total = await self._db.apply_interest_batch(
+                channel, cfg.daily_rate, cfg.max_daily_interest, cfg.min_balance_to_earn
+            )
+            self._logger.info("Interest: %d Z total in %s", total, channel)
+        elif mode == "decay":
+            cfg = self._config.balance_maintenance.decay
+            total = await self._db.apply_decay_batch(channel, cfg.daily_rate, cfg.exempt_below)
+            self._logger.info("Decay: %d Z total in %s", total, channel)
 
     # ══════════════════════════════════════════════════════════
-    #  Challenge Expiry
+    #  Gambling Tick (Challenge Expiry + Heist Check)
     # ══════════════════════════════════════════════════════════
 
-    async def _challenge_expiry_loop(self) -> None:
-        """Expire timed-out challenges and refund challengers."""
+    _GAMBLING_TICK_SECONDS = 10
+    _CHALLENGE_EXPIRY_EVERY = 6  # ticks → 60 seconds
+
+    async def _gambling_tick_loop(self) -> None:
+        """Check heists every tick and expire challenges every sixth tick."""
+        tick = 0
         while True:
-            await asyncio.sleep(60)  # Check every 60 seconds
-            try:
-                for ch_config in self._config.channels:
-                    channel = ch_config.channel
-                    expired = await self._gambling_engine.cleanup_expired_challenges(channel)
-                    for challenge in expired:
-                        await self._send_pm(
-                            channel,
-                            challenge["challenger"],
-                            f"⚔️ Your challenge to {challenge['target']} expired. "
-                            f"{challenge['wager']} {self._config.currency.symbol} refunded.",
-                        )
-                        await self._send_pm(
-                            channel,
-                            challenge["target"],
-                            f"⚔️ Challenge from {challenge['challenger']} expired.",
-                        )
-            except Exception:
-                self._logger.exception("Challenge expiry failed")
+            await asyncio.sleep(self._GAMBLING_TICK_SECONDS)
+            tick += 1
+            await self._run_gambling_tick(tick, datetime.now(timezone.utc))
+
+    async def _run_gambling_tick(self, tick: int, now: datetime) -> None:
+        """Service both gambling checks in a single pass over the channels."""
+        check_heists = self._config.gambling.heist.enabled
+        expire_challenges = tick % self._CHALLENGE_EXPIRY_EVERY == 0
+        if not (check_heists or expire_challenges):
+            return
 
-    # ══════════════════════════════════════════════════════════
-    #  Heist Check
-    # ══════════════════════════════════════════════════════════
+        async def _do_channel(channel: str) -> None:
+            if check_heists:
+                try:
+                    await self._check_heist(channel, now)
+                except Exception:
+                    self._logger.exception("Heist check failed")
+            if expire_challenges:
+                try:
+                    await self._expire_challenges(channel)
+                except Exception:
+                    self._logger.exception("Challenge expiry failed")
+
+        await self._for_each_channel(_do_channel, "Gambling tick")
+
+    async def _expire_challenges(self, channel: str) -> None:
+        """Expire timed-out challenges and refund challengers."""
+        expired = await self._gambling_engine.cleanup_expired_challenges(channel)
+        for challenge in expired:
+            await self._send_pm(
+                channel,
+                challenge["challenger"],
+                f"⚔️ Your challenge to {challenge['target']} expired. "
+                f"{challenge['wager']} {self._config.currency.symbol} refunded.",
+            )
+            await self._send_pm(
+                channel,
+                challenge["target"],
+                f"⚔️ Challenge from {challenge['challenger']} expired.",
+            )
 
-    async def _heist_check_loop(self) -> None:
-        """Resolve heists when join window expires."""
-        while True:
-            await asyncio.sleep(10)  # Check every 10 seconds
-            try:
-                now = datetime.now(timezone.utc)
-                for ch_config in self._config.channels:
-                    channel = ch_config.channel
-                    heist = self._gambling_engine.get_active_heist(channel)
-                    if heist and now > heist.expires_at:
-                        # Capture heist wager total before resolution
-                        heist_total_wagered = sum(heist.participants.values())
-                        heist_participants = list(heist.participants.keys())
-                        result = await self._gambling_engine.resolve_heist(channel)
-                        if self._spectacle_manager:
-                            self._spectacle_manager.release(channel)
-                        if result:
-                            if self._metrics:
-                                # Count one heist per participant
-                                for _ in heist_participants:
-                                    self._metrics.heists_total += 1
-                                self._metrics.gambling_z_wagered_total += heist_total_wagered
-                            lines, participants, per_user_pm = result
-                            if self._config.gambling.heist.announce_public and lines:
-                                # Send scenario line first
-                                await self._announce_chat(channel, lines[0])
-                                if len(lines) > 1:
-                                    # Dramatic pause before revealing outcome
-                                    await asyncio.sleep(6)
-                                    for line in lines[1:]:
-                                        await self._announce_chat(channel, line)
-                                        await asyncio.sleep(2)
-                            # PM each participant only their personal result (win/loss/push + amount)
-                            for user in participants:
-                                pm_text = per_user_pm.get(user)
-                                if pm_text:
-                                    await self._send_pm(channel, user, pm_text)
-            except Exception:
-                self._logger.exception("Heist check failed")
+    async def _check_heist(self, channel: str, now: datetime) -> None:
+        """Resolve the channel's heist when its join window has expired."""
+        heist = self._gambling_engine.get_active_heist(channel)
+        if not heist or now <= heist.expires_at:
+            return
+        # Capture heist wager total before resolution
+        heist_total_wagered = sum(heist.participants.values())
+        heist_participants = list(heist.participants.keys())
+        result = await self._gambling_engine.resolve_heist(channel)
+        if self._spectacle_manager:
+            self._spectacle_manager.release(channel)
+        if not result:
+            return
+        if self._metrics:
+            # Count one heist per participant
+            for _ in heist_participants:
+                self._metrics.heists_total += 1
+            self._metrics.gambling_z_wagered_total += heist_total_wagered
+        # The paced reveal runs off the tick so challenge expiry and other
+        # channels' heist checks keep their cadence
+        self._spawn(self._reveal_heist(channel, *result))
+
+    async def _reveal_heist(
+        self,
+        channel: str,
+        lines: list[str],
+        participants: list[str],
+        per_user_pm: dict[str, str],
+    ) -> None:
+        """Announce a resolved heist with dramatic pauses, then PM each participant."""
+        if self._config.gambling.heist.announce_public and lines:
+            # Send scenario line first
+            await self._announce_chat(channel, lines[0])
+            if len(lines) > 1:
+                # Dramatic pause before revealing outcome
+                await asyncio.sleep(6)
+                for line in lines[1:]:
+                    await self._announce_chat(channel, line)
+                    await asyncio.sleep(2)
+        # PM each participant only their personal result (win/loss/push + amount)
+        for user in participants:
+            pm_text = per_user_pm.get(user)
+            if pm_text:
+                await self._send_pm(channel, user, pm_text)
 
     # ══════════════════════════════════════════════════════════
     #  Race Tick
@@ -6,13 +6,14 @@ for consistent balance / permission / blackout / discount checking.
 
 from __future__ import annotations
 
+import bisect
 import logging
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .config import EconomyConfig
+    from .config import EconomyConfig, QueueTierConfig, RanksConfig
     from .database import EconomyDatabase
     from .float_price_scaler import FloatPriceScaler
     from .media_client import MediaCMSClient
@@ -31,7 +32,7 @@ class SpendResult(Enum):
     INVALID_ARGS = "invalid_args"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpendOutcome:
     result: SpendResult
     message: str
@@ -40,6 +41,17 @@ class SpendOutcome:
     discount_percent: float = 0.0
 
 
+# Canonical outcomes for the fixed-message failure branches (immutable, safe to share)
+OUTCOME_NO_ACCOUNT = SpendOutcome(
+    SpendResult.INSUFFICIENT_FUNDS,
+    "You don't have an account yet. Stick around to earn some Z!",
+)
+OUTCOME_BANNED = SpendOutcome(
+    SpendResult.PERMISSION_DENIED,
+    "Your economy access has been suspended.",
+)
+
+
 class SpendingEngine:
     """Centralised spending validation and pricing."""
 
@@ -57,11 +69,49 @@ class SpendingEngine:
         self._logger = logger
         self._scaler = price_scaler
 
+        # Queue price tiers as parallel arrays, ascending by max_minutes
+        self._tier_minutes: list[int] = []
+        self._tier_labels: list[str] = []
+        self._tier_costs: list[int] = []
+        self._set_queue_tiers(config.spending.queue_tiers)
+
+        # Per-rank discount fraction and (1 - discount) factor, by tier index
+        self._discount_fractions: list[float] = []
+        self._discount_factors: list[float] = []
+        # Rank thresholds (min_lifetime_earned) in config order, for bisect
+        self._tier_thresholds: list[int] = []
+        self._tier_thresholds_sorted = True
+        self._set_ranks(config.ranks)
+
     def update_config(self, new_config, price_scaler: FloatPriceScaler | None = None) -> None:
         """Hot-swap the config reference."""
         self._config = new_config
         if price_scaler is not None:
             self._scaler = price_scaler
+        self._set_queue_tiers(new_config.spending.queue_tiers)
+        self._set_ranks(new_config.ranks)
+
+    def _set_queue_tiers(self, tiers: list[QueueTierConfig]) -> None:
+        """Rebuild the price-tier lookup arrays from config."""
+        ordered = sorted(tiers, key=lambda t: t.max_minutes)
+        self._tier_minutes = [t.max_minutes for t in ordered]
+        self._tier_labels = [t.label for t in ordered]
+        self._tier_costs = [t.cost for t in ordered]
+        # A plain scan beats bisect's call overhead for short tier lists
+        if len(self._tier_minutes) <= self._LINEAR_TIER_MAX:
+            self._get_price_tier = self._get_price_tier_linear
+        else:
+            self._get_price_tier = self._get_price_tier_bisect
+
+    def _set_ranks(self, ranks: RanksConfig) -> None:
+        """Rebuild the per-rank discount and threshold tables from config."""
+        per_rank = ranks.spend_discount_per_rank
+        self._discount_fractions = [per_rank * i for i in range(len(ranks.tiers))]
+        self._discount_factors = [1 - d for d in self._discount_fractions]
+        self._tier_thresholds = [t.min_lifetime_earned for t in ranks.tiers]
+        self._tier_thresholds_sorted = self._tier_thresholds == sorted(self._tier_thresholds)
+        if not self._tier_thresholds_sorted:
+            self._logger.warning("Rank tiers are not sorted by min_lifetime_earned")
 
     # ══════════════════════════════════════════════════════════
     #  Rank Discount
@@ -69,6 +119,8 @@ class SpendingEngine:
 
     def get_rank_discount(self, rank_tier_index: int) -> float:
         """Calculate rank discount fraction (e.g. tier 5 × 0.02 = 0.10)."""
+        if 0 <= rank_tier_index < len(self._discount_fractions):
+            return self._discount_fractions[rank_tier_index]
         return self._config.ranks.spend_discount_per_rank * rank_tier_index
 
     def apply_discount(
@@ -77,23 +129,40 @@ class SpendingEngine:
         rank_tier_index: int,
     ) -> tuple[int, float]:
         """Return (final_cost, discount_fraction). Minimum cost is 1."""
+        if 0 <= rank_tier_index < len(self._discount_factors):
+            factor = self._discount_factors[rank_tier_index]
+            return max(1, int(base_cost * factor)), self._discount_fractions[rank_tier_index]
         discount = self.get_rank_discount(rank_tier_index)
-        discounted = max(1, int(base_cost * (1 - discount)))
-        return discounted, discount
+        return max(1, int(base_cost * (1 - discount))), discount
 
     # ══════════════════════════════════════════════════════════
     #  Price Tiers
     # ══════════════════════════════════════════════════════════
 
+    _LINEAR_TIER_MAX = 8
+
     def get_price_tier(self, duration_seconds: int) -> tuple[str, int]:
         """Find the tier label and base cost for a given duration."""
+        return self._get_price_tier(duration_seconds)
+
+    def _get_price_tier_linear(self, duration_seconds: int) -> tuple[str, int]:
+        """First-fit scan over the cached max_minutes list."""
         duration_minutes = duration_seconds / 60
-        for tier in self._config.spending.queue_tiers:
-            if duration_minutes <= tier.max_minutes:
-                return tier.label, tier.cost
+        idx = 0
+        for max_minutes in self._tier_minutes:
+            if duration_minutes <= max_minutes:
+                break
+            idx += 1
         # Fallback to last tier
-        last = self._config.spending.queue_tiers[-1]
-        return last.label, last.cost
+        idx = min(idx, len(self._tier_minutes) - 1)
+        return self._tier_labels[idx], self._tier_costs[idx]
+
+    def _get_price_tier_bisect(self, duration_seconds: int) -> tuple[str, int]:
+        """Binary search over the cached max_minutes list."""
+        idx = bisect.bisect_left(self._tier_minutes, duration_seconds / 60)
+        # Fallback to last tier
+        idx = min(idx, len(self._tier_minutes) - 1)
+        return self._tier_labels[idx], self._tier_costs[idx]
 
     # ════════════════════════════════════════════════════════
     #  Inflation-Adjusted Pricing (Sprint 10)
@@ -143,24 +212,15 @@ class SpendingEngine:
 
         Returns SpendOutcome on failure, None if all checks pass.
         """
-        account = await self._db.get_account(username, channel)
-        if not account:
-            return SpendOutcome(
-                result=SpendResult.INSUFFICIENT_FUNDS,
-                message="You don't have an account yet. Stick around to earn some Z!",
-            )
-        if account.get("economy_banned"):
-            return SpendOutcome(
-                result=SpendResult.PERMISSION_DENIED,
-                message="Your economy access has been suspended.",
-            )
-        if account["balance"] < amount:
+        ctx = await self._db.get_spend_context(username, channel)
+        if ctx is None:
+            return OUTCOME_NO_ACCOUNT
+        if ctx.banned:
+            return OUTCOME_BANNED
+        if ctx.balance < amount:
             return SpendOutcome(
                 result=SpendResult.INSUFFICIENT_FUNDS,
-                message=(
-                    f"Insufficient funds. You have {account['balance']:,} Z "
-                    f"but need {amount:,} Z."
-                ),
+                message=f"Insufficient funds. You have {ctx.balance:,} Z but need {amount:,} Z.",
             )
         return None  # All checks passed
 
@@ -171,8 +231,10 @@ class SpendingEngine:
     def get_rank_tier_index(self, account: dict) -> int:
         """0-based tier index for a user's lifetime earnings."""
         lifetime = account.get("lifetime_earned", 0)
+        if self._tier_thresholds_sorted:
+            return max(0, bisect.bisect_right(self._tier_thresholds, lifetime) - 1)
         tier_index = 0
-        for i, tier in enumerate(self._config.ranks.tiers):
-            if lifetime >= tier.min_lifetime_earned:
+        for i, threshold in enumerate(self._tier_thresholds):
+            if lifetime >= threshold:
                 tier_index = i
         return tier_index
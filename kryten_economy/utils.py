@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import functools
+import time
+from datetime import date, datetime, timezone
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
+# (UTC epoch day, formatted string) — both derived from time.time(), so the cache
+# key and the cached value always come from the same clock
+_today_cache: tuple[int, str] | None = None
+_iso_week_cache: tuple[int, str] | None = None
+
+
+@functools.lru_cache(maxsize=128)
 def normalize_channel(channel: str) -> str:
     """Normalize channel name for NATS subject use.
     Follow kryten-py convention (lowercase, strip special chars)."""
@@ -15,6 +25,23 @@ def parse_timestamp(ts: str | None) -> datetime | None:
     """Parse SQLite TIMESTAMP string to timezone-aware datetime, or None."""
     if not ts:
         return None
+    # Fast path for SQLite's own layout: "YYYY-MM-DD HH:MM:SS[.ffffff]", no offset
+    if isinstance(ts, str) and len(ts) >= 19 and ts[4] == "-" and ts[10] in " T":
+        frac = ts[19:]
+        if not frac or (frac[0] == "." and frac[1:].isdigit()):
+            try:
+                return datetime(
+                    int(ts[0:4]),
+                    int(ts[5:7]),
+                    int(ts[8:10]),
+                    int(ts[11:13]),
+                    int(ts[14:16]),
+                    int(ts[17:19]),
+                    int(frac[1:7].ljust(6, "0")) if frac else 0,
+                    tzinfo=timezone.utc,
+                )
+            except ValueError:
+                pass
     try:
         dt = datetime.fromisoformat(ts)
         # Ensure timezone-aware (SQLite stores naive timestamps as UTC)
@@ -25,9 +52,18 @@ def parse_timestamp(ts: str | None) -> datetime | None:
         return None
 
 
+def _utc_epoch_day() -> int:
+    """Days since 1970-01-01 by wall-clock ``time.time()`` (UTC)."""
+    return int(time.time()) // 86400
+
+
 def today_str() -> str:
-    """Return today's date as YYYY-MM-DD string (UTC)."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    """Return today's date as YYYY-MM-DD string (UTC, from ``time.time()``)."""
+    global _today_cache
+    day = _utc_epoch_day()
+    if _today_cache is None or _today_cache[0] != day:
+        _today_cache = (day, date.fromordinal(_EPOCH_ORDINAL + day).isoformat())
+    return _today_cache[1]
 
 
 def now_utc() -> datetime:
@@ -36,7 +72,17 @@ def now_utc() -> datetime:
 
 
 def iso_week_str(dt: datetime | None = None) -> str:
-    """Return ISO week string like '2026-W09'."""
-    if dt is None:
-        dt = now_utc()
-    return dt.strftime("%G-W%V")
+    """Return ISO week string like '2026-W09' for *dt* (default: now, from ``time.time()``)."""
+    if dt is not None:
+        return _format_iso_week(dt)
+    global _iso_week_cache
+    day = _utc_epoch_day()
+    if _iso_week_cache is None or _iso_week_cache[0] != day:
+        _iso_week_cache = (day, _format_iso_week(date.fromordinal(_EPOCH_ORDINAL + day)))
+    return _iso_week_cache[1]
+
+
+def _format_iso_week(dt: date) -> str:
+    """Format *dt*'s ISO year and week without going through strftime."""
+    year, week, _ = dt.isocalendar()
+    return f"{year:04d}-W{week:02d}"
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import shutil
+import sqlite3
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from types import MappingProxyType
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 
 from kryten_economy.channel_state import ChannelStateTracker, MediaInfo
 from kryten_economy.config import EconomyConfig
@@ -38,11 +45,24 @@ from kryten_economy.event_announcer import EventAnnouncer
 from kryten_economy.greeting_handler import GreetingHandler
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test on the one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 # ── Minimal config dict matching EconomyConfig schema ────────
 
 
 def make_config_dict(**overrides) -> dict:
-    """Build a valid config dict with sensible test defaults."""
+    """Build a valid config dict with sensible test defaults.
+
+    The literal is rebuilt on every call on purpose: callers mutate nested
+    sections, and building it fresh is far cheaper than deep-copying a cached
+    template.
+    """
     base = {
         "nats": {"servers": ["nats://localhost:4222"]},
         "channels": [{"domain": "cytu.be", "channel": "testchannel"}],
@@ -178,36 +198,135 @@ def sample_config(sample_config_dict: dict) -> EconomyConfig:
     return EconomyConfig(**sample_config_dict)
 
 
+def _deep_freeze(value: Any) -> Any:
+    """Read-only copy of a config value: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def frozen_config_dict() -> MappingProxyType:
+    """Read-only default config dict, built once per session and frozen at every level."""
+    return _deep_freeze(make_config_dict())
+
+
+@pytest.fixture(scope="session")
+def shared_config(frozen_config_dict: MappingProxyType) -> EconomyConfig:
+    """EconomyConfig parsed once per session — read-only; use sample_config to mutate."""
+    return EconomyConfig(**frozen_config_dict)
+
+
 @pytest.fixture
 def tmp_db_path(tmp_path: Path) -> str:
     """Return a temporary SQLite database path."""
     return str(tmp_path / "test_economy.db")
 
 
-@pytest_asyncio.fixture
-async def database(tmp_db_path: str) -> AsyncGenerator[EconomyDatabase, None]:
-    """Provide an initialized database with temp file."""
-    import logging
+def seed_sql(database: EconomyDatabase, sql: str, params: tuple = ()) -> None:
+    """Run one seeding statement inline — no executor hop for test setup writes."""
+    conn = database._get_connection()
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def fetch_sql(database: EconomyDatabase, sql: str, params: tuple = ()) -> sqlite3.Row | None:
+    """Read one row inline on a pooled connection — for assertions on raw tables."""
+    conn = database._get_connection()
+    try:
+        return conn.execute(sql, params).fetchone()
+    finally:
+        conn.close()
 
-    db = EconomyDatabase(tmp_db_path, logging.getLogger("test"))
-    await db.initialize()
+
+async def seed_account(
+    database: EconomyDatabase, username: str, channel: str, balance: int = 0
+) -> None:
+    """Create an account holding ``balance`` — credit() upserts it in one transaction."""
+    if balance > 0:
+        await database.credit(username, channel, balance, tx_type="test", reason="seed")
+    else:
+        await database.get_or_create_account(username, channel)
+
+
+@pytest.fixture(scope="session")
+def template_db_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Schema-initialized SQLite file, built once per session and copied per test."""
+    path = str(tmp_path_factory.mktemp("template") / "template_economy.db")
+    db = EconomyDatabase(path, logging.getLogger("test"))
+    db._create_tables()
+    db.close()  # checkpoint the WAL so the copied main file holds the schema
+    return path
+
+
+class _ThrowawayDatabase(EconomyDatabase):
+    """EconomyDatabase for per-test files: no fsync on commit, temp storage in RAM."""
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = super()._open_connection()
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+
+@pytest.fixture
+def database(tmp_db_path: str, template_db_path: str) -> Generator[EconomyDatabase, None, None]:
+    """Provide an initialized database with temp file."""
+    shutil.copyfile(template_db_path, tmp_db_path)
+    db = _ThrowawayDatabase(tmp_db_path, logging.getLogger("test"))
     yield db
+    db.close()
+
+
+class _LazyAsyncMock(MagicMock):
+    """MagicMock whose known async methods become AsyncMocks on first access.
+
+    Building every AsyncMock up front dominated fixture setup; most tests
+    touch one or two of them.
+    """
+
+    _async_returns: ClassVar[dict[str, Any]] = {}
+
+    def _get_child_mock(self, **kw: Any) -> MagicMock:
+        name = kw.get("name")
+        if kw.get("parent") is self and name in self._async_returns:
+            return AsyncMock(return_value=copy.copy(self._async_returns[name]), **kw)
+        return MagicMock(**kw)
+
+
+class _MockClient(_LazyAsyncMock):
+    _async_returns: ClassVar[dict[str, Any]] = {
+        "send_pm": "corr-id-123",
+        "send_chat": "corr-id-456",
+        "connect": None,
+        "run": None,
+        "stop": None,
+        "subscribe": None,
+        "subscribe_request_reply": None,
+        "add_media": None,
+        "safe_set_channel_rank": {"success": True},
+    }
+
+
+class _MockMediaClient(_LazyAsyncMock):
+    _async_returns: ClassVar[dict[str, Any]] = {
+        "search": [],
+        "get_by_id": None,
+        "get_duration": None,
+        "start": None,
+        "stop": None,
+    }
 
 
 @pytest.fixture
 def mock_client() -> MagicMock:
     """Return a mock KrytenClient with async methods."""
-    client = MagicMock()
-    client.send_pm = AsyncMock(return_value="corr-id-123")
-    client.send_chat = AsyncMock(return_value="corr-id-456")
-    client.connect = AsyncMock()
-    client.run = AsyncMock()
-    client.stop = AsyncMock()
-    client.subscribe = AsyncMock()
-    client.subscribe_request_reply = AsyncMock()
-    client.add_media = AsyncMock()
-    client.safe_set_channel_rank = AsyncMock(return_value={"success": True})
-    return client
+    return _MockClient()
 
 
 # ── Sprint 3 fixtures ───────────────────────────────────────
@@ -219,8 +338,8 @@ def channel_state(sample_config: EconomyConfig) -> ChannelStateTracker:
     return ChannelStateTracker(sample_config, logging.getLogger("test"))
 
 
-@pytest_asyncio.fixture
-async def earning_engine(
+@pytest.fixture
+def earning_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     channel_state: ChannelStateTracker,
@@ -249,8 +368,8 @@ def sample_media_info() -> MediaInfo:
 # ── Sprint 4 fixtures ───────────────────────────────────────
 
 
-@pytest_asyncio.fixture
-async def gambling_engine(
+@pytest.fixture
+def gambling_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
 ) -> GamblingEngine:
@@ -268,17 +387,11 @@ async def gambling_engine(
 @pytest.fixture
 def mock_media_client() -> MagicMock:
     """Mock MediaCMSClient with async methods."""
-    client = MagicMock(spec=MediaCMSClient)
-    client.search = AsyncMock(return_value=[])
-    client.get_by_id = AsyncMock(return_value=None)
-    client.get_duration = AsyncMock(return_value=None)
-    client.start = AsyncMock()
-    client.stop = AsyncMock()
-    return client
+    return _MockMediaClient(spec=MediaCMSClient)
 
 
-@pytest_asyncio.fixture
-async def spending_engine(
+@pytest.fixture
+def spending_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_media_client: MagicMock,
@@ -295,8 +408,8 @@ async def spending_engine(
 # ── Sprint 6 fixtures ───────────────────────────────────────
 
 
-@pytest_asyncio.fixture
-async def achievement_engine(
+@pytest.fixture
+def achievement_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -310,8 +423,8 @@ async def achievement_engine(
     )
 
 
-@pytest_asyncio.fixture
-async def rank_engine(
+@pytest.fixture
+def rank_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -342,8 +455,8 @@ def multiplier_engine(
     )
 
 
-@pytest_asyncio.fixture
-async def competition_engine(
+@pytest.fixture
+def competition_engine(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -357,8 +470,8 @@ async def competition_engine(
     )
 
 
-@pytest_asyncio.fixture
-async def bounty_manager(
+@pytest.fixture
+def bounty_manager(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -375,8 +488,8 @@ async def bounty_manager(
 # ── Sprint 8 fixtures ───────────────────────────────────────
 
 
-@pytest_asyncio.fixture
-async def presence_tracker(
+@pytest.fixture
+def presence_tracker(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -391,8 +504,8 @@ async def presence_tracker(
     return tracker
 
 
-@pytest_asyncio.fixture
-async def pm_handler(
+@pytest.fixture
+def pm_handler(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -426,8 +539,8 @@ async def pm_handler(
     return handler
 
 
-@pytest_asyncio.fixture
-async def admin_scheduler(
+@pytest.fixture
+def admin_scheduler(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     mock_client: MagicMock,
@@ -572,9 +685,17 @@ class MockKrytenClient:
         pass
 
     async def fire_event(self, event_name: str, event: Any) -> None:
-        """Test helper: simulate an incoming event."""
-        for handler in self._handlers.get(event_name, []):
-            await handler(event)
+        """Test helper: simulate an incoming event.
+
+        Handlers run concurrently, as they would when dispatched by kryten-py.
+        """
+        handlers = self._handlers.get(event_name)
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            await handlers[0](event)
+        else:
+            await asyncio.gather(*(handler(event) for handler in handlers))
 
 
 @pytest.fixture
@@ -602,8 +723,8 @@ async def event_announcer(
     await announcer.stop()
 
 
-@pytest_asyncio.fixture
-async def greeting_handler(
+@pytest.fixture
+def greeting_handler(
     sample_config: EconomyConfig,
     database: EconomyDatabase,
     presence_tracker: PresenceTracker,
@@ -629,7 +750,9 @@ def rate_limiter() -> PmRateLimiter:
 
 
 @pytest_asyncio.fixture
-async def db_with_accounts(tmp_path: Path) -> AsyncGenerator[EconomyDatabase, None]:
+async def db_with_accounts(
+    tmp_path: Path, template_db_path: str
+) -> AsyncGenerator[EconomyDatabase, None]:
     """SQLite DB pre-populated with a controlled set of accounts for pruner tests.
 
     All accounts are in channel='test'. Use inactive_days=1 so that only
@@ -643,12 +766,11 @@ async def db_with_accounts(tmp_path: Path) -> AsyncGenerator[EconomyDatabase, No
     | color_user   | 100     | 100             | 0              | 0      | #ff0000    | 2020-01-01  |
     | spender_user | 50      | 100             | 50             | 0      | NULL       | 2020-01-01  |
     """
-    import sqlite3
     from datetime import datetime, timezone
 
     db_path = str(tmp_path / "prune_test.db")
+    shutil.copyfile(template_db_path, db_path)
     db = EconomyDatabase(db_path, logging.getLogger("test"))
-    await db.initialize()
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
@@ -673,7 +795,8 @@ async def db_with_accounts(tmp_path: Path) -> AsyncGenerator[EconomyDatabase, No
             )
         conn.commit()
 
-    loop = __import__("asyncio").get_event_loop()
+    loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, lambda: _insert(db._get_connection()))
 
     yield db
+    db.close()
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from unittest.mock import MagicMock
+from collections.abc import Awaitable, Callable
 
 import pytest
 
 from kryten_economy.achievement_engine import AchievementEngine
 from kryten_economy.config import (
+    AchievementConfig,
     EconomyConfig,
 )
 from kryten_economy.database import EconomyDatabase
-from conftest import make_config_dict
+from conftest import MockKrytenClient, seed_sql
 
 CH = "testchannel"
 
 
-def _cfg_with_achievements(achievements: list[dict]) -> EconomyConfig:
-    """Build EconomyConfig with custom achievements."""
-    return EconomyConfig(**make_config_dict(achievements=achievements))
+def _cfg_with_achievements(
+    base: EconomyConfig, achievements: list[dict], **overrides: dict
+) -> EconomyConfig:
+    """Copy *base* with custom achievements; only the swapped sections are validated."""
+    update: dict = {"achievements": [AchievementConfig(**a) for a in achievements]}
+    for section, values in overrides.items():
+        update[section] = type(getattr(base, section))(**values)
+    return base.model_copy(update=update)
+
+
+@pytest.fixture
+def make_engine(
+    shared_config: EconomyConfig,
+    database: EconomyDatabase,
+    mock_kryten_client: MockKrytenClient,
+) -> Callable[..., AchievementEngine]:
+    """Factory binding the test DB and client; tests only supply achievements."""
+
+    def _make(achievements: list[dict], **overrides: dict) -> AchievementEngine:
+        cfg = _cfg_with_achievements(shared_config, achievements, **overrides)
+        return AchievementEngine(cfg, database, mock_kryten_client, logging.getLogger("test"))
+
+    return _make
 
 
 async def _seed_account(db: EconomyDatabase, username: str, balance: int = 0, **kwargs) -> None:
@@ -35,9 +57,13 @@ async def _seed_account(db: EconomyDatabase, username: str, balance: int = 0, **
 
 
 @pytest.mark.asyncio
-async def test_award_first_time(database: EconomyDatabase, mock_client: MagicMock):
+async def test_award_first_time(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+    mock_kryten_client: MockKrytenClient,
+):
     """Achievement awarded, reward credited, PM sent."""
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "first_100",
@@ -48,7 +74,6 @@ async def test_award_first_time(database: EconomyDatabase, mock_client: MagicMoc
             }
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
 
     await _seed_account(database, "Alice", 0)
     await database.credit("Alice", CH, 150, tx_type="earn", reason="test")
@@ -60,13 +85,16 @@ async def test_award_first_time(database: EconomyDatabase, mock_client: MagicMoc
     acc = await database.get_account("Alice", CH)
     assert acc["balance"] >= 50  # reward credited
 
-    mock_client.send_pm.assert_called()
+    assert mock_kryten_client.sent_pms
 
 
 @pytest.mark.asyncio
-async def test_already_awarded_skipped(database: EconomyDatabase, mock_client: MagicMock):
+async def test_already_awarded_skipped(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
     """Duplicate achievement not re-awarded."""
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "dup_test",
@@ -77,7 +105,6 @@ async def test_already_awarded_skipped(database: EconomyDatabase, mock_client: M
             }
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
     await database.credit("Alice", CH, 100, tx_type="earn", reason="test")
 
@@ -88,159 +115,90 @@ async def test_already_awarded_skipped(database: EconomyDatabase, mock_client: M
     assert len(second) == 0
 
 
-@pytest.mark.asyncio
-async def test_condition_lifetime_messages(database: EconomyDatabase, mock_client: MagicMock):
-    """Threshold met via lifetime_messages → awarded."""
-    cfg = _cfg_with_achievements(
-        [
-            {
-                "id": "chatterbox",
-                "description": "Send 10 messages",
-                "condition": {"type": "lifetime_messages", "threshold": 10},
-                "reward": 20,
-                "hidden": False,
-            }
-        ]
-    )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice")
-
-    # Seed daily_activity with enough messages to meet lifetime threshold
-    import asyncio
+async def _seed_nothing(db: EconomyDatabase) -> None:
+    pass
 
-    def _set():
-        conn = database._get_connection()
-        try:
-            conn.execute(
-                "INSERT INTO daily_activity (username, channel, date, messages_sent) "
-                "VALUES (?, ?, '2026-01-01', 15)",
-                ("Alice", CH),
-            )
-            conn.commit()
-        finally:
-            conn.close()
 
-    await asyncio.get_running_loop().run_in_executor(None, _set)
-
-    awarded = await engine.check_achievements("Alice", CH, ["lifetime_messages"])
-    assert len(awarded) == 1
-
-
-@pytest.mark.asyncio
-async def test_condition_lifetime_messages_below(database: EconomyDatabase, mock_client: MagicMock):
-    """Below threshold → not awarded."""
-    cfg = _cfg_with_achievements(
-        [
-            {
-                "id": "chatterbox",
-                "description": "Send 100 messages",
-                "condition": {"type": "lifetime_messages", "threshold": 100},
-                "reward": 20,
-                "hidden": False,
-            }
-        ]
+async def _seed_messages(db: EconomyDatabase) -> None:
+    """15 lifetime messages via daily_activity."""
+    seed_sql(
+        db,
+        "INSERT INTO daily_activity (username, channel, date, messages_sent) "
+        "VALUES (?, ?, '2026-01-01', 15)",
+        ("Alice", CH),
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice")
-
-    awarded = await engine.check_achievements("Alice", CH, ["lifetime_messages"])
-    assert len(awarded) == 0
 
 
-@pytest.mark.asyncio
-async def test_condition_daily_streak(database: EconomyDatabase, mock_client: MagicMock):
-    """Streak threshold met → awarded."""
-    cfg = _cfg_with_achievements(
-        [
-            {
-                "id": "streak_3",
-                "description": "3-day streak",
-                "condition": {"type": "daily_streak", "threshold": 3},
-                "reward": 30,
-                "hidden": False,
-            }
-        ]
+async def _seed_streak(db: EconomyDatabase) -> None:
+    """A current daily streak of 5."""
+    seed_sql(
+        db,
+        "INSERT OR REPLACE INTO streaks (username, channel, current_daily_streak) "
+        "VALUES (?, ?, 5)",
+        ("Alice", CH),
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice")
-
-    # Seed streaks table with a streak of 5
-    import asyncio
-
-    def _set():
-        conn = database._get_connection()
-        try:
-            conn.execute(
-                "INSERT OR REPLACE INTO streaks (username, channel, current_daily_streak) "
-                "VALUES (?, ?, 5)",
-                ("Alice", CH),
-            )
-            conn.commit()
-        finally:
-            conn.close()
 
-    await asyncio.get_running_loop().run_in_executor(None, _set)
 
-    awarded = await engine.check_achievements("Alice", CH, ["daily_streak"])
-    assert len(awarded) == 1
-
-
-@pytest.mark.asyncio
-async def test_condition_unique_tip_recipients(database: EconomyDatabase, mock_client: MagicMock):
-    """Tip count meets threshold."""
-    cfg = _cfg_with_achievements(
-        [
-            {
-                "id": "tipper_3",
-                "description": "Tip 3 different people",
-                "condition": {"type": "unique_tip_recipients", "threshold": 3},
-                "reward": 25,
-                "hidden": False,
-            }
-        ]
-    )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 10000)
+async def _seed_tips(db: EconomyDatabase) -> None:
+    """Tips to 3 different users."""
+    targets = ["Bob", "Charlie", "Dave"]
+    await asyncio.gather(*(_seed_account(db, t) for t in targets))
+    await asyncio.gather(*(db.record_tip("Alice", t, CH, 10) for t in targets))
 
-    # Record tips to 3 different users
-    for target in ["Bob", "Charlie", "Dave"]:
-        await _seed_account(database, target)
-        await database.record_tip("Alice", target, CH, 10)
 
-    awarded = await engine.check_achievements("Alice", CH, ["unique_tip_recipients"])
-    assert len(awarded) == 1
+async def _seed_key_grip(db: EconomyDatabase) -> None:
+    """Key Grip (tier 2) requires 5000 lifetime."""
+    await db.credit("Alice", CH, 6000, tx_type="earn", reason="test")
 
 
 @pytest.mark.asyncio
-async def test_condition_rank_reached(database: EconomyDatabase, mock_client: MagicMock):
-    """Tier index meets threshold."""
-    cfg = _cfg_with_achievements(
+@pytest.mark.parametrize(
+    "cond_type, threshold, seed, expected",
+    [
+        pytest.param("lifetime_messages", 10, _seed_messages, 1, id="lifetime_messages"),
+        pytest.param("lifetime_messages", 100, _seed_nothing, 0, id="lifetime_messages_below"),
+        pytest.param("daily_streak", 3, _seed_streak, 1, id="daily_streak"),
+        pytest.param("unique_tip_recipients", 3, _seed_tips, 1, id="unique_tip_recipients"),
+        pytest.param("rank_reached", 2, _seed_key_grip, 1, id="rank_reached"),
+    ],
+)
+async def test_condition(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+    cond_type: str,
+    threshold: int,
+    seed: Callable[[EconomyDatabase], Awaitable[None]],
+    expected: int,
+):
+    """Awarded exactly when the condition's metric reaches its threshold."""
+    engine = make_engine(
         [
             {
-                "id": "rank_2",
-                "description": "Reach Key Grip rank",
-                "condition": {"type": "rank_reached", "threshold": 2},
-                "reward": 100,
+                "id": f"{cond_type}_{threshold}",
+                "description": f"{cond_type} >= {threshold}",
+                "condition": {"type": cond_type, "threshold": threshold},
+                "reward": 20,
                 "hidden": False,
             }
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
-    # Key Grip requires 5000 lifetime
-    await database.credit("Alice", CH, 6000, tx_type="earn", reason="test")
+    await seed(database)
 
-    awarded = await engine.check_achievements("Alice", CH, ["rank_reached"])
-    assert len(awarded) == 1
+    awarded = await engine.check_achievements("Alice", CH, [cond_type])
+    assert len(awarded) == expected
 
 
 @pytest.mark.asyncio
-async def test_hidden_achievement_not_shown(database: EconomyDatabase, mock_client: MagicMock):
+async def test_hidden_achievement_not_shown(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
     """Hidden achievements excluded from the check output description handling is internal.
 
     This test ensures that a hidden achievement CAN still be awarded when condition met.
     """
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "secret_1",
@@ -251,7 +209,6 @@ async def test_hidden_achievement_not_shown(database: EconomyDatabase, mock_clie
             }
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
     await database.credit("Alice", CH, 100, tx_type="earn", reason="test")
 
@@ -261,9 +218,13 @@ async def test_hidden_achievement_not_shown(database: EconomyDatabase, mock_clie
 
 
 @pytest.mark.asyncio
-async def test_public_announcement(database: EconomyDatabase, mock_client: MagicMock):
+async def test_public_announcement(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+    mock_kryten_client: MockKrytenClient,
+):
     """Achievement with announce_public sends chat."""
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "loud_one",
@@ -273,27 +234,27 @@ async def test_public_announcement(database: EconomyDatabase, mock_client: Magic
                 "hidden": False,
                 "announce_public": True,
             }
-        ]
+        ],
+        announcements={"achievement_milestone": True},
     )
-    # Need to patch announcements config
-    cfg.announcements.achievement_milestone = True
-
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
     await database.credit("Alice", CH, 100, tx_type="earn", reason="test")
 
     await engine.check_achievements("Alice", CH, ["lifetime_earned"])
 
-    mock_client.send_chat.assert_called()
-    chat_msg = mock_client.send_chat.call_args[0][1]
+    assert mock_kryten_client.sent_chats
+    chat_msg = mock_kryten_client.sent_chats[-1][1]
     assert "Alice" in chat_msg
     assert "Big achievement" in chat_msg
 
 
 @pytest.mark.asyncio
-async def test_multiple_achievements_same_event(database: EconomyDatabase, mock_client: MagicMock):
+async def test_multiple_achievements_same_event(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
     """Multiple achievements can trigger in one check."""
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "earn_10",
@@ -311,7 +272,6 @@ async def test_multiple_achievements_same_event(database: EconomyDatabase, mock_
             },
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
     await database.credit("Alice", CH, 500, tx_type="earn", reason="test")
 
@@ -323,9 +283,12 @@ async def test_multiple_achievements_same_event(database: EconomyDatabase, mock_
 
 
 @pytest.mark.asyncio
-async def test_unknown_condition_type(database: EconomyDatabase, mock_client: MagicMock):
+async def test_unknown_condition_type(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
     """Unknown condition type logged, not awarded."""
-    cfg = _cfg_with_achievements(
+    engine = make_engine(
         [
             {
                 "id": "mystery",
@@ -336,8 +299,164 @@ async def test_unknown_condition_type(database: EconomyDatabase, mock_client: Ma
             }
         ]
     )
-    engine = AchievementEngine(cfg, database, mock_client, logging.getLogger("test"))
     await _seed_account(database, "Alice")
 
     awarded = await engine.check_achievements("Alice", CH, ["completely_bogus"])
     assert len(awarded) == 0
+
+
+@pytest.mark.asyncio
+async def test_check_only_evaluates_requested_types(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
+    """Achievements of other (or unknown) condition types are never evaluated."""
+    engine = make_engine(
+        [
+            {
+                "id": "earn_10",
+                "description": "Earn 10 Z",
+                "condition": {"type": "lifetime_earned", "threshold": 10},
+                "reward": 0,
+            },
+            {
+                "id": "chat_10",
+                "description": "Send 10 messages",
+                "condition": {"type": "lifetime_messages", "threshold": 10},
+                "reward": 0,
+            },
+            {
+                "id": "mystery",
+                "description": "Mystery achievement",
+                "condition": {"type": "completely_bogus", "threshold": 1},
+                "reward": 0,
+            },
+        ]
+    )
+    assert "completely_bogus" not in engine._by_condition_type
+    await _seed_account(database, "Alice", 50)
+
+    evaluated = []
+    original = engine._evaluate_condition
+
+    def _spy(condition, metrics):
+        evaluated.append(condition.type)
+        return original(condition, metrics)
+
+    engine._evaluate_condition = _spy
+    awarded = await engine.check_achievements("Alice", CH, ["lifetime_earned", "completely_bogus"])
+    assert [a.id for a in awarded] == ["earn_10"]
+    assert evaluated == ["lifetime_earned"]
+
+
+@pytest.mark.asyncio
+async def test_held_achievements_fetched_once_per_check(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
+    """One awarded-ID lookup per check, however many achievements are candidates."""
+    engine = make_engine(
+        [
+            {
+                "id": f"earn_{n}",
+                "description": f"Earn {n} Z",
+                "condition": {"type": "lifetime_earned", "threshold": n},
+                "reward": 0,
+            }
+            for n in (10, 20, 1000)
+        ]
+    )
+    await _seed_account(database, "Alice", 50)
+
+    calls = 0
+    original = database.get_awarded_achievement_ids
+
+    async def _counting(username, channel):
+        nonlocal calls
+        calls += 1
+        return await original(username, channel)
+
+    database.get_awarded_achievement_ids = _counting
+    first = await engine.check_achievements("Alice", CH, ["lifetime_earned"])
+    assert {a.id for a in first} == {"earn_10", "earn_20"}
+    assert calls == 1
+    assert await original("Alice", CH) == {"earn_10", "earn_20"}
+
+    second = await engine.check_achievements("Alice", CH, ["lifetime_earned"])
+    assert second == []
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_condition_metrics_fetched_in_one_query(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+):
+    """Every condition type a check needs is read in a single metrics call."""
+    engine = make_engine(
+        [
+            {
+                "id": "earn_10",
+                "description": "Earn 10 Z",
+                "condition": {"type": "lifetime_earned", "threshold": 10},
+                "reward": 0,
+            },
+            {
+                "id": "rank_1",
+                "description": "Reach rank 1",
+                "condition": {"type": "rank_reached", "threshold": 1},
+                "reward": 0,
+            },
+            {
+                "id": "chat_10",
+                "description": "Send 10 messages",
+                "condition": {"type": "lifetime_messages", "threshold": 10},
+                "reward": 0,
+            },
+        ]
+    )
+    await _seed_account(database, "Alice", 50)
+
+    requested: list[set[str]] = []
+    original = database.get_achievement_metrics
+
+    async def _recording(username, channel, metrics):
+        requested.append(set(metrics))
+        return await original(username, channel, metrics)
+
+    database.get_achievement_metrics = _recording
+    awarded = await engine.check_achievements("Alice", CH)
+    assert [a.id for a in awarded] == ["earn_10"]
+    assert requested == [{"lifetime_earned", "lifetime_messages"}]
+
+
+@pytest.mark.asyncio
+async def test_iter_new_achievements_stops_early(
+    make_engine: Callable[..., AchievementEngine],
+    database: EconomyDatabase,
+    mock_kryten_client: MockKrytenClient,
+):
+    """Breaking out after the first award leaves the rest unawarded and unannounced."""
+    engine = make_engine(
+        [
+            {
+                "id": f"earn_{n}",
+                "description": f"Earn {n} Z",
+                "condition": {"type": "lifetime_earned", "threshold": n},
+                "reward": 0,
+            }
+            for n in (10, 20)
+        ]
+    )
+    await _seed_account(database, "Alice", 50)
+
+    first = None
+    async for ach in engine.iter_new_achievements("Alice", CH, ["lifetime_earned"]):
+        first = ach
+        break
+    assert first is not None and first.id == "earn_10"
+    assert await database.get_awarded_achievement_ids("Alice", CH) == {"earn_10"}
+    assert not mock_kryten_client.sent_pms
+
+    rest = await engine.check_achievements("Alice", CH, ["lifetime_earned"])
+    assert [a.id for a in rest] == ["earn_20"]
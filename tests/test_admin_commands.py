@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
@@ -18,13 +19,22 @@ CH = "testchannel"
 class FakePmEvent:
     """Minimal stand-in for ChatMessageEvent used by handle_pm."""
 
-    def __init__(self, username: str, message: str, channel: str = CH, rank: int = 0):
+    _FROZEN_TS = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(
+        self,
+        username: str,
+        message: str,
+        channel: str = CH,
+        rank: int = 0,
+        timestamp: datetime | None = None,
+    ):
         self.username = username
         self.message = message
         self.channel = channel
         self.rank = rank
         self.shadow = False
-        self.timestamp = datetime.now(timezone.utc)
+        self.timestamp = timestamp or self._FROZEN_TS
 
 
 # ── grant ──────────────────────────────────────────────────────
@@ -111,11 +121,10 @@ async def test_rain_distributes(
     presence_tracker: PresenceTracker,
 ):
     """Splits among present users, PMs each, announces."""
-    # Seed users and mark as present
-    for user in ["alice", "bob", "charlie"]:
-        await database.get_or_create_account(user, CH)
-        await database.credit(user, CH, 100, tx_type="seed", trigger_id="seed")
-        await presence_tracker.handle_user_join(user, CH)
+    # Seed users in one transaction, then mark as present
+    users = ["alice", "bob", "charlie"]
+    await database.credit_batch(CH, [(user, 100, "seed", "seed", None) for user in users])
+    await asyncio.gather(*(presence_tracker.handle_user_join(user, CH) for user in users))
 
     result = await pm_handler._cmd_rain("admin", CH, ["300"])
     assert "300" in result or "100" in result  # 300 total or 100 each
@@ -173,6 +182,18 @@ async def test_set_rank_valid(
     mock_client.send_pm.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_set_rank_invalidates_rank_cache(pm_handler: PmHandler, database: EconomyDatabase):
+    """Admin override drops the cached threshold so the next tick re-checks."""
+    rank_engine = pm_handler._rank_engine
+    await database.credit("eve", CH, 1500, "earn")
+    await rank_engine.check_rank_promotion("eve", CH)
+    assert rank_engine.maybe_check("eve", CH, 1500) is False
+
+    await pm_handler._cmd_set_rank("admin", CH, ["eve", pm_handler._config.ranks.tiers[0].name])
+    assert rank_engine.maybe_check("eve", CH, 1500) is True
+
+
 @pytest.mark.asyncio
 async def test_set_rank_invalid(pm_handler: PmHandler, database: EconomyDatabase):
     """Unknown rank name → 'Valid:' list."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -23,9 +24,11 @@ async def test_econ_stats_format(
     presence_tracker: PresenceTracker,
 ):
     """Returns formatted stats with all fields."""
-    await database.get_or_create_account("alice", CH)
-    await database.get_or_create_account("bob", CH)
-    await presence_tracker.handle_user_join("alice", CH)
+    await asyncio.gather(
+        database.get_or_create_account("alice", CH),
+        database.get_or_create_account("bob", CH),
+        presence_tracker.handle_user_join("alice", CH),
+    )
 
     result = await pm_handler._cmd_econ_stats("admin", CH, [])
 
@@ -81,9 +84,10 @@ async def test_econ_health_inflation(
     presence_tracker: PresenceTracker,
 ):
     """Reports inflationary when earned > spent."""
-    await database.get_or_create_account("alice", CH)
-    await database.credit("alice", CH, 1000, tx_type="earn", trigger_id="test")
-    await presence_tracker.handle_user_join("alice", CH)
+    await asyncio.gather(
+        database.credit_batch(CH, [("alice", 1000, "earn", "test", None)]),
+        presence_tracker.handle_user_join("alice", CH),
+    )
 
     result = await pm_handler._cmd_econ_health("admin", CH, [])
 
@@ -102,8 +106,10 @@ async def test_econ_health_deflation(
     """Reports deflationary when spent > earned after account creation."""
     await database.get_or_create_account("alice", CH)
     # Spend more than earned today (welcome wallet doesn't count as "today earned")
-    await database.debit("alice", CH, 50, tx_type="spend", trigger_id="test")
-    await presence_tracker.handle_user_join("alice", CH)
+    await asyncio.gather(
+        database.debit("alice", CH, 50, tx_type="spend", trigger_id="test"),
+        presence_tracker.handle_user_join("alice", CH),
+    )
 
     result = await pm_handler._cmd_econ_health("admin", CH, [])
     # Net flow should be negative or zero
@@ -119,8 +125,9 @@ async def test_econ_triggers_hot_and_dead(pm_handler: PmHandler, database: Econo
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     # Record some analytics
-    await database.record_trigger_analytics(CH, "presence.base", today, 100)
-    await database.record_trigger_analytics(CH, "chat.long_message", today, 50)
+    await database.record_trigger_analytics_batch(
+        [(CH, "presence.base", today, 100), (CH, "chat.long_message", today, 50)]
+    )
 
     result = await pm_handler._cmd_econ_triggers("admin", CH, [])
 
@@ -10,16 +10,6 @@ from kryten_economy.database import EconomyDatabase
 CH = "testchannel"
 
 
-async def _seed_account(
-    db: EconomyDatabase,
-    username: str = "Alice",
-    balance: int = 5000,
-) -> None:
-    await db.get_or_create_account(username, CH)
-    if balance > 100:
-        await db.credit(username, CH, balance - 100, tx_type="test", reason="seed")
-
-
 @pytest.mark.asyncio
 async def test_create_pending_approval(database: EconomyDatabase):
     """create_pending_approval inserts and returns an ID."""
@@ -48,10 +38,9 @@ async def test_resolve_approval_approved(database: EconomyDatabase):
     assert record is not None
     assert record["username"] == "Alice"
     assert record["type"] == "force_play"
-
-    # Should no longer be pending
-    pending = await database.get_pending_approvals(CH, "force_play")
-    assert len(pending) == 0
+    # The returned row is the resolved one — no longer pending
+    assert record["status"] == "approved"
+    assert record["resolved_by"] == "Admin"
 
 
 @pytest.mark.asyncio
@@ -66,10 +55,7 @@ async def test_resolve_approval_rejected(database: EconomyDatabase):
     )
     record = await database.resolve_approval(aid, "Admin", approved=False)
     assert record is not None
-
-    # Should no longer be pending
-    pending = await database.get_pending_approvals(CH, "channel_gif")
-    assert len(pending) == 0
+    assert record["status"] == "rejected"
 
 
 @pytest.mark.asyncio
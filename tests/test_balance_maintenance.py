@@ -12,7 +12,7 @@ from kryten_economy.database import EconomyDatabase
 from kryten_economy.presence_tracker import PresenceTracker
 from kryten_economy.scheduler import Scheduler
 
-from conftest import make_config_dict
+from conftest import fetch_sql, make_config_dict
 
 
 @pytest.fixture
@@ -54,19 +54,20 @@ class TestInterest:
     ):
         """Interest should be applied to accounts above min_balance."""
         # Create accounts: one qualifying, one below min
-        await database.credit("rich", "testchannel", 10000, "earn")
-        await database.credit("poor", "testchannel", 50, "earn")
+        await database.credit_batch(
+            "testchannel",
+            [("rich", 10000, "earn", None, None), ("poor", 50, "earn", None, None)],
+        )
 
         sched = make_scheduler(sample_config, database, presence, mock_client)
         await sched._execute_balance_maintenance()
 
-        rich_bal = await database.get_balance("rich", "testchannel")
-        poor_bal = await database.get_balance("poor", "testchannel")
+        balances = await database.get_balances(["rich", "poor"], "testchannel")
 
         # rich: 10000 * 0.001 = 10 interest (capped at 10)
-        assert rich_bal == 10010
+        assert balances["rich"] == 10010
         # poor: below min_balance_to_earn (100), no interest
-        assert poor_bal == 50
+        assert balances["poor"] == 50
 
     async def test_interest_cap(
         self,
@@ -98,16 +99,13 @@ class TestInterest:
         sched = make_scheduler(sample_config, database, presence, mock_client)
         await sched._execute_balance_maintenance()
 
-        import sqlite3
-
-        conn = sqlite3.connect(database._db_path)
-        conn.row_factory = sqlite3.Row
-        tx = conn.execute(
-            "SELECT * FROM transactions WHERE type = 'interest' AND username = 'rich'"
-        ).fetchone()
-        conn.close()
+        tx = fetch_sql(
+            database,
+            "SELECT amount FROM transactions WHERE type = 'interest' AND username = 'rich'",
+        )
         assert tx is not None
-        assert tx["amount"] > 0
+        (amount,) = tx
+        assert amount > 0
 
 
 class TestDecay:
@@ -125,19 +123,20 @@ class TestDecay:
         cfg = EconomyConfig(**d)
 
         # Create accounts: one exempt, one qualifying
-        await database.credit("whale", "testchannel", 10000, "earn")
-        await database.credit("small", "testchannel", 500, "earn")
+        await database.credit_batch(
+            "testchannel",
+            [("whale", 10000, "earn", None, None), ("small", 500, "earn", None, None)],
+        )
 
         sched = make_scheduler(cfg, database, presence, mock_client)
         await sched._execute_balance_maintenance()
 
-        whale_bal = await database.get_balance("whale", "testchannel")
-        small_bal = await database.get_balance("small", "testchannel")
+        balances = await database.get_balances(["whale", "small"], "testchannel")
 
         # whale: 10000 * 0.01 = 100 decay → 9900
-        assert whale_bal == 9900
+        assert balances["whale"] == 9900
         # small: below exempt_below (1000), no decay
-        assert small_bal == 500
+        assert balances["small"] == 500
 
     async def test_decay_transaction_logged(
         self, database: EconomyDatabase, presence: PresenceTracker, mock_client: MagicMock
@@ -154,16 +153,12 @@ class TestDecay:
         sched = make_scheduler(cfg, database, presence, mock_client)
         await sched._execute_balance_maintenance()
 
-        import sqlite3
-
-        conn = sqlite3.connect(database._db_path)
-        conn.row_factory = sqlite3.Row
-        tx = conn.execute(
-            "SELECT * FROM transactions WHERE type = 'decay' AND username = 'whale'"
-        ).fetchone()
-        conn.close()
+        tx = fetch_sql(
+            database, "SELECT amount FROM transactions WHERE type = 'decay' AND username = 'whale'"
+        )
         assert tx is not None
-        assert tx["amount"] < 0  # Negative for debit
+        (amount,) = tx
+        assert amount < 0  # Negative for debit
 
 
 class TestMaintenanceNone:
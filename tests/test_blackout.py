@@ -14,20 +14,11 @@ from kryten_economy.database import EconomyDatabase
 from kryten_economy.pm_handler import PmHandler
 from kryten_economy.presence_tracker import PresenceTracker
 from kryten_economy.spending_engine import SpendingEngine
+from conftest import make_config_dict, seed_account
 
 CH = "testchannel"
 
 
-async def _seed_account(
-    db: EconomyDatabase,
-    username: str = "Alice",
-    balance: int = 50000,
-) -> None:
-    await db.get_or_create_account(username, CH)
-    if balance > 0:
-        await db.credit(username, CH, balance, tx_type="test", reason="seed")
-
-
 def _make_handler(
     config: EconomyConfig,
     database: EconomyDatabase,
@@ -76,7 +67,7 @@ async def test_queue_no_blackout(
 ):
     """Queue works fine with default empty blackout_windows."""
     mock_media_client.get_by_id = AsyncMock(return_value=_fake_media())
-    await _seed_account(database, "Alice", 5000)
+    await seed_account(database, "Alice", CH, 5000)
     handler = _make_handler(
         sample_config, database, spending_engine, mock_media_client, mock_client
     )
@@ -142,8 +133,6 @@ async def test_queue_block_message_upcoming_window(
 @pytest.mark.asyncio
 async def test_blackout_config_loads():
     """BlackoutWindowConfig can be loaded in SpendingConfig."""
-    from conftest import make_config_dict
-
     cfg = EconomyConfig(
         **make_config_dict(
             spending={
@@ -161,8 +150,6 @@ async def test_blackout_config_loads():
 @pytest.mark.asyncio
 async def test_multiple_blackout_windows():
     """Multiple blackout windows are parsed."""
-    from conftest import make_config_dict
-
     cfg = EconomyConfig(
         **make_config_dict(
             spending={
@@ -176,6 +163,19 @@ async def test_multiple_blackout_windows():
     assert len(cfg.spending.blackout_windows) == 2
 
 
+def test_blackout_window_cron_parsed_once():
+    """Each window parses its cron once and answers active/next from that parser."""
+    win = BlackoutWindowConfig(name="Movie Night", cron="0 20 * * 5", duration_hours=3)
+    assert win._croniter is win._croniter
+
+    friday_2130 = datetime(2026, 1, 9, 21, 30, tzinfo=timezone.utc)
+    friday_2330 = datetime(2026, 1, 9, 23, 30, tzinfo=timezone.utc)
+    assert win.is_active(friday_2130)
+    assert not win.is_active(friday_2330)
+    assert win.prev_fire(friday_2130) == datetime(2026, 1, 9, 20, 0, tzinfo=timezone.utc)
+    assert win.next_fire(friday_2130) == datetime(2026, 1, 16, 20, 0, tzinfo=timezone.utc)
+
+
 @pytest.mark.asyncio
 async def test_forcenow_bypasses_blackout(
     sample_config: EconomyConfig,
@@ -185,7 +185,7 @@ async def test_forcenow_bypasses_blackout(
 ):
     """forcenow should not check blackout (by design)."""
     mock_media_client.get_by_id = AsyncMock(return_value=_fake_media())
-    await _seed_account(database, "Alice", 2000000)
+    await seed_account(database, "Alice", CH, 2000000)
     handler = _make_handler(sample_config, database, spending_engine, mock_media_client)
 
     # forcenow with admin gate → creates approval (but doesn't check blackout)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -10,13 +11,18 @@ import pytest
 from kryten_economy.bounty_manager import BountyManager
 from kryten_economy.config import EconomyConfig
 from kryten_economy.database import EconomyDatabase
-from conftest import make_config_dict
-from unittest.mock import MagicMock
+from conftest import MockKrytenClient, make_config_dict, seed_account, seed_sql
 
 CH = "testchannel"
 
 
 def _make_bounty_config(**overrides) -> EconomyConfig:
+    # Parse each override set once; every caller gets its own deep copy to mutate
+    return _bounty_config(tuple(sorted(overrides.items()))).model_copy(deep=True)
+
+
+@functools.cache
+def _bounty_config(overrides: tuple[tuple[str, object], ...]) -> EconomyConfig:
     bounties = {
         "enabled": True,
         "min_amount": 100,
@@ -30,10 +36,25 @@ def _make_bounty_config(**overrides) -> EconomyConfig:
     return EconomyConfig(**make_config_dict(bounties=bounties))
 
 
-async def _seed_account(db: EconomyDatabase, username: str, balance: int) -> None:
-    await db.get_or_create_account(username, CH)
-    if balance > 0:
-        await db.credit(username, CH, balance, tx_type="seed", reason="test seed")
+@pytest.fixture
+def mgr(database: EconomyDatabase, mock_kryten_client: MockKrytenClient) -> BountyManager:
+    """BountyManager on the per-test database with the default bounty config."""
+    return BountyManager(
+        _make_bounty_config(), database, mock_kryten_client, logging.getLogger("test")
+    )
+
+
+class _FakeClock:
+    """Injectable BountyManager clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = datetime.now(timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **delta: float) -> None:
+        self.now += timedelta(**delta)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -42,11 +63,9 @@ async def _seed_account(db: EconomyDatabase, username: str, balance: int) -> Non
 
 
 @pytest.mark.asyncio
-async def test_create_success(database: EconomyDatabase, mock_client: MagicMock):
+async def test_create_success(database: EconomyDatabase, mgr: BountyManager):
     """Debits creator, creates row, returns ID."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 1000)
+    await seed_account(database, "Alice", CH, 1000)
 
     result = await mgr.create_bounty("Alice", CH, 500, "Find the lost reel")
 
@@ -59,61 +78,47 @@ async def test_create_success(database: EconomyDatabase, mock_client: MagicMock)
     assert acc["balance"] == 500  # 1000 - 500
 
 
+@pytest.mark.parametrize(
+    ("balance", "amount", "expected"),
+    [
+        (50, 500, "Insufficient"),
+        (10000, 50, "Minimum"),  # below min_amount=100
+        (999999, 60000, "Maximum"),  # above max_amount=50000
+    ],
+    ids=["insufficient_funds", "below_min", "above_max"],
+)
 @pytest.mark.asyncio
-async def test_create_insufficient_funds(database: EconomyDatabase, mock_client: MagicMock):
-    """Low balance → rejected."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Broke", 50)
+async def test_create_rejected(
+    database: EconomyDatabase, mgr: BountyManager, balance: int, amount: int, expected: str
+):
+    """Unaffordable or out-of-range amounts → rejected without a bounty row."""
+    await seed_account(database, "Alice", CH, balance)
 
-    result = await mgr.create_bounty("Broke", CH, 500, "Can't afford this")
+    result = await mgr.create_bounty("Alice", CH, amount, "Rejected")
 
     assert result["success"] is False
-    assert "Insufficient" in result["message"]
+    assert expected in result["message"]
+    assert await database.get_open_bounties(CH) == []
 
 
 @pytest.mark.asyncio
-async def test_create_below_min(database: EconomyDatabase, mock_client: MagicMock):
-    """Amount < min → rejected."""
-    cfg = _make_bounty_config(min_amount=100)
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 10000)
-
-    result = await mgr.create_bounty("Alice", CH, 50, "Too small")
-
-    assert result["success"] is False
-    assert "Minimum" in result["message"]
-
-
-@pytest.mark.asyncio
-async def test_create_above_max(database: EconomyDatabase, mock_client: MagicMock):
-    """Amount > max → rejected."""
-    cfg = _make_bounty_config(max_amount=50000)
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 999999)
-
-    result = await mgr.create_bounty("Alice", CH, 60000, "Too big")
-
-    assert result["success"] is False
-    assert "Maximum" in result["message"]
-
+async def test_create_max_open_reached(database: EconomyDatabase, mgr: BountyManager):
+    """Already 3 open (max_open_per_user=3) → rejected."""
+    await seed_account(database, "Alice", CH, 100000)
+
+    # Only the open-bounty count matters here, so insert the 3 rows directly
+    seed_sql(
+        database,
+        "INSERT INTO bounties (creator, channel, description, amount) "
+        "VALUES (?, ?, 'Bounty 0', 100), (?, ?, 'Bounty 1', 100), (?, ?, 'Bounty 2', 100)",
+        ("Alice", CH) * 3,
+    )
 
-@pytest.mark.asyncio
-async def test_create_max_open_reached(database: EconomyDatabase, mock_client: MagicMock):
-    """Already 3 open → rejected."""
-    cfg = _make_bounty_config(max_open_per_user=3)
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 100000)
-
-    # Create 3 bounties
-    for i in range(3):
-        r = await mgr.create_bounty("Alice", CH, 100, f"Bounty {i}")
-        assert r["success"] is True
-
-    # 4th should fail
+    # 4th should fail, before any debit
     result = await mgr.create_bounty("Alice", CH, 100, "One too many")
     assert result["success"] is False
     assert "max" in result["message"].lower()
+    assert await database.get_balance("Alice", CH) == 100000
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -122,12 +127,12 @@ async def test_create_max_open_reached(database: EconomyDatabase, mock_client: M
 
 
 @pytest.mark.asyncio
-async def test_claim_success(database: EconomyDatabase, mock_client: MagicMock):
+async def test_claim_success(
+    database: EconomyDatabase, mock_kryten_client: MockKrytenClient, mgr: BountyManager
+):
     """Status → claimed, winner credited, both notified."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Creator", 5000)
-    await _seed_account(database, "Winner", 0)
+    await seed_account(database, "Creator", CH, 5000)
+    await seed_account(database, "Winner", CH, 0)
 
     create_result = await mgr.create_bounty("Creator", CH, 1000, "Find it")
     bounty_id = create_result["bounty_id"]
@@ -142,30 +147,25 @@ async def test_claim_success(database: EconomyDatabase, mock_client: MagicMock):
     assert acc["balance"] == 1000
 
     # Both should be PMed
-    assert mock_client.send_pm.call_count >= 2
+    assert len(mock_kryten_client.sent_pms) >= 2
 
     # Public announcement
-    mock_client.send_chat.assert_called()
+    assert mock_kryten_client.sent_chats
 
 
 @pytest.mark.asyncio
-async def test_claim_nonexistent(database: EconomyDatabase, mock_client: MagicMock):
+async def test_claim_nonexistent(mgr: BountyManager):
     """Invalid ID → error."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-
     reply = await mgr.claim_bounty(9999, CH, "Nobody", "Admin")
     assert "not found" in reply.lower()
 
 
 @pytest.mark.asyncio
-async def test_claim_already_claimed(database: EconomyDatabase, mock_client: MagicMock):
+async def test_claim_already_claimed(database: EconomyDatabase, mgr: BountyManager):
     """Double claim → rejected."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Creator", 5000)
-    await _seed_account(database, "W1", 0)
-    await _seed_account(database, "W2", 0)
+    await seed_account(database, "Creator", CH, 5000)
+    await seed_account(database, "W1", CH, 0)
+    await seed_account(database, "W2", CH, 0)
 
     r = await mgr.create_bounty("Creator", CH, 500, "Once only")
     bid = r["bounty_id"]
@@ -181,26 +181,17 @@ async def test_claim_already_claimed(database: EconomyDatabase, mock_client: Mag
 
 
 @pytest.mark.asyncio
-async def test_expire_refund(database: EconomyDatabase, mock_client: MagicMock):
+async def test_expire_refund(database: EconomyDatabase, mock_kryten_client: MockKrytenClient):
     """Past expiry → status expired, 50% refund."""
     cfg = _make_bounty_config(expiry_refund_percent=50)
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Creator", 5000)
+    clock = _FakeClock()
+    mgr = BountyManager(cfg, database, mock_kryten_client, logging.getLogger("test"), clock=clock)
+    await seed_account(database, "Creator", CH, 5000)
 
-    r = await mgr.create_bounty("Creator", CH, 1000, "Will expire")
-    bid = r["bounty_id"]
-
-    # Manually set the bounty to have already expired
-    import sqlite3
+    await mgr.create_bounty("Creator", CH, 1000, "Will expire")
 
-    past = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-    conn = sqlite3.connect(database._db_path)
-    conn.execute(
-        "UPDATE bounties SET expires_at = ? WHERE id = ?",
-        (past, bid),
-    )
-    conn.commit()
-    conn.close()
+    # Move the clock past the expiry window instead of rewriting the row
+    clock.advance(hours=cfg.bounties.default_expiry_hours + 1)
 
     count = await mgr.process_expired_bounties(CH)
     assert count == 1
@@ -210,32 +201,26 @@ async def test_expire_refund(database: EconomyDatabase, mock_client: MagicMock):
     assert acc["balance"] == 4000 + 500  # 5000 - 1000 + 500
 
     # PM sent about refund
-    pm_calls = [
-        c
-        for c in mock_client.send_pm.call_args_list
-        if "expired" in str(c).lower() or "refund" in str(c).lower()
-    ]
-    assert len(pm_calls) >= 1
+    assert any(
+        "expired" in msg.lower() or "refund" in msg.lower()
+        for _, _, msg in mock_kryten_client.sent_pms
+    )
 
 
 @pytest.mark.asyncio
-async def test_expire_no_refund_if_zero_percent(database: EconomyDatabase, mock_client: MagicMock):
+async def test_expire_no_refund_if_zero_percent(
+    database: EconomyDatabase, mock_kryten_client: MockKrytenClient
+):
     """Config refund 0% → no credit."""
     cfg = _make_bounty_config(expiry_refund_percent=0)
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Creator", 5000)
+    clock = _FakeClock()
+    mgr = BountyManager(cfg, database, mock_kryten_client, logging.getLogger("test"), clock=clock)
+    await seed_account(database, "Creator", CH, 5000)
 
-    r = await mgr.create_bounty("Creator", CH, 1000, "No refund")
-    bid = r["bounty_id"]
+    await mgr.create_bounty("Creator", CH, 1000, "No refund")
 
     # Force expiry
-    import sqlite3
-
-    past = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-    conn = sqlite3.connect(database._db_path)
-    conn.execute("UPDATE bounties SET expires_at = ? WHERE id = ?", (past, bid))
-    conn.commit()
-    conn.close()
+    clock.advance(hours=cfg.bounties.default_expiry_hours + 1)
 
     count = await mgr.process_expired_bounties(CH)
     assert count == 1
@@ -245,18 +230,33 @@ async def test_expire_no_refund_if_zero_percent(database: EconomyDatabase, mock_
     assert acc["balance"] == 4000
 
 
+@pytest.mark.asyncio
+async def test_not_expired_within_window(
+    database: EconomyDatabase, mock_kryten_client: MockKrytenClient
+):
+    """Clock still inside the expiry window → bounty stays open."""
+    cfg = _make_bounty_config()
+    clock = _FakeClock()
+    mgr = BountyManager(cfg, database, mock_kryten_client, logging.getLogger("test"), clock=clock)
+    await seed_account(database, "Creator", CH, 5000)
+
+    await mgr.create_bounty("Creator", CH, 1000, "Still open")
+    clock.advance(hours=cfg.bounties.default_expiry_hours - 1)
+
+    assert await mgr.process_expired_bounties(CH) == 0
+    assert len(await database.get_open_bounties(CH)) == 1
+
+
 # ═══════════════════════════════════════════════════════════════
 #  List / Announcement Tests
 # ═══════════════════════════════════════════════════════════════
 
 
 @pytest.mark.asyncio
-async def test_bounty_list_open_only(database: EconomyDatabase, mock_client: MagicMock):
+async def test_bounty_list_open_only(database: EconomyDatabase, mgr: BountyManager):
     """Only open bounties returned by get_open_bounties."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "A", 50000)
-    await _seed_account(database, "W", 0)
+    await seed_account(database, "A", CH, 50000)
+    await seed_account(database, "W", CH, 0)
 
     # Create 2, claim 1
     await mgr.create_bounty("A", CH, 200, "Open one")
@@ -269,14 +269,12 @@ async def test_bounty_list_open_only(database: EconomyDatabase, mock_client: Mag
 
 
 @pytest.mark.asyncio
-async def test_public_announcement_on_create(database: EconomyDatabase, mock_client: MagicMock):
+async def test_public_announcement_on_create(database: EconomyDatabase, mgr: BountyManager):
     """Chat message on creation (done by PM handler, but verify structure)."""
     # The public announcement on create is done in _cmd_bounty (PM handler),
     # so here we just verify that bounty_manager.create_bounty returns the
     # right data for the handler to announce.
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Alice", 5000)
+    await seed_account(database, "Alice", CH, 5000)
 
     result = await mgr.create_bounty("Alice", CH, 500, "Public bounty")
     assert result["success"] is True
@@ -286,19 +284,19 @@ async def test_public_announcement_on_create(database: EconomyDatabase, mock_cli
 
 
 @pytest.mark.asyncio
-async def test_public_announcement_on_claim(database: EconomyDatabase, mock_client: MagicMock):
+async def test_public_announcement_on_claim(
+    database: EconomyDatabase, mock_kryten_client: MockKrytenClient, mgr: BountyManager
+):
     """Chat message sent on claim."""
-    cfg = _make_bounty_config()
-    mgr = BountyManager(cfg, database, mock_client, logging.getLogger("test"))
-    await _seed_account(database, "Creator", 5000)
-    await _seed_account(database, "Winner", 0)
+    await seed_account(database, "Creator", CH, 5000)
+    await seed_account(database, "Winner", CH, 0)
 
     r = await mgr.create_bounty("Creator", CH, 500, "Claim me")
-    mock_client.send_chat.reset_mock()
+    mock_kryten_client.sent_chats.clear()
 
     await mgr.claim_bounty(r["bounty_id"], CH, "Winner", "Admin")
 
-    mock_client.send_chat.assert_called_once()
-    msg = mock_client.send_chat.call_args[0][1]
+    assert len(mock_kryten_client.sent_chats) == 1
+    _, msg = mock_kryten_client.sent_chats[0]
     assert "Winner" in msg
     assert "Claim me" in msg
@@ -14,10 +14,10 @@ from kryten_economy.presence_tracker import PresenceTracker
 
 @pytest.fixture
 def tracker(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ) -> PresenceTracker:
     return PresenceTracker(
-        config=sample_config,
+        config=shared_config,
         database=database,
         client=mock_client,
         logger=logging.getLogger("test.bridge"),
@@ -84,6 +84,29 @@ class TestBridgeBonus:
         await database.get_or_create_account("alice", "testchannel")
         await tracker._evaluate_bridge("alice", "testchannel", "2026-01-05")  # Mon W02
         await tracker._evaluate_bridge("alice", "testchannel", "2026-01-10")  # Sat W02
+        await tracker._drain_pm_tasks()
         mock_client.send_pm.assert_called()
         msg = mock_client.send_pm.call_args[0][2]
         assert "bridge" in msg.lower() or "500" in msg
+
+    async def test_claimed_week_served_from_cache(
+        self, tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """Once the week's state is known, repeat evaluations skip the DB read."""
+        await database.get_or_create_account("alice", "testchannel")
+        await tracker._evaluate_bridge("alice", "testchannel", "2026-01-05")  # Mon W02
+        await tracker._evaluate_bridge("alice", "testchannel", "2026-01-10")  # Sat W02
+
+        calls = 0
+        original = database.get_or_create_streak
+
+        async def counting(username: str, channel: str) -> dict:
+            nonlocal calls
+            calls += 1
+            return await original(username, channel)
+
+        database.get_or_create_streak = counting  # type: ignore[method-assign]
+        await tracker._evaluate_bridge("alice", "testchannel", "2026-01-11")  # Sun W02
+        await tracker._evaluate_bridge("alice", "testchannel", "2026-01-06")  # Tue W02
+        assert calls == 0
+        assert await database.get_balance("alice", "testchannel") == 500
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
+from conftest import seed_sql
 
 from kryten_economy.database import EconomyDatabase
 from kryten_economy.gambling_engine import GamblingEngine
@@ -19,26 +20,14 @@ async def _seed_account(
     balance: int = 5000,
 ) -> None:
     """Create account with generous balance and old enough age."""
-    await db.get_or_create_account(username, CH)
-    await db.credit(username, CH, balance - 100, tx_type="test", reason="seed")
-
-    import asyncio
-
-    loop = asyncio.get_running_loop()
+    # One INSERT on the pooled connection instead of create + credit + age update
     first_seen = datetime.now(timezone.utc) - timedelta(hours=2)
-
-    def _set():
-        conn = db._get_connection()
-        try:
-            conn.execute(
-                "UPDATE accounts SET first_seen = ? WHERE username = ? AND channel = ?",
-                (first_seen.isoformat(), username, CH),
-            )
-            conn.commit()
-        finally:
-            conn.close()
-
-    await loop.run_in_executor(None, _set)
+    seed_sql(
+        db,
+        "INSERT INTO accounts (username, channel, balance, lifetime_earned, first_seen) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (username, CH, balance - 100, balance - 100, first_seen.isoformat()),
+    )
 
 
 @pytest.mark.asyncio
@@ -58,42 +47,31 @@ async def test_create_challenge_success(
     assert bal_after == bal_before - 200
 
 
+@pytest.mark.parametrize(
+    ("target", "wager", "seed_balances", "expected"),
+    [
+        ("Alice", 200, {"Alice": 5000}, "yourself"),
+        # "IgnoredBot" is in config.ignored_users
+        ("IgnoredBot", 200, {"Alice": 5000}, "can't be challenged"),
+        ("Bob", 500, {"Alice": 5000, "Bob": 100}, "can't afford"),
+    ],
+    ids=["self", "ignored_user", "target_insufficient_balance"],
+)
 @pytest.mark.asyncio
-async def test_challenge_self_rejected(
+async def test_create_challenge_rejections(
     gambling_engine: GamblingEngine,
     database: EconomyDatabase,
+    target: str,
+    wager: int,
+    seed_balances: dict[str, int],
+    expected: str,
 ):
-    """Challenge self → error."""
-    await _seed_account(database, "Alice")
-
-    result = await gambling_engine.create_challenge("Alice", "Alice", CH, 200)
-    assert "yourself" in result.lower()
-
-
-@pytest.mark.asyncio
-async def test_challenge_ignored_user_rejected(
-    gambling_engine: GamblingEngine,
-    database: EconomyDatabase,
-):
-    """Challenge ignored user → error."""
-    await _seed_account(database, "Alice")
-    # "IgnoredBot" is in config.ignored_users
-
-    result = await gambling_engine.create_challenge("Alice", "IgnoredBot", CH, 200)
-    assert "can't be challenged" in result.lower()
-
-
-@pytest.mark.asyncio
-async def test_challenge_target_insufficient_balance(
-    gambling_engine: GamblingEngine,
-    database: EconomyDatabase,
-):
-    """Target can't afford → error."""
-    await _seed_account(database, "Alice")
-    await _seed_account(database, "Bob", balance=100)
+    """Invalid target or unaffordable wager → error."""
+    for username, balance in seed_balances.items():
+        await _seed_account(database, username, balance=balance)
 
-    result = await gambling_engine.create_challenge("Alice", "Bob", CH, 500)
-    assert "can't afford" in result.lower()
+    result = await gambling_engine.create_challenge("Alice", target, CH, wager)
+    assert expected in result.lower()
 
 
 @pytest.mark.asyncio
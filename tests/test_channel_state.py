@@ -43,6 +43,7 @@ def test_media_change_returns_previous(channel_state):
     assert prev is not None
     assert prev.title == "First"
     assert prev.media_id == "vid1"
+    assert not hasattr(prev, "__dict__")  # slots=True
 
 
 def test_media_change_resets_counters(channel_state):
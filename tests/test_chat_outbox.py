@@ -0,0 +1,88 @@
+"""Tests for ChatOutbox — paced, fire-and-forget PM/chat delivery."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from kryten_economy.chat_outbox import ChatOutbox
+from kryten_economy.config import OutboxConfig
+
+CH = "testchannel"
+
+
+def _make_outbox(mock_client: MagicMock, **kwargs) -> ChatOutbox:
+    return ChatOutbox(OutboxConfig(**kwargs), mock_client, logging.getLogger("test.outbox"))
+
+
+@pytest.mark.asyncio
+async def test_queue_pm_delivers_in_order(mock_client: MagicMock):
+    """Queued PMs and chat lines are delivered in FIFO order."""
+    outbox = _make_outbox(mock_client, max_per_second=1000.0)
+    outbox.queue_pm(CH, "Alice", "one")
+    outbox.queue_chat(CH, "two")
+    outbox.queue_pm(CH, "Bob", "three")
+
+    await outbox.join()
+
+    assert [c.args for c in mock_client.send_pm.call_args_list] == [
+        (CH, "Alice", "one"),
+        (CH, "Bob", "three"),
+    ]
+    mock_client.send_chat.assert_awaited_once_with(CH, "two")
+    await outbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_burst_then_paced(mock_client: MagicMock):
+    """Messages beyond the burst wait for the bucket to refill."""
+    outbox = _make_outbox(mock_client, max_per_second=20.0, burst=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(4):
+        outbox.queue_pm(CH, f"user{i}", "hi")
+
+    await outbox.join()
+
+    # Two go immediately, the other two need ~1/20 s each
+    assert loop.time() - start >= 0.09
+    assert mock_client.send_pm.await_count == 4
+    await outbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_failure_does_not_stop_worker(
+    mock_client: MagicMock, caplog: pytest.LogCaptureFixture
+):
+    """A failed send is logged as a warning and the next message still goes out."""
+    mock_client.send_pm = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+    outbox = _make_outbox(mock_client, max_per_second=1000.0)
+    outbox.queue_pm(CH, "Alice", "first")
+    outbox.queue_pm(CH, "Bob", "second")
+
+    with caplog.at_level(logging.WARNING, logger="test.outbox"):
+        await outbox.join()
+
+    assert mock_client.send_pm.await_count == 2
+    assert "Outbox send failed in testchannel (to Alice)" in caplog.text
+    await outbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_sends_held_and_drops_backlog(
+    mock_client: MagicMock, caplog: pytest.LogCaptureFixture
+):
+    """Stopping sends the message waiting on the bucket and drops the rest unpaced."""
+    outbox = _make_outbox(mock_client, max_per_second=0.001, burst=1)
+    for name in ("Alice", "Bob", "Carol"):
+        outbox.queue_pm(CH, name, "bye")
+    await asyncio.sleep(0)
+
+    with caplog.at_level(logging.WARNING, logger="test.outbox"):
+        await outbox.stop()
+
+    assert [c.args[1] for c in mock_client.send_pm.call_args_list] == ["Alice", "Bob"]
+    assert "1 undelivered message(s) dropped" in caplog.text
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 import yaml
@@ -30,15 +31,22 @@ class TestEconomyConfig:
         assert cfg.currency.name == "Z-Coin"
         assert cfg.bot.username == "ZCoinBot"
 
-    def test_full_config(self, sample_config_dict: dict):
+    def test_full_config(self, frozen_config_dict: MappingProxyType):
         """Full config dict should parse correctly."""
-        cfg = EconomyConfig(**sample_config_dict)
+        cfg = EconomyConfig(**frozen_config_dict)
         assert cfg.currency.symbol == "Z"
         assert cfg.onboarding.welcome_wallet == 100
         assert cfg.presence.base_rate_per_minute == 1
         assert len(cfg.channels) == 1
         assert cfg.channels[0].channel == "testchannel"
 
+    def test_frozen_config_dict_nested_read_only(self, frozen_config_dict: MappingProxyType):
+        """Session-shared config dict rejects writes to nested sections too."""
+        with pytest.raises(TypeError):
+            frozen_config_dict["presence"]["base_rate_per_minute"] = 99
+        with pytest.raises(AttributeError):
+            frozen_config_dict["channels"].append({})
+
     def test_defaults_applied(self):
         """Defaults should be applied for optional sections."""
         cfg = EconomyConfig(
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
+import math
 import sqlite3
+import time
+from typing import ClassVar
+from unittest.mock import patch
 
+import pytest
 
 from kryten_economy.database import EconomyDatabase
+from conftest import fetch_sql, seed_sql
 
 
 class TestInitialization:
@@ -24,6 +30,41 @@ class TestInitialization:
         account = await database.get_account("nobody", "ch")
         assert account is None
 
+    def test_connections_are_pooled(self, database: EconomyDatabase):
+        """close() should return a connection to the pool, rolling back open work."""
+        conn = database._get_connection()
+        conn.execute("INSERT INTO accounts (username, channel) VALUES ('ghost', 'ch1')")
+        conn.row_factory = None
+        conn.close()
+
+        reused = database._get_connection()
+        assert reused is conn
+        assert reused.row_factory is sqlite3.Row
+        assert reused.execute("SELECT COUNT(*) FROM accounts").fetchone()[0] == 0
+        reused.close()
+
+        database.close()
+        fresh = database._get_connection()
+        assert fresh is not conn
+        fresh.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_aggregate_reads_use_covering_indexes(self, database: EconomyDatabase):
+        """Per-user achievement aggregates should be answered from an index alone."""
+        conn = database._get_connection()
+        try:
+            for sql in database._ACHIEVEMENT_METRIC_SQL.values():
+                if "daily_activity" not in sql and "tip_history" not in sql:
+                    continue
+                plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", ("alice", "ch1")).fetchall()
+                assert "USING COVERING INDEX" in plan[0]["detail"], sql
+            assert conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+        finally:
+            conn.close()
+
 
 class TestAccountOperations:
     """Account CRUD operations."""
@@ -52,11 +93,60 @@ class TestAccountOperations:
         """get_balance should return 0 for nonexistent accounts."""
         assert await database.get_balance("nobody", "ch1") == 0
 
+    async def test_get_balances(self, database: EconomyDatabase):
+        """get_balances should read several users at once, 0 for missing ones."""
+        await database.credit("alice", "ch1", 30, "earn")
+        await database.credit("bob", "ch1", 70, "earn")
+        await database.credit("alice", "ch2", 999, "earn")
+        balances = await database.get_balances(["alice", "bob", "nobody"], "ch1")
+        assert balances == {"alice": 30, "bob": 70, "nobody": 0}
+
+    async def test_get_spend_context(self, database: EconomyDatabase):
+        """get_spend_context should return (balance, banned) or None."""
+        assert await database.get_spend_context("nobody", "ch1") is None
+        await database.get_or_create_account("alice", "ch1")
+        await database.credit("alice", "ch1", 40, "earn")
+        ctx = await database.get_spend_context("alice", "ch1")
+        assert ctx == (40, False)
+        assert ctx.balance == 40 and ctx.banned is False
+
+    async def test_get_achievement_metrics(self, database: EconomyDatabase):
+        """get_achievement_metrics should read every requested metric in one query."""
+        names = ["lifetime_earned", "unique_tip_recipients", "lifetime_messages", "bogus"]
+        assert await database.get_achievement_metrics("nobody", "ch1", names) == {
+            "unique_tip_recipients": 0,
+            "lifetime_messages": 0,
+        }
+        await database.get_or_create_account("alice", "ch1")
+        await database.credit("alice", "ch1", 40, "earn")
+        await database.record_tip("alice", "bob", "ch1", 5)
+        await database.record_tip("alice", "carol", "ch1", 5)
+        await database.record_tip("alice", "bob", "ch1", 5)
+        assert await database.get_achievement_metrics("alice", "ch1", names) == {
+            "lifetime_earned": 40,
+            "unique_tip_recipients": 2,
+            "lifetime_messages": 0,
+        }
+        assert await database.get_achievement_metrics("alice", "ch1", []) == {}
+
     async def test_update_last_seen(self, database: EconomyDatabase):
         """update_last_seen should not error on existing account."""
         await database.get_or_create_account("alice", "ch1")
         await database.update_last_seen("alice", "ch1")
 
+    async def test_bulk_update_last_seen(self, database: EconomyDatabase):
+        """bulk_update_last_seen should stamp every listed account."""
+        await database.get_or_create_account("alice", "ch1")
+        await database.get_or_create_account("bob", "ch1")
+        await database.bulk_update_last_seen([("alice", "ch1"), ("bob", "ch1")])
+        for name in ("alice", "bob"):
+            acct = await database.get_account(name, "ch1")
+            assert acct["last_seen"] is not None
+
+    async def test_bulk_update_last_seen_empty(self, database: EconomyDatabase):
+        """An empty batch should be a no-op."""
+        await database.bulk_update_last_seen([])
+
     async def test_update_last_active(self, database: EconomyDatabase):
         """update_last_active should not error on existing account."""
         await database.get_or_create_account("alice", "ch1")
@@ -78,6 +168,16 @@ class TestBalanceOperations:
         new_bal = await database.credit("newuser", "ch1", 50, "earn")
         assert new_bal == 50
 
+    async def test_credit_existing_account_accumulates(self, database: EconomyDatabase):
+        """Repeat credits should add to both balance and lifetime_earned."""
+        await database.get_or_create_account("alice", "ch1")
+        assert await database.credit("alice", "ch1", 30, "earn") == 30
+        assert await database.credit("alice", "ch1", 12, "earn") == 42
+        acct = await database.get_account("alice", "ch1")
+        assert acct["balance"] == 42
+        assert acct["lifetime_earned"] == 42
+        assert acct["first_seen"] is not None
+
     async def test_credit_logs_transaction(self, database: EconomyDatabase):
         """credit() should log a transaction."""
         await database.credit(
@@ -128,6 +228,81 @@ class TestBalanceOperations:
         assert await database.get_balance("alice", "ch1") == 60
 
 
+class TestCreditBatch:
+    """credit_batch mirrors credit() for many rows in one transaction."""
+
+    async def test_credit_batch(self, database: EconomyDatabase):
+        """Balances, lifetime and transaction log should match per-row credits."""
+        await database.get_or_create_account("alice", "ch1")
+        await database.credit_batch(
+            "ch1",
+            [
+                ("alice", 50, "rain", "rain.ambient", "Rain"),
+                ("newbie", 25, "rain", "rain.ambient", "Rain"),
+            ],
+        )
+        alice = await database.get_account("alice", "ch1")
+        assert alice["balance"] == 50
+        assert alice["lifetime_earned"] == 50
+        assert await database.get_balance("newbie", "ch1") == 25
+        txs = await database.get_recent_transactions("newbie", "ch1")
+        assert txs[0]["type"] == "rain"
+        assert txs[0]["trigger_id"] == "rain.ambient"
+
+    async def test_credit_batch_empty(self, database: EconomyDatabase):
+        """An empty batch should be a no-op."""
+        await database.credit_batch("ch1", [])
+
+
+class TestBalanceMaintenanceBatch:
+    """Interest/decay are applied set-wise but must match the per-account formula."""
+
+    _BALANCES: ClassVar[dict[str, int]] = {"a": 99, "b": 100, "c": 1234, "d": 9999, "e": 250_000}
+
+    async def _seed(self, database: EconomyDatabase) -> None:
+        await database.credit_batch(
+            "ch1", [(u, bal, "earn", None, None) for u, bal in self._BALANCES.items()]
+        )
+        await database.credit("other", "ch2", 50_000, "earn")
+
+    async def test_interest(self, database: EconomyDatabase):
+        """Floored, capped interest only for balances at or above the minimum."""
+        await self._seed(database)
+        total = await database.apply_interest_batch("ch1", 0.013, 100, 100)
+
+        expected = {
+            u: min(math.floor(bal * 0.013), 100) if bal >= 100 else 0
+            for u, bal in self._BALANCES.items()
+        }
+        assert total == sum(expected.values())
+        balances = await database.get_balances(list(self._BALANCES), "ch1")
+        assert balances == {u: bal + expected[u] for u, bal in self._BALANCES.items()}
+        assert await database.get_balance("other", "ch2") == 50_000
+        tx = fetch_sql(
+            database,
+            "SELECT amount, trigger_id FROM transactions WHERE username = 'e' AND type = 'interest'",
+        )
+        assert tuple(tx) == (100, "maintenance.interest")
+
+    async def test_decay(self, database: EconomyDatabase):
+        """Floored decay only for balances at or above the exemption threshold."""
+        await self._seed(database)
+        total = await database.apply_decay_batch("ch1", 0.007, 1000)
+
+        expected = {
+            u: math.floor(bal * 0.007) if bal >= 1000 else 0 for u, bal in self._BALANCES.items()
+        }
+        assert total == sum(expected.values())
+        balances = await database.get_balances(list(self._BALANCES), "ch1")
+        assert balances == {u: bal - expected[u] for u, bal in self._BALANCES.items()}
+        account = await database.get_account("d", "ch1")
+        assert account["lifetime_spent"] == expected["d"]
+        tx = fetch_sql(
+            database, "SELECT amount FROM transactions WHERE username = 'd' AND type = 'decay'"
+        )
+        assert tx[0] == -expected["d"]
+
+
 class TestDailyActivity:
     """Daily activity tracking."""
 
@@ -161,6 +336,127 @@ class TestDailyActivity:
         assert row["z_earned"] == 15
 
 
+class TestBanCache:
+    """Per-channel cached ban lists."""
+
+    async def test_ban_and_unban_refresh_cache(self, database: EconomyDatabase):
+        """ban_user/unban_user should be visible to the very next is_banned."""
+        assert not await database.is_banned("mallory", "ch1")
+        await database.ban_user("mallory", "ch1", "admin")
+        assert await database.is_banned("mallory", "ch1")
+        assert not await database.is_banned("mallory", "ch2")
+        await database.unban_user("mallory", "ch1")
+        assert not await database.is_banned("mallory", "ch1")
+
+    async def test_external_write_seen_after_ttl(self, database: EconomyDatabase):
+        """Writes that bypass ban_user are picked up once the cache expires."""
+        assert not await database.is_banned("mallory", "ch1")
+        seed_sql(
+            database,
+            "INSERT INTO banned_users (username, channel, banned_by) VALUES ('mallory', 'ch1', 'x')",
+        )
+        assert not await database.is_banned("mallory", "ch1")  # still cached
+        later = time.monotonic() + database._BAN_CACHE_TTL + 1
+        with patch("kryten_economy.database.time.monotonic", return_value=later):
+            assert await database.is_banned("mallory", "ch1")
+
+
+class TestTriggerAnalytics:
+    """Trigger analytics recording."""
+
+    async def test_record_trigger_analytics_batch(self, database: EconomyDatabase):
+        """A batch should match recording each hit individually."""
+        await database.record_trigger_analytics_batch(
+            [
+                ("ch1", "chat.long_message", "2026-01-15", 5),
+                ("ch1", "presence.base", "2026-01-15", 10),
+                ("ch1", "presence.base", "2026-01-15", 7),
+            ]
+        )
+        await database.record_trigger_analytics("ch1", "presence.base", "2026-01-15", 3)
+        await database.record_trigger_analytics_batch([])
+        rows = {
+            r["trigger_id"]: (r["hit_count"], r["total_z_awarded"])
+            for r in await database.get_trigger_analytics("ch1", "2026-01-15")
+        }
+        assert rows == {"chat.long_message": (1, 5), "presence.base": (3, 20)}
+
+
+class TestBulkPrefetch:
+    """Batched streak / milestone reads used by the presence tick."""
+
+    async def test_bulk_streaks_creates_and_keys_rows(self, database: EconomyDatabase):
+        """Missing rows are created; results are keyed by (username, channel)."""
+        await database.get_or_create_streak("alice", "ch1")
+        await database.update_streak("alice", "ch1", 3, 4, "2026-01-01")
+        rows = await database.bulk_get_or_create_streaks([("alice", "ch1"), ("Bob", "ch1")])
+        assert rows[("alice", "ch1")]["current_daily_streak"] == 3
+        assert rows[("Bob", "ch1")]["current_daily_streak"] == 0
+
+    async def test_bulk_milestones_scoped_to_date(self, database: EconomyDatabase):
+        """Only the requested date's milestone rows are returned."""
+        await database.get_or_create_hourly_milestones("alice", "ch1", "2026-01-01")
+        await database.mark_hourly_milestone("alice", "ch1", "2026-01-01", 1)
+        rows = await database.bulk_get_or_create_hourly_milestones([("alice", "ch1")], "2026-01-02")
+        assert rows[("alice", "ch1")]["date"] == "2026-01-02"
+        assert rows[("alice", "ch1")]["hours_1"] == 0
+
+    async def test_bulk_empty(self, database: EconomyDatabase):
+        """Empty batches should return empty dicts without touching the DB."""
+        assert await database.bulk_get_or_create_streaks([]) == {}
+        assert await database.bulk_get_or_create_hourly_milestones([], "2026-01-01") == {}
+
+
+class TestBulkPresenceTick:
+    """Single-transaction presence tick writes."""
+
+    async def test_credits_and_records_daily_activity(self, database: EconomyDatabase):
+        """Each user gets the credit, one minute, and the Z in daily_activity."""
+        await database.bulk_presence_tick([("alice", "ch1"), ("bob", "ch1")], 2, "2026-01-01")
+        for name in ("alice", "bob"):
+            acct = await database.get_account(name, "ch1")
+            assert acct["balance"] == 2
+            assert acct["lifetime_earned"] == 2
+            assert acct["last_seen"] is not None
+            assert await database.get_daily_minutes_present(name, "ch1", "2026-01-01") == 1
+        txs = await database.get_recent_transactions("alice", "ch1")
+        assert txs[0]["trigger_id"] == "presence.base"
+
+    async def test_zero_amount_only_stamps_last_seen(self, database: EconomyDatabase):
+        """With nothing to earn, balances and daily minutes stay unchanged."""
+        await database.get_or_create_account("alice", "ch1")
+        await database.bulk_presence_tick([("alice", "ch1")], 0, "2026-01-01")
+        assert await database.get_balance("alice", "ch1") == 0
+        assert await database.get_daily_minutes_present("alice", "ch1", "2026-01-01") == 0
+
+    async def test_returns_new_lifetimes(self, database: EconomyDatabase):
+        """The tick reports each user's post-credit lifetime_earned."""
+        await database.credit("alice", "ch1", 50, "earn")
+        lifetimes = await database.bulk_presence_tick(
+            [("alice", "ch1"), ("bob", "ch1")], 3, "2026-01-01"
+        )
+        assert lifetimes == {("alice", "ch1"): 53, ("bob", "ch1"): 3}
+
+
+class TestAtomicPromote:
+    """Conditional rank update that returns quiet flag and lifetime."""
+
+    async def test_promotes_once(self, database: EconomyDatabase):
+        """First call changes the rank; repeating the same rank is a no-op."""
+        await database.credit("alice", "ch1", 1500, "earn")
+        await database.set_quiet_mode("alice", "ch1", True)
+
+        row = await database.atomic_promote("alice", "ch1", "Grip")
+        assert row == {"quiet_mode": 1, "lifetime_earned": 1500}
+        assert (await database.get_account("alice", "ch1"))["rank_name"] == "Grip"
+
+        assert await database.atomic_promote("alice", "ch1", "Grip") is None
+
+    async def test_missing_account(self, database: EconomyDatabase):
+        """No account means nothing to promote."""
+        assert await database.atomic_promote("ghost", "ch1", "Grip") is None
+
+
 class TestPopulationQueries:
     """Population and circulation queries."""
 
@@ -183,6 +479,30 @@ class TestPopulationQueries:
         assert await database.get_account_count("ch1") == 2
         assert await database.get_account_count("ch2") == 1
 
+    async def test_get_economy_overview(self, database: EconomyDatabase):
+        """The one-statement overview should agree with the individual queries."""
+        for name, amount in (("alice", 100), ("bob", 200), ("carol", 50), ("dave", 75)):
+            await database.credit(name, "ch1", amount, "earn")
+        await database.credit("eve", "ch2", 999, "earn")
+        date = "2026-01-15"
+        await database.increment_daily_z_earned("alice", "ch1", date, 40)
+        await database.increment_daily_gambled("bob", "ch1", date, 30, 45)
+
+        overview = await database.get_economy_overview("ch1", date)
+        assert overview == {
+            "accounts": await database.get_all_accounts_count("ch1"),
+            "circulation": await database.get_total_circulation("ch1"),
+            "median_balance": await database.get_median_balance("ch1"),
+            "active_today": await database.get_active_economy_users_today("ch1", date),
+            **await database.get_daily_totals("ch1", date),
+        }
+        assert overview["median_balance"] == 87
+        assert overview["active_today"] == 1
+
+        await database.credit("erin", "ch1", 10, "earn")
+        assert (await database.get_economy_overview("ch1", date))["median_balance"] == 75
+        assert (await database.get_economy_overview("empty", date))["median_balance"] == 0
+
 
 class TestWelcomeWallet:
     """Welcome wallet claiming."""
@@ -479,3 +479,77 @@ async def test_narrator_llm_fallback_on_failure(gambling_engine: GamblingEngine)
     result = gambling_engine._narrator.get_scenario(["Alice"])
     assert isinstance(result, str)
     assert len(result) > 5
+
+
+# ══════════════════════════════════════════════════════════════
+#  Scheduler gambling tick
+# ══════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_gambling_tick_cadence(sample_config, database: EconomyDatabase, mock_client):
+    """Heists are checked every tick; challenges expire every sixth tick."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from kryten_economy.scheduler import Scheduler
+
+    sample_config.gambling.heist.enabled = True
+    engine = MagicMock()
+    engine.get_active_heist.return_value = None
+    engine.cleanup_expired_challenges = AsyncMock(return_value=[])
+    scheduler = Scheduler(
+        config=sample_config,
+        database=database,
+        presence_tracker=MagicMock(),
+        client=mock_client,
+        gambling_engine=engine,
+    )
+    now = datetime.now(timezone.utc)
+
+    for tick in range(1, 6):
+        await scheduler._run_gambling_tick(tick, now)
+    assert engine.get_active_heist.call_count == 5
+    engine.cleanup_expired_challenges.assert_not_awaited()
+
+    await scheduler._run_gambling_tick(6, now)
+    assert engine.get_active_heist.call_count == 6
+    engine.cleanup_expired_challenges.assert_awaited_once_with(CH)
+
+
+@pytest.mark.asyncio
+async def test_heist_reveal_runs_off_the_tick(
+    sample_config, database: EconomyDatabase, mock_client
+):
+    """A resolved heist's paced reveal doesn't hold up challenge expiry on the same tick."""
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+
+    from kryten_economy.scheduler import Scheduler
+
+    sample_config.gambling.heist.enabled = True
+    sample_config.gambling.heist.announce_public = True
+    now = datetime.now(timezone.utc)
+    engine = MagicMock()
+    engine.get_active_heist.return_value = SimpleNamespace(
+        expires_at=now - timedelta(seconds=1), participants={"Alice": 100}
+    )
+    engine.resolve_heist = AsyncMock(
+        return_value=(["scenario", "outcome"], ["Alice"], {"Alice": "you won"})
+    )
+    engine.cleanup_expired_challenges = AsyncMock(return_value=[])
+    scheduler = Scheduler(
+        config=sample_config,
+        database=database,
+        presence_tracker=MagicMock(),
+        client=mock_client,
+        gambling_engine=engine,
+    )
+
+    await asyncio.wait_for(scheduler._run_gambling_tick(6, now), timeout=1)
+    await asyncio.sleep(0)  # let the spawned reveal post its first line
+
+    engine.cleanup_expired_challenges.assert_awaited_once_with(CH)
+    mock_client.send_chat.assert_awaited_once_with(CH, "scenario")  # then the 6 s pause
+    mock_client.send_pm.assert_not_awaited()
+    await scheduler.stop()
@@ -64,6 +64,7 @@ class TestHourlyMilestones:
         """Milestone should send a PM notification."""
         await database.get_or_create_account("alice", "testchannel")
         await tracker._check_hourly_milestones("alice", "testchannel", "2026-01-01", 60)
+        await tracker._drain_pm_tasks()
         mock_client.send_pm.assert_called()
         msg = mock_client.send_pm.call_args[0][2]
         assert "milestone" in msg.lower()
@@ -6,6 +6,7 @@ join → earn → chat → gamble → queue → tip → rank up → achievement
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
@@ -280,6 +281,25 @@ class TestMockKrytenClientBehavior:
         assert len(received) == 1
         assert received[0] is ev
 
+    @pytest.mark.asyncio
+    async def test_fire_event_runs_handlers_concurrently(self, mock_kryten_client) -> None:
+        """Multiple handlers for one event run concurrently."""
+        started = asyncio.Event()
+        order = []
+
+        @mock_kryten_client.on("chatmsg")
+        async def waiter(event):
+            await started.wait()
+            order.append("waiter")
+
+        @mock_kryten_client.on("chatmsg")
+        async def starter(event):
+            order.append("starter")
+            started.set()
+
+        await asyncio.wait_for(mock_kryten_client.fire_event("chatmsg", MagicMock()), 1.0)
+        assert order == ["starter", "waiter"]
+
     @pytest.mark.asyncio
     async def test_kv_store(self, mock_kryten_client) -> None:
         """KV get/put work correctly."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -60,3 +61,29 @@ class TestNightWatch:
     async def test_multiplier_applied_in_config(self, night_config: EconomyConfig):
         """Multiplier val should match config."""
         assert night_config.presence.night_watch.multiplier == 2.0
+
+    async def test_tick_applies_multiplier_in_window(
+        self, night_tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """A tick inside night-watch hours should credit the multiplied rate."""
+        await night_tracker.handle_user_join("alice", "testchannel")
+        before = await database.get_balance("alice", "testchannel")
+        await night_tracker._run_tick(datetime(2026, 1, 5, 3, 0, tzinfo=UTC))
+        assert await database.get_balance("alice", "testchannel") == before + 2
+
+    async def test_tick_base_rate_outside_window(
+        self, night_tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """A tick outside night-watch hours should credit the base rate."""
+        await night_tracker.handle_user_join("alice", "testchannel")
+        before = await database.get_balance("alice", "testchannel")
+        await night_tracker._run_tick(datetime(2026, 1, 5, 12, 0, tzinfo=UTC))
+        assert await database.get_balance("alice", "testchannel") == before + 1
+
+    def test_update_config_refreshes_tick_features(
+        self, night_tracker: PresenceTracker, sample_config: EconomyConfig
+    ):
+        """Hot-swapping config should re-resolve which tick sections run."""
+        assert night_tracker._has_night_watch is True
+        night_tracker.update_config(sample_config)
+        assert night_tracker._has_night_watch is False
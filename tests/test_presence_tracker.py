@@ -96,6 +96,41 @@ class TestSessionQueries:
         """is_connected should return False for non-connected user."""
         assert not tracker.is_connected("Ghost", "testchannel")
 
+    async def test_session_caches_lowercase_name(self, tracker: PresenceTracker):
+        """Sessions should carry the lowercase username used as their key."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        session = tracker._sessions[("alice", "testchannel")]
+        assert session.username == "Alice"
+        assert session.username_lower == "alice"
+
+    async def test_session_is_slotted(self, tracker: PresenceTracker):
+        """UserSession should not carry a per-instance __dict__."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        session = tracker._sessions[("alice", "testchannel")]
+        assert not hasattr(session, "__dict__")
+        assert session.current_date == now_utc().strftime("%Y-%m-%d")
+
+    async def test_get_admin_users(self, tracker: PresenceTracker):
+        """get_admin_users should filter present users by tracked CyTube rank."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        await tracker.handle_user_join("Bob", "testchannel")
+        tracker.update_user_rank("testchannel", "ALICE", 4)
+        tracker.update_user_rank("testchannel", "Bob", 1)
+        assert tracker.get_admin_users("testchannel", 3) == ["Alice"]
+
+    async def test_rank_and_session_share_key_layout(self, tracker: PresenceTracker):
+        """Rank entries should use the (username_lower, channel) session key."""
+        await tracker.seed_initial_users("testchannel", [{"name": "Alice", "rank": 3}])
+        key = ("alice", "testchannel")
+        assert key in tracker._sessions
+        assert tracker._user_ranks[key] == 3
+
+    async def test_lowercase_cache_is_bounded(self, tracker: PresenceTracker):
+        """The username lowercase cache should never exceed its size cap."""
+        for i in range(tracker._LOWER_CACHE_SIZE + 10):
+            tracker.is_connected(f"User{i}", "testchannel")
+        assert len(tracker._lower_cache) == tracker._LOWER_CACHE_SIZE
+
 
 class TestDebounce:
     """Join debounce logic."""
@@ -155,6 +190,111 @@ class TestWelcomeWallet:
         assert second_balance == first_balance  # No double wallet
 
 
+class TestDepartureExpiry:
+    """Stale departure records are swept from the front of the map."""
+
+    async def test_expire_departures_drops_old_entries(self, tracker: PresenceTracker):
+        """Entries older than the sweep horizon should be removed, newer kept."""
+        now = now_utc()
+        tracker._last_departure[("old", "testchannel")] = now - timedelta(days=1)
+        tracker._last_departure[("recent", "testchannel")] = now - timedelta(minutes=1)
+        tracker._expire_departures(now)
+        assert ("old", "testchannel") not in tracker._last_departure
+        assert ("recent", "testchannel") in tracker._last_departure
+
+    async def test_expire_keeps_greeting_window(self, tracker: PresenceTracker):
+        """Records inside greeting_absence_minutes must survive the sweep."""
+        now = now_utc()
+        minutes = tracker._presence_config.greeting_absence_minutes - 1
+        tracker._last_departure[("alice", "testchannel")] = now - timedelta(minutes=minutes)
+        tracker._expire_departures(now)
+        assert not tracker.was_absent_longer_than("alice", "testchannel", minutes + 1)
+
+    async def test_leave_moves_departure_to_end(self, tracker: PresenceTracker):
+        """A repeated leave should re-order the record as the newest."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        await tracker.handle_user_join("Bob", "testchannel")
+        await tracker.handle_user_leave("Alice", "testchannel")
+        await tracker.handle_user_leave("Bob", "testchannel")
+        await tracker.handle_user_leave("Alice", "testchannel")
+        assert list(tracker._last_departure)[-1] == ("alice", "testchannel")
+
+    async def test_departure_drops_rank_cache_entry(
+        self, tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """Finalizing a departure forgets the user's cached rank threshold."""
+        rank_engine = MagicMock()
+        tracker._rank_engine = rank_engine
+        await tracker.handle_user_join("Alice", "testchannel")
+        await tracker._finalize_departure("alice", "testchannel")
+        rank_engine.invalidate.assert_called_once_with("Alice", "testchannel")
+
+
+class TestPresenceTick:
+    """A single tick over connected sessions."""
+
+    async def test_tick_credits_presence(self, tracker: PresenceTracker, database: EconomyDatabase):
+        """Each connected user should earn the base rate and a minute of dwell."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        before = await database.get_balance("Alice", "testchannel")
+        await tracker._run_tick(now_utc())
+        assert await database.get_balance("Alice", "testchannel") == before + 1
+        assert tracker._sessions[("alice", "testchannel")].cumulative_minutes_today == 1
+
+    async def test_tick_accumulates_metrics(self, tracker: PresenceTracker):
+        """metrics_z_earned should grow by the total credited in the tick."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        await tracker.handle_user_join("Bob", "testchannel")
+        await tracker._run_tick(now_utc())
+        assert tracker.metrics_z_earned == 2
+
+    async def test_failed_batch_leaves_sessions_untouched(
+        self, tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """If the tick batch fails, in-memory minutes should not advance."""
+        await tracker.handle_user_join("Alice", "testchannel")
+
+        async def boom(*args, **kwargs) -> None:
+            raise RuntimeError("db down")
+
+        database.bulk_presence_tick = boom  # type: ignore[method-assign]
+        await tracker._run_tick(now_utc())
+        assert tracker._sessions[("alice", "testchannel")].cumulative_minutes_today == 0
+        assert tracker.metrics_z_earned == 0
+
+    async def test_tick_awards_prefetched_milestone_once(
+        self, tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """Crossing the 1h mark should award the milestone on that tick only."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        session = tracker._sessions[("alice", "testchannel")]
+        now = now_utc()
+        session.current_date = now.strftime("%Y-%m-%d")
+        session.cumulative_minutes_today = 59
+        session._streak_checked_today = True
+        before = await database.get_balance("Alice", "testchannel")
+
+        await tracker._run_tick(now)
+        await tracker._run_tick(now)
+        # Two presence credits plus the 1-hour milestone (10)
+        assert await database.get_balance("Alice", "testchannel") == before + 2 + 10
+
+    async def test_tick_evaluates_streak_at_threshold(
+        self, tracker: PresenceTracker, database: EconomyDatabase
+    ):
+        """Reaching min_presence_minutes should record today's streak."""
+        await tracker.handle_user_join("Alice", "testchannel")
+        session = tracker._sessions[("alice", "testchannel")]
+        now = now_utc()
+        session.current_date = now.strftime("%Y-%m-%d")
+        session.cumulative_minutes_today = tracker._streak_config.daily.min_presence_minutes - 1
+
+        await tracker._run_tick(now)
+        assert session._streak_checked_today is True
+        streak = await database.get_or_create_streak("Alice", "testchannel")
+        assert streak["last_streak_date"] == now.strftime("%Y-%m-%d")
+
+
 class TestStartStop:
     """Tracker lifecycle."""
 
@@ -177,6 +317,28 @@ class TestStartStop:
         assert acct["last_seen"] is not None
 
 
+class TestTriggerPmQueue:
+    """Fire-and-forget trigger PMs."""
+
+    async def test_queued_pms_sent_in_order(self, tracker: PresenceTracker, mock_client: MagicMock):
+        """PMs queued for one user should be delivered in call order."""
+        tracker._queue_trigger_pm("testchannel", "Alice", "first")
+        tracker._queue_trigger_pm("testchannel", "Alice", "second")
+        await tracker._drain_pm_tasks()
+        msgs = [c[0][2] for c in mock_client.send_pm.call_args_list]
+        assert msgs[0].startswith("first")
+        assert msgs[1].startswith("second")
+        assert not tracker._pm_queues
+
+    async def test_per_user_queue_is_capped(self, tracker: PresenceTracker, mock_client: MagicMock):
+        """Messages beyond the per-user cap should be dropped."""
+        for i in range(tracker._PM_QUEUE_MAX + 5):
+            tracker._queue_trigger_pm("testchannel", "Alice", f"msg {i}")
+        await tracker._drain_pm_tasks()
+        # One in flight plus a full queue behind it
+        assert mock_client.send_pm.call_count == tracker._PM_QUEUE_MAX + 1
+
+
 class TestCumulativeMinutesRestoration:
     """cumulative_minutes_today should be restored from DB on session creation."""
 
@@ -330,7 +330,7 @@ async def test_playnext_uses_position(
 
     # Step 2: confirm
     pending = handler._pending_confirm.pop("alice")
-    assert pending["queue_type"] == "queue"
+    assert pending.queue_type == "queue"
     resp = await handler._execute_confirmed_queue("Alice", CH, pending)
     assert "queued" in resp.lower()
 
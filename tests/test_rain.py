@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,8 +54,7 @@ class TestRain:
         await presence.handle_user_join("Alice", "testchannel")
         await presence.handle_user_join("Bob", "testchannel")
 
-        with patch("kryten_economy.scheduler.random") as mock_random:
-            mock_random.randint.return_value = 15
+        with patch.object(scheduler._rng, "randint", return_value=15):
             await scheduler._execute_rain()
 
         alice_bal = await database.get_balance("Alice", "testchannel")
@@ -74,8 +75,7 @@ class TestRain:
         await presence.handle_user_join("Alice", "testchannel")
         mock_client.send_pm.reset_mock()
 
-        with patch("kryten_economy.scheduler.random") as mock_random:
-            mock_random.randint.return_value = 10
+        with patch.object(scheduler._rng, "randint", return_value=10):
             await scheduler._execute_rain()
 
         # PM for rain notification (plus any from join)
@@ -93,8 +93,7 @@ class TestRain:
     ):
         """Rain should log transactions with type 'rain'."""
         await presence.handle_user_join("Alice", "testchannel")
-        with patch("kryten_economy.scheduler.random") as mock_random:
-            mock_random.randint.return_value = 20
+        with patch.object(scheduler._rng, "randint", return_value=20):
             await scheduler._execute_rain()
 
         import sqlite3
@@ -131,10 +130,157 @@ class TestRain:
             multiplier_engine=mock_multiplier,
         )
 
-        with patch("kryten_economy.scheduler.random") as mock_random:
-            mock_random.randint.return_value = 10
+        with patch.object(scheduler._rng, "randint", return_value=10):
             await scheduler._execute_rain()
 
         alice_bal = await database.get_balance("Alice", "testchannel")
         # Welcome wallet (100) + rain (10 * 3)
         assert alice_bal == 130
+
+    async def test_rain_pm_failure_does_not_block_credit(
+        self,
+        scheduler: Scheduler,
+        presence: PresenceTracker,
+        database: EconomyDatabase,
+        mock_client: MagicMock,
+    ):
+        """A failed rain PM should not stop other users from being credited."""
+        await presence.handle_user_join("Alice", "testchannel")
+        await presence.handle_user_join("Bob", "testchannel")
+        mock_client.send_pm.side_effect = RuntimeError("nats down")
+
+        with patch.object(scheduler._rng, "randint", return_value=5):
+            await scheduler._execute_rain()
+
+        assert await database.get_balance("Alice", "testchannel") == 105
+        assert await database.get_balance("Bob", "testchannel") == 105
+
+    async def test_rain_pms_sent_one_at_a_time(
+        self,
+        scheduler: Scheduler,
+        presence: PresenceTracker,
+        mock_client: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Without an outbox, rain PMs go out sequentially and failures are warned."""
+        for name in ("Alice", "Bob", "Carol"):
+            await presence.handle_user_join(name, "testchannel")
+        mock_client.send_pm.reset_mock()
+        in_flight = peak = 0
+
+        async def send_pm(channel: str, username: str, msg: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if username == "Bob":
+                raise RuntimeError("nats down")
+
+        mock_client.send_pm.side_effect = send_pm
+        with (
+            patch.object(scheduler._rng, "randint", return_value=5),
+            caplog.at_level(logging.WARNING, logger="test.scheduler"),
+        ):
+            await scheduler._execute_rain()
+
+        rain_pms = [c for c in mock_client.send_pm.call_args_list if "Rain" in c.args[2]]
+        assert len(rain_pms) == 3
+        assert peak == 1
+        assert "Rain PM failed for 1/3 users in testchannel" in caplog.text
+
+    async def test_rain_channel_failure_isolated(
+        self,
+        scheduler: Scheduler,
+        presence: PresenceTracker,
+        database: EconomyDatabase,
+    ):
+        """One channel's DB failure should not stop rain in the other channels."""
+        from conftest import make_config_dict
+
+        scheduler._config = EconomyConfig(
+            **make_config_dict(
+                channels=[
+                    {"domain": "cytu.be", "channel": "brokenchannel"},
+                    {"domain": "cytu.be", "channel": "testchannel"},
+                ]
+            )
+        )
+        await presence.handle_user_join("Alice", "testchannel")
+        await presence.handle_user_join("Bob", "brokenchannel")
+
+        real_credit_batch = database.credit_batch
+
+        async def flaky_credit_batch(channel, rows):
+            if channel == "brokenchannel":
+                raise RuntimeError("disk I/O error")
+            return await real_credit_batch(channel, rows)
+
+        database.credit_batch = flaky_credit_batch  # type: ignore[method-assign]
+
+        with patch.object(scheduler._rng, "randint", return_value=7):
+            await scheduler._execute_rain()
+
+        assert await database.get_balance("Alice", "testchannel") == 107
+
+    async def test_rain_pms_go_through_outbox(
+        self,
+        sample_config: EconomyConfig,
+        database: EconomyDatabase,
+        presence: PresenceTracker,
+        mock_client: MagicMock,
+    ):
+        """With an outbox wired, rain queues its PMs instead of sending them inline."""
+        await presence.handle_user_join("Alice", "testchannel")
+        await presence.handle_user_join("Bob", "testchannel")
+        outbox = MagicMock()
+        scheduler = Scheduler(
+            config=sample_config,
+            database=database,
+            presence_tracker=presence,
+            client=mock_client,
+            logger=logging.getLogger("test.scheduler"),
+            chat_outbox=outbox,
+        )
+        mock_client.send_pm.reset_mock()
+
+        with patch.object(scheduler._rng, "randint", return_value=10):
+            await scheduler._execute_rain()
+
+        queued = {c.args[1] for c in outbox.queue_pm.call_args_list}
+        assert queued == {"Alice", "Bob"}
+        assert not [c for c in mock_client.send_pm.call_args_list if "Rain" in str(c)]
+        assert await database.get_balance("Alice", "testchannel") == 110
+
+    async def test_rain_uses_instance_rng(
+        self, scheduler: Scheduler, presence: PresenceTracker, database: EconomyDatabase
+    ):
+        """A seeded Scheduler RNG fixes the rain amount; module-level random has no say."""
+        await presence.handle_user_join("Alice", "testchannel")
+        rain_cfg = scheduler._config.rain
+        expected = random.Random(1234).randint(rain_cfg.min_amount, rain_cfg.max_amount)
+
+        scheduler._rng.seed(1234)
+        with patch("random.randint", side_effect=AssertionError("module RNG used")):
+            await scheduler._rain_channel("testchannel")
+
+        # Welcome wallet (100) + the seeded drop
+        assert await database.get_balance("Alice", "testchannel") == 100 + expected
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "☔ Rain drop! You received {amount} {currency} just for being here.",
+            "{currency}: +{amount}",
+            "+{amount:,} {currency}",  # format spec → full format fallback
+            "{{literal}} {amount} {currency}",
+        ],
+    )
+    async def test_rain_message_matches_format(self, scheduler: Scheduler, template: str):
+        """The pre-split rain message renders exactly like str.format."""
+        scheduler._config.rain.message = template
+        currency = scheduler._config.currency.name
+        for amount in (1, 25, 12345):
+            assert scheduler._rain_message(amount) == template.format(
+                amount=amount, currency=currency
+            )
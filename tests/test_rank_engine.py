@@ -9,7 +9,7 @@ import pytest
 
 from kryten_economy.config import EconomyConfig
 from kryten_economy.database import EconomyDatabase
-from kryten_economy.rank_engine import RankEngine
+from kryten_economy.rank_engine import AnnounceThrottle, RankEngine
 
 CH = "testchannel"
 
@@ -33,10 +33,10 @@ def _make_engine(
 
 @pytest.mark.asyncio
 async def test_initial_rank(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """0 lifetime → 'Extra'."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     idx, tier = engine.get_rank_for_lifetime(0)
     assert idx == 0
     assert tier.name == "Extra"
@@ -44,21 +44,36 @@ async def test_initial_rank(
 
 @pytest.mark.asyncio
 async def test_rank_at_threshold(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Exactly 1000 → 'Grip'."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     idx, tier = engine.get_rank_for_lifetime(1000)
     assert tier.name == "Grip"
     assert idx == 1
 
 
+@pytest.mark.asyncio
+async def test_rank_lookup_matches_linear_scan(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """Bisect lookup agrees with a linear scan just below, at and above every threshold."""
+    engine = _make_engine(shared_config, database, mock_client)
+    for threshold in engine._thresholds:
+        for lifetime in (threshold - 1, threshold, threshold + 1):
+            expected = 0
+            for i, tier in enumerate(engine._tiers):
+                if lifetime >= tier.min_lifetime_earned:
+                    expected = i
+            assert engine.get_rank_for_lifetime(lifetime)[0] == expected
+
+
 @pytest.mark.asyncio
 async def test_rank_promotion(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Lifetime crosses threshold → promote, PM, announce."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     await _seed_account(database, "Alice")
     # Credit 1500 so lifetime_earned = 1500 → "Grip" (>= 1000)
     await database.credit("Alice", CH, 1500, tx_type="earn", reason="test")
@@ -75,12 +90,47 @@ async def test_rank_promotion(
     mock_client.send_pm.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_rank_up_pm_uses_prerendered_text(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """Rank-up PM is the per-tier text rendered when tiers are loaded."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice")
+    await database.credit("Alice", CH, 1500, tx_type="earn", reason="test")
+
+    await engine.check_rank_promotion("Alice", CH)
+
+    _, grip = engine.get_rank_for_lifetime(1500)
+    text = mock_client.send_pm.call_args[0][2]
+    assert text == engine._pm_text_by_tier["Grip"]
+    assert "**Grip**" in text
+    assert (", ".join(grip.perks) if grip.perks else "No additional perks") in text
+
+
+@pytest.mark.asyncio
+async def test_rank_promotion_quiet_user_no_pm(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """Quiet users are promoted without a PM and without a separate quiet lookup."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice")
+    await database.credit("Alice", CH, 1500, tx_type="earn", reason="test")
+    await database.set_quiet_mode("Alice", CH, True)
+    database.get_quiet_mode = AsyncMock(side_effect=AssertionError("unexpected lookup"))
+
+    new_tier = await engine.check_rank_promotion("Alice", CH)
+
+    assert new_tier is not None and new_tier.name == "Grip"
+    mock_client.send_pm.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_no_promotion_same_rank(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Already at correct rank → no action."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     await _seed_account(database, "Alice")
     # Credit to get Grip rank
     await database.credit("Alice", CH, 1500, tx_type="earn", reason="test")
@@ -94,12 +144,86 @@ async def test_no_promotion_same_rank(
     mock_client.send_pm.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_maybe_check_skips_until_next_threshold(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """After a DB check, lifetimes below the next tier need no further check."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice")
+    await database.credit("Alice", CH, 1500, tx_type="earn", reason="test")
+
+    # Unknown user: always check
+    assert engine.maybe_check("Alice", CH, 1500) is True
+    await engine.check_rank_promotion("Alice", CH)
+
+    idx, _ = engine.get_rank_for_lifetime(1500)
+    next_threshold = engine.get_next_tier(idx).min_lifetime_earned
+    assert engine.maybe_check("Alice", CH, next_threshold - 1) is False
+    assert engine.maybe_check("Alice", CH, next_threshold) is True
+
+    # Reloading tiers drops cached thresholds
+    engine.update_config(shared_config)
+    assert engine.maybe_check("Alice", CH, 1500) is True
+
+
+@pytest.mark.asyncio
+async def test_invalidate_after_external_rank_write(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """An out-of-band rank write plus invalidate() brings back the DB re-sync."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", 1500)
+    promoted = await engine.check_rank_promotion("Alice", CH)
+    assert promoted is not None
+    assert engine.maybe_check("Alice", CH, 1500) is False
+
+    # Admin override demotes the user behind the engine's back
+    await database.update_account_rank("Alice", CH, engine._tiers[0].name)
+    engine.invalidate("Alice", CH)
+
+    assert engine.maybe_check("Alice", CH, 1500) is True
+    assert await engine.check_rank_promotion("Alice", CH) == promoted
+    assert (await database.get_account("Alice", CH))["rank_name"] == promoted.name
+
+
+@pytest.mark.asyncio
+async def test_max_tier_user_skips_db(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """Once a user is known to be capped, the tick pre-filter skips the DB."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", engine._tiers[-1].min_lifetime_earned)
+
+    promoted = await engine.check_rank_promotion("Alice", CH)
+    assert promoted is not None and promoted.name == engine._tiers[-1].name
+
+    database.get_account = AsyncMock(side_effect=AssertionError("unexpected DB read"))
+    assert engine.maybe_check("Alice", CH, 10**12) is False
+
+
+@pytest.mark.asyncio
+async def test_max_tier_user_rechecked_after_demotion(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """A direct check still reads the stored rank, so a demoted top-tier user is restored."""
+    engine = _make_engine(shared_config, database, mock_client)
+    top = engine._tiers[-1]
+    await _seed_account(database, "Alice", top.min_lifetime_earned)
+    await engine.check_rank_promotion("Alice", CH)
+
+    await database.update_account_rank("Alice", CH, engine._tiers[0].name)
+
+    assert await engine.check_rank_promotion("Alice", CH) == top
+    assert (await database.get_account("Alice", CH))["rank_name"] == top.name
+
+
 @pytest.mark.asyncio
 async def test_max_rank(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """'Studio Mogul' → no next tier."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     # Studio Mogul is the last tier index
     idx, tier = engine.get_rank_for_lifetime(5_000_000)
     assert tier.name == "Studio Mogul"
@@ -110,10 +234,10 @@ async def test_max_rank(
 
 @pytest.mark.asyncio
 async def test_cytube_auto_promotion(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Reaching tier with cytube_level_promotion → calls safe_set_channel_rank()."""
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     await _seed_account(database, "Alice")
     # Studio Mogul (5M) has cytube_level_promotion=2
     await database.credit("Alice", CH, 5_000_000, tx_type="earn", reason="test")
@@ -125,13 +249,13 @@ async def test_cytube_auto_promotion(
 
 @pytest.mark.asyncio
 async def test_cytube_promotion_failure_logged(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Rank change fails → logged, no crash."""
     mock_client.safe_set_channel_rank = AsyncMock(
         return_value={"success": False, "error": "test fail"}
     )
-    engine = _make_engine(sample_config, database, mock_client)
+    engine = _make_engine(shared_config, database, mock_client)
     await _seed_account(database, "Alice")
     await database.credit("Alice", CH, 5_000_000, tx_type="earn", reason="test")
 
@@ -143,13 +267,13 @@ async def test_cytube_promotion_failure_logged(
 
 @pytest.mark.asyncio
 async def test_rank_discount_calculation(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Tier 5 discount = 5 × 0.02 = 0.10 (10%)."""
     from kryten_economy.spending_engine import SpendingEngine
 
     spending = SpendingEngine(
-        sample_config,
+        shared_config,
         database,
         MagicMock(),
         logging.getLogger("test"),
@@ -160,11 +284,11 @@ async def test_rank_discount_calculation(
 
 @pytest.mark.asyncio
 async def test_rank_perks_parsed(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Extra queue slots parsed from perk strings."""
     # Best Boy (index 4) has "+1 queue/day"
-    tiers = sample_config.ranks.tiers
+    tiers = shared_config.ranks.tiers
     best_boy = tiers[4]
     assert best_boy.name == "Best Boy"
     has_queue_perk = any("queue" in p.lower() for p in best_boy.perks)
@@ -173,12 +297,129 @@ async def test_rank_perks_parsed(
 
 @pytest.mark.asyncio
 async def test_rain_multiplier_parsed(
-    sample_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
 ):
     """Rain bonus parsed from perk strings."""
     # Gaffer (index 3) has "rain drops +20%"
-    tiers = sample_config.ranks.tiers
+    tiers = shared_config.ranks.tiers
     gaffer = tiers[3]
     assert gaffer.name == "Gaffer"
     has_rain_perk = any("rain" in p.lower() for p in gaffer.perks)
     assert has_rain_perk
+
+
+# ═══════════════════════════════════════════════════════════════
+#  Public Rank-Up Announcements
+# ═══════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_flush_announces_single_promotion(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """One buffered promotion → one templated chat message."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", 1500)
+    await engine.check_rank_promotion("Alice", CH)
+
+    await engine.flush_pending_announcements()
+    mock_client.send_chat.assert_called_once()
+    assert mock_client.send_chat.call_args[0][1] == "⭐ Alice is now a Grip!"
+
+
+@pytest.mark.asyncio
+async def test_flush_throttles_same_tier_within_hour(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """A second same-tier promotion inside the hour is not announced."""
+    engine = _make_engine(shared_config, database, mock_client)
+    for name in ("Alice", "Bob"):
+        await _seed_account(database, name, 1500)
+
+    await engine.check_rank_promotion("Alice", CH)
+    await engine.flush_pending_announcements()
+    await engine.check_rank_promotion("Bob", CH)
+    await engine.flush_pending_announcements()
+    assert mock_client.send_chat.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_higher_tier_bypasses_throttle(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """A new daily-high tier is announced even inside the cooldown."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", 1500)
+    await _seed_account(database, "Bob", shared_config.ranks.tiers[3].min_lifetime_earned)
+
+    await engine.check_rank_promotion("Alice", CH)
+    await engine.flush_pending_announcements()
+    await engine.check_rank_promotion("Bob", CH)
+    await engine.flush_pending_announcements()
+    assert mock_client.send_chat.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_batches_and_dedupes_per_channel(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """Promotions buffered together become one message grouped by rank."""
+    engine = _make_engine(shared_config, database, mock_client)
+    grip = engine.get_rank_for_lifetime(1500)[1]
+    top = engine._tiers[-1]
+
+    await engine._notify_rank_promotion("Bob", CH, grip, quiet=True)
+    await engine._notify_rank_promotion("Alice", CH, grip, quiet=True)
+    await engine._notify_rank_promotion("Alice", CH, grip, quiet=True)  # duplicate
+    await engine._notify_rank_promotion("Carol", CH, top, quiet=True)
+    assert engine._pending == {CH: {grip.name: {"Alice", "Bob"}, top.name: {"Carol"}}}
+
+    await engine.flush_pending_announcements()
+    mock_client.send_chat.assert_called_once()
+    msg = mock_client.send_chat.call_args[0][1]
+    assert f"Alice, Bob \u2192 {grip.name}" in msg
+    assert f"Carol \u2192 {top.name}" in msg
+    assert engine._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_tracker_resets_on_new_day(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """A tracker from a previous UTC day does not throttle today's first announcement."""
+    from datetime import UTC, datetime
+
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", 1500)
+    now = datetime.now(UTC)
+    engine._announce_tracker[CH] = AnnounceThrottle(
+        now, len(engine._tiers) - 1, now.toordinal() - 1
+    )
+
+    await engine.check_rank_promotion("Alice", CH)
+    await engine.flush_pending_announcements()
+
+    mock_client.send_chat.assert_called_once()
+    assert engine._announce_tracker[CH].day == now.toordinal()
+
+
+@pytest.mark.asyncio
+async def test_flush_updates_tracker_in_place(
+    shared_config: EconomyConfig, database: EconomyDatabase, mock_client: MagicMock
+):
+    """An announcement refreshes the existing tracker rather than replacing it."""
+    engine = _make_engine(shared_config, database, mock_client)
+    await _seed_account(database, "Alice", 1500)
+    await _seed_account(database, "Bob", shared_config.ranks.tiers[3].min_lifetime_earned)
+
+    await engine.check_rank_promotion("Alice", CH)
+    await engine.flush_pending_announcements()
+    tracker = engine._announce_tracker[CH]
+    first_time = tracker.last_time
+
+    await engine.check_rank_promotion("Bob", CH)
+    await engine.flush_pending_announcements()
+
+    assert engine._announce_tracker[CH] is tracker
+    assert tracker.best_today == engine._tier_index_by_name[shared_config.ranks.tiers[3].name]
+    assert tracker.last_time >= first_time
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
@@ -167,6 +168,50 @@ async def test_presence_bonus_distributed(database: EconomyDatabase, mock_client
         assert acc["balance"] == 100
 
 
+@pytest.mark.asyncio
+async def test_presence_bonus_pms_sent_one_at_a_time(
+    database: EconomyDatabase, mock_client: MagicMock
+):
+    """Without an outbox, presence-bonus PMs go out sequentially, not all at once."""
+    cfg = _make_config_with_events(
+        [
+            {
+                "name": "Bonus Event",
+                "cron": "* * * * *",
+                "duration_hours": 2,
+                "multiplier": 1.5,
+                "presence_bonus": 500,
+                "announce": False,
+            }
+        ]
+    )
+    mult_engine, mock_presence = _make_deps(cfg, database, mock_client)
+    mock_presence.get_connected_users.return_value = {"Alice", "Bob", "Charlie"}
+    in_flight = peak = 0
+
+    async def send_pm(channel: str, username: str, msg: str) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    mock_client.send_pm.side_effect = send_pm
+    manager = ScheduledEventManager(
+        cfg,
+        mult_engine,
+        mock_presence,
+        database,
+        mock_client,
+        logging.getLogger("test"),
+    )
+
+    await manager._distribute_presence_bonus(cfg.multipliers.scheduled_events[0], CH)
+
+    assert mock_client.send_pm.await_count == 3
+    assert peak == 1
+
+
 @pytest.mark.asyncio
 async def test_presence_bonus_zero_users(database: EconomyDatabase, mock_client: MagicMock):
     """No users → no error."""
@@ -314,3 +359,115 @@ async def test_no_refire_same_cycle(database: EconomyDatabase, mock_client: Magi
 
     # The event is still in _active (wasn't re-started)
     assert f"{CH}:{event_cfg.name}" in manager._active
+
+
+@pytest.mark.asyncio
+async def test_fire_heap_seeded_per_event_and_channel(
+    database: EconomyDatabase, mock_client: MagicMock
+):
+    """One heap entry per (event, channel), ordered by next fire time."""
+    cfg = _make_config_with_events(
+        [
+            {"name": "Hourly", "cron": "0 * * * *", "duration_hours": 1, "multiplier": 1.5},
+            {"name": "Daily", "cron": "0 20 * * *", "duration_hours": 2, "multiplier": 2.0},
+        ]
+    )
+    mult_engine, mock_presence = _make_deps(cfg, database, mock_client)
+    manager = ScheduledEventManager(
+        cfg, mult_engine, mock_presence, database, mock_client, logging.getLogger("test")
+    )
+    manager._channels = [CH, "otherchannel"]
+
+    now = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+    manager._seed_fire_heap(now)
+
+    assert len(manager._fire_heap) == 4
+    assert manager._fire_heap[0][0] == datetime(2025, 6, 1, 13, 0, tzinfo=timezone.utc).timestamp()
+    assert manager._next_wakeup() == manager._fire_heap[0][0]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_due_starts_and_ends(database: EconomyDatabase, mock_client: MagicMock):
+    """Due fire entries start the event; the end heap clears it after its duration."""
+    cfg = _make_config_with_events(
+        [
+            {
+                "name": "Heap Event",
+                "cron": "0 * * * *",
+                "duration_hours": 1,
+                "multiplier": 2.0,
+                "presence_bonus": 0,
+                "announce": False,
+            }
+        ]
+    )
+    mult_engine, mock_presence = _make_deps(cfg, database, mock_client)
+    manager = ScheduledEventManager(
+        cfg, mult_engine, mock_presence, database, mock_client, logging.getLogger("test")
+    )
+    manager._channels = [CH]
+    key = f"{CH}:Heap Event"
+
+    fire = datetime(2025, 6, 1, 13, 0, tzinfo=timezone.utc)
+    manager._seed_fire_heap(fire - timedelta(minutes=30))
+
+    # Nothing due before the fire time
+    await manager._dispatch_due(fire - timedelta(minutes=1))
+    assert key not in manager._active
+
+    await manager._dispatch_due(fire + timedelta(seconds=5))
+    assert key in manager._active
+    assert manager._active[key]["end_time"] == fire + timedelta(hours=1)
+    # Next occurrence re-queued, end time queued
+    assert manager._fire_heap[0][0] == (fire + timedelta(hours=1)).timestamp()
+    assert len(manager._end_heap) == 1
+
+    await manager._dispatch_due(fire + timedelta(hours=1, seconds=1))
+    # Ended, then restarted by the next hourly fire in the same dispatch
+    assert manager._active[key]["end_time"] == fire + timedelta(hours=2)
+    assert manager._end_heap == [((fire + timedelta(hours=2)).timestamp(), CH, "Heap Event")]
+
+
+@pytest.mark.asyncio
+async def test_cron_iterator_reused(database: EconomyDatabase, mock_client: MagicMock):
+    """Repeated next-fire lookups reuse one parsed croniter per expression."""
+    cfg = _make_config_with_events([])
+    mult_engine, mock_presence = _make_deps(cfg, database, mock_client)
+    manager = ScheduledEventManager(
+        cfg, mult_engine, mock_presence, database, mock_client, logging.getLogger("test")
+    )
+
+    first = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+    assert manager._next_fire("0 * * * *", first, datetime) == first.replace(hour=13, minute=0)
+    it = manager._cron_cache["0 * * * *"]
+
+    # Rewinding to an earlier time must not be confused by the previous position
+    earlier = datetime(2025, 6, 1, 8, 15, tzinfo=timezone.utc)
+    assert manager._next_fire("0 * * * *", earlier, datetime) == earlier.replace(hour=9, minute=0)
+    assert manager._cron_cache["0 * * * *"] is it
+
+
+@pytest.mark.asyncio
+async def test_end_heap_pops_only_expired(database: EconomyDatabase, mock_client: MagicMock):
+    """Only events whose end time has passed are popped; later ones stay queued."""
+    cfg = _make_config_with_events(
+        [
+            {"name": "Short", "cron": "0 0 1 1 *", "duration_hours": 1, "announce": False},
+            {"name": "Long", "cron": "0 0 1 1 *", "duration_hours": 3, "announce": False},
+        ]
+    )
+    mult_engine, mock_presence = _make_deps(cfg, database, mock_client)
+    manager = ScheduledEventManager(
+        cfg, mult_engine, mock_presence, database, mock_client, logging.getLogger("test")
+    )
+    short_cfg, long_cfg = cfg.multipliers.scheduled_events
+    start = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    await manager._start_event(short_cfg, CH, f"{CH}:Short", start)
+    await manager._start_event(long_cfg, "otherchannel", "otherchannel:Long", start)
+    assert len(manager._end_heap) == 2
+
+    await manager._dispatch_due(start + timedelta(hours=2))
+
+    assert f"{CH}:Short" not in manager._active
+    assert "otherchannel:Long" in manager._active
+    assert manager._end_heap == [((start + timedelta(hours=3)).timestamp(), "otherchannel", "Long")]
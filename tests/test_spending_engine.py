@@ -6,7 +6,12 @@ from __future__ import annotations
 import pytest
 
 from kryten_economy.database import EconomyDatabase
-from kryten_economy.spending_engine import SpendResult, SpendingEngine
+from kryten_economy.spending_engine import (
+    OUTCOME_BANNED,
+    OUTCOME_NO_ACCOUNT,
+    SpendResult,
+    SpendingEngine,
+)
 
 CH = "testchannel"
 
@@ -85,6 +90,16 @@ async def test_apply_discount_minimum_one(spending_engine: SpendingEngine):
     assert final >= 1
 
 
+@pytest.mark.asyncio
+async def test_apply_discount_table_matches_formula(spending_engine: SpendingEngine):
+    """Precomputed factors give the same result as the direct formula, in and out of range."""
+    per_rank = spending_engine._config.ranks.spend_discount_per_rank
+    for idx in range(len(spending_engine._config.ranks.tiers) + 3):
+        for base in (1, 99, 2500, 123457):
+            expected = max(1, int(base * (1 - per_rank * idx)))
+            assert spending_engine.apply_discount(base, idx) == (expected, per_rank * idx)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  Price Tiers
 # ═══════════════════════════════════════════════════════════════
@@ -119,6 +134,45 @@ async def test_price_tier_movie(spending_engine: SpendingEngine):
     assert cost == 10000
 
 
+@pytest.mark.asyncio
+async def test_price_tier_boundaries_match_linear_scan(spending_engine: SpendingEngine):
+    """Bisect lookup agrees with a first-fit scan at and around every boundary."""
+    tiers = spending_engine._config.spending.queue_tiers
+
+    def linear(duration_seconds: int) -> tuple[str, int]:
+        for tier in tiers:
+            if duration_seconds / 60 <= tier.max_minutes:
+                return tier.label, tier.cost
+        return tiers[-1].label, tiers[-1].cost
+
+    for tier in tiers:
+        for seconds in (
+            tier.max_minutes * 60 - 1,
+            tier.max_minutes * 60,
+            tier.max_minutes * 60 + 1,
+        ):
+            assert spending_engine.get_price_tier(seconds) == linear(seconds)
+    assert spending_engine.get_price_tier(0) == linear(0)
+
+
+@pytest.mark.asyncio
+async def test_price_tier_linear_and_bisect_agree(spending_engine: SpendingEngine):
+    """Small tier lists use the scan, large ones bisect; both give the same answers."""
+    from kryten_economy.config import QueueTierConfig
+
+    assert spending_engine._get_price_tier == spending_engine._get_price_tier_linear
+
+    many = [QueueTierConfig(max_minutes=m, label=f"T{m}", cost=m * 10) for m in range(5, 100, 5)]
+    spending_engine._set_queue_tiers(many)
+    assert spending_engine._get_price_tier == spending_engine._get_price_tier_bisect
+
+    for seconds in range(0, 7000, 37):
+        assert spending_engine._get_price_tier_linear(
+            seconds
+        ) == spending_engine._get_price_tier_bisect(seconds)
+    assert spending_engine.get_price_tier(10**6) == ("T95", 950)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  validate_spend
 # ═══════════════════════════════════════════════════════════════
@@ -133,6 +187,7 @@ async def test_validate_spend_no_account(
     outcome = await spending_engine.validate_spend("Nobody", CH, 100, "queue")
     assert outcome is not None
     assert outcome.result == SpendResult.INSUFFICIENT_FUNDS
+    assert outcome is OUTCOME_NO_ACCOUNT
 
 
 @pytest.mark.asyncio
@@ -162,6 +217,7 @@ async def test_validate_spend_banned(
     outcome = await spending_engine.validate_spend("Banned", CH, 100, "queue")
     assert outcome is not None
     assert outcome.result == SpendResult.PERMISSION_DENIED
+    assert outcome is OUTCOME_BANNED
 
 
 @pytest.mark.asyncio
@@ -174,6 +230,8 @@ async def test_validate_spend_low_balance(
     outcome = await spending_engine.validate_spend("Poor", CH, 50000, "queue")
     assert outcome is not None
     assert outcome.result == SpendResult.INSUFFICIENT_FUNDS
+    assert outcome.message == "Insufficient funds. You have 100 Z but need 50,000 Z."
+    assert not hasattr(outcome, "__dict__")  # slots=True
 
 
 @pytest.mark.asyncio
@@ -212,3 +270,26 @@ async def test_rank_tier_index_mid(
     await _seed_account(database, "Mid", 100, 100000)
     account = await database.get_account("Mid", CH)
     assert spending_engine.get_rank_tier_index(account) == 5
+
+
+@pytest.mark.asyncio
+async def test_rank_tier_index_matches_linear_scan(spending_engine: SpendingEngine):
+    """Bisect agrees with the highest-qualifying-tier scan around every threshold."""
+    tiers = spending_engine._config.ranks.tiers
+
+    def linear(lifetime: int) -> int:
+        idx = 0
+        for i, tier in enumerate(tiers):
+            if lifetime >= tier.min_lifetime_earned:
+                idx = i
+        return idx
+
+    for tier in tiers:
+        for lifetime in (
+            tier.min_lifetime_earned - 1,
+            tier.min_lifetime_earned,
+            tier.min_lifetime_earned + 1,
+        ):
+            account = {"lifetime_earned": lifetime}
+            assert spending_engine.get_rank_tier_index(account) == linear(lifetime)
+    assert spending_engine.get_rank_tier_index({}) == 0
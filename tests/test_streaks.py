@@ -133,3 +133,12 @@ class TestGetDailyMinutesPresent:
         await database.increment_daily_minutes_present("alice", "testchannel", "2026-01-02", 15)
         assert await database.get_daily_minutes_present("alice", "testchannel", "2026-01-01") == 30
         assert await database.get_daily_minutes_present("alice", "testchannel", "2026-01-02") == 15
+
+    async def test_roll_date_caches_derived_strings(self, tracker: PresenceTracker):
+        """Yesterday and ISO week should be derived once per calendar day."""
+        tracker._roll_date("2026-03-01")
+        assert tracker._yesterday_str == "2026-02-28"
+        assert tracker._today_iso_week == "2026-W09"
+        tracker._roll_date("2026-01-01")
+        assert tracker._yesterday_str == "2025-12-31"
+        assert tracker._today_iso_week == "2026-W01"
@@ -51,14 +51,6 @@ async def _seed_account(db: EconomyDatabase, username: str, balance: int = 5000)
     await loop.run_in_executor(None, _update)
 
 
-@pytest_asyncio.fixture
-async def database(tmp_path) -> EconomyDatabase:
-    db_path = str(tmp_path / "test_trivia.db")
-    db = EconomyDatabase(db_path, logging.getLogger("test"))
-    await db.initialize()
-    return db
-
-
 @pytest_asyncio.fixture
 async def trivia_engine(database: EconomyDatabase) -> TriviaEngine:
     cfg_dict = make_config_dict()
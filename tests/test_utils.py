@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from kryten_economy.utils import (
     iso_week_str,
@@ -20,6 +21,12 @@ class TestNormalizeChannel:
     def test_spaces(self):
         assert normalize_channel("My Channel") == "my_channel"
 
+    def test_cached(self):
+        normalize_channel.cache_clear()
+        first = normalize_channel("Cached Channel")
+        assert normalize_channel("Cached Channel") is first
+        assert normalize_channel.cache_info().hits == 1
+
 
 class TestParseTimestamp:
     def test_iso_format(self):
@@ -33,6 +40,26 @@ class TestParseTimestamp:
         assert dt is not None
         assert dt.tzinfo is not None
 
+    def test_sqlite_layout_matches_fromisoformat(self):
+        for ts in (
+            "2026-01-15 10:30:00",
+            "2026-01-15T23:59:59",
+            "2026-01-15 10:30:00.5",
+            "2026-01-15 10:30:00.123456",
+            "2026-01-15 10:30:00.1234567",
+        ):
+            expected = datetime.fromisoformat(ts).replace(tzinfo=timezone.utc)
+            assert parse_timestamp(ts) == expected
+
+    def test_offset_not_taken_as_utc(self):
+        dt = parse_timestamp("2026-01-15T10:30:00+02:00")
+        assert dt is not None
+        assert dt.hour == 10
+        assert dt.utcoffset().total_seconds() == 7200
+
+    def test_out_of_range_fields(self):
+        assert parse_timestamp("2026-13-45 10:30:00") is None
+
     def test_none(self):
         assert parse_timestamp(None) is None
 
@@ -49,6 +76,15 @@ class TestTodayStr:
         assert len(result) == 10
         assert result[4] == "-"
 
+    def test_cached_within_day_and_rolls_over(self):
+        day_start = 20_000 * 86400  # 2024-10-04 00:00 UTC
+        with patch("kryten_economy.utils.time.time", return_value=day_start + 10):
+            assert today_str() == "2024-10-04"
+        with patch("kryten_economy.utils.time.time", return_value=day_start + 86000):
+            assert today_str() == "2024-10-04"
+        with patch("kryten_economy.utils.time.time", return_value=day_start + 86400):
+            assert today_str() == "2024-10-05"
+
 
 class TestNowUtc:
     def test_timezone_aware(self):
@@ -65,3 +101,23 @@ class TestIsoWeekStr:
     def test_default_now(self):
         result = iso_week_str()
         assert "-W" in result
+        assert result == datetime.now(timezone.utc).strftime("%G-W%V")
+
+    def test_default_follows_patched_clock(self):
+        sunday = 20_002 * 86400  # 2024-10-06, last day of ISO week 40
+        with patch("kryten_economy.utils.time.time", return_value=sunday + 10):
+            assert iso_week_str() == "2024-W40"
+        with patch("kryten_economy.utils.time.time", return_value=sunday + 86400):
+            assert iso_week_str() == "2024-W41"
+
+    def test_explicit_dt_not_cached(self):
+        iso_week_str()
+        assert iso_week_str(datetime(2020, 12, 31, tzinfo=timezone.utc)) == "2020-W53"
+
+    def test_matches_strftime_across_year_boundaries(self):
+        for dt in (
+            datetime(2021, 1, 3, tzinfo=timezone.utc),  # ISO week of previous year
+            datetime(2024, 12, 30, tzinfo=timezone.utc),  # ISO week of next year
+            datetime(2026, 3, 2, tzinfo=timezone.utc),
+        ):
+            assert iso_week_str(dt) == dt.strftime("%G-W%V")